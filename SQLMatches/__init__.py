@@ -5,11 +5,11 @@ from bcrypt import gensalt, hashpw
 from secrets import token_urlsafe
 from colorama import init, Fore
 from os import get_terminal_size
-from databases import Database
 
 from .resources import Config, Session
 from .http import APP
 from .tables import create_tables
+from .helpers.database import InstrumentedDatabase
 
 from .env import DATABASE_SETTINGS, FRONTEND_URL
 
@@ -24,14 +24,29 @@ __all__ = [
 
 class SQLMatches:
     def __init__(self) -> None:
-        Session.db = Database(DATABASE_SETTINGS._url)
+        Session.db = InstrumentedDatabase(
+            DATABASE_SETTINGS._url,
+            DATABASE_SETTINGS._acquire_timeout,
+            **DATABASE_SETTINGS._options
+        )
+
+        if DATABASE_SETTINGS._replica_url:
+            Session.replica = InstrumentedDatabase(
+                DATABASE_SETTINGS._replica_url,
+                DATABASE_SETTINGS._acquire_timeout,
+                **DATABASE_SETTINGS._pool_options(
+                    DATABASE_SETTINGS._replica_url
+                )
+            )
+        else:
+            Session.replica = Session.db
 
         self.__root_generate_pass = token_urlsafe(44)
         Config.root_generate_hash = hashpw(
             self.__root_generate_pass.encode(), gensalt()
         )
 
-        create_tables(DATABASE_SETTINGS._url)
+        self.migrated = create_tables(DATABASE_SETTINGS._url)
 
     @property
     def root_password(self) -> str:
@@ -86,6 +101,10 @@ _\ \/ \_/ / /___/ /\/\ \ (_| | || (__| | | |  __/\__ \
         print((Fore.YELLOW + "Simply restart the web server to invalidate the"
                " current link & to generate a new one."), Fore.RESET)
 
+        if self.migrated:
+            print(Fore.YELLOW + "Migrations created:", Fore.RESET,
+                  ", ".join(self.migrated))
+
         print_line()
 
         try:
@@ -1,7 +1,11 @@
 import os
 from dotenv import load_dotenv
 
-from .settings import DatabaseSettings, DemoSettings, SteamSettings
+from .settings import (
+    DatabaseSettings, DemoSettings, SteamSettings, CacheSettings,
+    HashingSettings, LiveSettings, StorageSettings, RetentionSettings,
+    LeaderboardSettings, MediaSettings, MetricsSettings
+)
 
 
 load_dotenv()
@@ -13,19 +17,99 @@ DATABASE_SETTINGS = DatabaseSettings(
     os.environ["DB_NAME"],
     os.getenv("DB_SERVER", "localhost"),
     int(os.getenv("DB_PORT", 3306)),
-    os.getenv("DB_ENGINE", "mysql")
+    os.getenv("DB_ENGINE", "mysql"),
+    int(os.getenv("DB_MIN_SIZE", 1)),
+    int(os.getenv("DB_MAX_SIZE", 10)),
+    int(os.getenv("DB_POOL_RECYCLE", 3600)),
+    float(os.getenv("DB_CONNECT_TIMEOUT", 10)),
+    float(os.getenv("DB_COMMAND_TIMEOUT", 0)),
+    int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100)),
+    float(os.getenv("DB_ACQUIRE_TIMEOUT", 0)),
+    os.getenv("DB_REPLICA_URL"),
+    float(os.getenv("DB_REPLICA_WINDOW", 5))
 )
 
 
 DEMO_SETTINGS = DemoSettings(
     os.getenv("DEMO_PATHWAY"),
-    os.getenv("DEMO_EXT", ".dem.bz2")
+    os.getenv("DEMO_EXT", ".dem.bz2"),
+    int(os.getenv("DEMO_CHUNK_SIZE", 1024 * 1024)),
+    int(os.getenv("DEMO_MAX_SIZE", 1024 * 1024 * 1024)),
+    os.getenv("DEMO_COMPRESSION"),
+    int(os.getenv("DEMO_COMPRESSION_WORKERS", os.cpu_count() or 1)),
+    int(os.getenv("DEMO_UPLOAD_CHUNK_SIZE", 64 * 1024 * 1024)),
+    int(os.getenv("DEMO_LOG_BATCH", 100)),
+    float(os.getenv("DEMO_LOG_INTERVAL", 1))
+)
+
+
+STORAGE_SETTINGS = StorageSettings(
+    os.getenv("DEMO_STORAGE", "local"),
+    os.getenv("DEMO_S3_ENDPOINT"),
+    os.getenv("DEMO_S3_BUCKET"),
+    os.getenv("DEMO_S3_REGION", "us-east-1"),
+    os.getenv("DEMO_S3_ACCESS_KEY"),
+    os.getenv("DEMO_S3_SECRET_KEY"),
+    int(os.getenv("DEMO_S3_PART_SIZE", 8 * 1024 * 1024))
+)
+
+
+RETENTION_SETTINGS = RetentionSettings(
+    float(os.getenv("DEMO_RETENTION_INTERVAL", 3600)),
+    float(os.getenv("DEMO_MAX_AGE", 0)),
+    int(os.getenv("DEMO_MAX_TOTAL_SIZE", 0)),
+    int(os.getenv("DEMO_KEEP_DOWNLOADED", 0)),
+    int(os.getenv("DEMO_RETENTION_BATCH", 100)),
+    float(os.getenv("DEMO_UPLOAD_MAX_AGE", 86400))
 )
 
 
 STEAM_SETTINGS = SteamSettings(
     os.environ["STEAM_API_KEY"],
-    os.getenv("STEAM_API_URL", "https://api.steampowered.com/")
+    os.getenv("STEAM_API_URL", "https://api.steampowered.com/"),
+    float(os.getenv("STEAM_BATCH_WINDOW", 0.01))
+)
+
+
+CACHE_SETTINGS = CacheSettings(
+    float(os.getenv("API_KEY_CACHE_TTL", 60)),
+    int(os.getenv("API_KEY_CACHE_SIZE", 1024)),
+    float(os.getenv("STEAM_PROFILE_CACHE_TTL", 3600)),
+    float(os.getenv("STEAM_PROFILE_CACHE_STALE", 86400)),
+    int(os.getenv("STEAM_PROFILE_CACHE_SIZE", 10000)),
+    float(os.getenv("SCOREBOARD_CACHE_TTL", 30)),
+    int(os.getenv("SCOREBOARD_CACHE_SIZE", 1024)),
+    os.getenv("SCOREBOARD_CACHE_URL"),
+    float(os.getenv("DEMO_CACHE_TTL", 5))
+)
+
+
+HASHING_SETTINGS = HashingSettings(
+    int(os.getenv("HASHING_WORKERS", 2)),
+    int(os.getenv("HASHING_MAX_QUEUE", 64)),
+    os.getenv("HASHING_EXECUTOR", "thread")
+)
+
+
+LIVE_SETTINGS = LiveSettings(
+    int(os.getenv("LIVE_QUEUE_SIZE", 32)),
+    float(os.getenv("LIVE_DEBOUNCE", 0.05)),
+    float(os.getenv("LIVE_REFRESH_INTERVAL", 5))
+)
+
+
+LEADERBOARD_SETTINGS = LeaderboardSettings(
+    float(os.getenv("LEADERBOARD_REBUILD_INTERVAL", 600))
+)
+
+
+MEDIA_SETTINGS = MediaSettings(
+    os.getenv("JSON_ENCODER")
+)
+
+
+METRICS_SETTINGS = MetricsSettings(
+    os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true")
 )
 
 
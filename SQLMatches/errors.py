@@ -6,8 +6,17 @@ class SQLMatchesErrorCodes(Enum):
 
     MATCH_NOT_FOUND = 2000
     MATCH_ID_TAKEN = 2001
+    INVALID_CURSOR = 2002
 
     DEMO_NOT_FOUND = 3000
+    DEMO_TOO_LARGE = 3001
+    DEMO_COMPRESSION_DISABLED = 3002
+    DEMO_UPLOAD_NOT_FOUND = 3003
+    DEMO_CHUNK_INVALID = 3004
+
+    PROFILE_NOT_FOUND = 4000
+
+    LEADERBOARD_NOT_FOUND = 5000
 
 
 class SQLMatchesError(Exception):
@@ -55,6 +64,13 @@ class MatchIdTaken(MatchError):
         super().__init__(msg, status_code, error_code, *args)
 
 
+class InvalidCursor(MatchError):
+    def __init__(self, msg: str = "Invalid cursor", status_code: int = 400,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.INVALID_CURSOR,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
+
+
 class DemoError(MatchError):
     pass
 
@@ -64,3 +80,57 @@ class DemoNotFound(DemoError):
                  error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.DEMO_NOT_FOUND,  # noqa: E501
                  *args: object) -> None:
         super().__init__(msg, status_code, error_code, *args)
+
+
+class DemoTooLarge(DemoError):
+    def __init__(self, msg: str = "Demo too large", status_code: int = 413,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.DEMO_TOO_LARGE,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
+
+
+class DemoCompressionDisabled(DemoError):
+    def __init__(self, msg: str = "Demo compression disabled",
+                 status_code: int = 400,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.DEMO_COMPRESSION_DISABLED,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
+
+
+class DemoUploadNotFound(DemoError):
+    def __init__(self, msg: str = "Demo upload not found",
+                 status_code: int = 404,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.DEMO_UPLOAD_NOT_FOUND,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
+
+
+class DemoChunkInvalid(DemoError):
+    def __init__(self, msg: str = "Demo chunk invalid",
+                 status_code: int = 400,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.DEMO_CHUNK_INVALID,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
+
+
+class ProfileError(SQLMatchesError):
+    pass
+
+
+class ProfileNotFound(ProfileError):
+    def __init__(self, msg: str = "Profile not found", status_code: int = 404,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.PROFILE_NOT_FOUND,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
+
+
+class LeaderboardError(SQLMatchesError):
+    pass
+
+
+class LeaderboardNotFound(LeaderboardError):
+    def __init__(self, msg: str = "Leaderboard not found",
+                 status_code: int = 404,
+                 error_code: SQLMatchesErrorCodes = SQLMatchesErrorCodes.LEADERBOARD_NOT_FOUND,  # noqa: E501
+                 *args: object) -> None:
+        super().__init__(msg, status_code, error_code, *args)
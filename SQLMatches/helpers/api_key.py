@@ -0,0 +1,148 @@
+import hmac
+
+from hashlib import sha256
+from secrets import token_bytes
+from typing import List, Optional
+from uuid import uuid4
+from sqlalchemy import select
+
+from ..resources import Session
+from ..tables import api_key_table
+from ..env import CACHE_SETTINGS
+
+from .cache import CacheBackend, RedisCacheBackend, TTLCache
+from .hashing import HASHING
+
+
+# Keyed by (SteamID64, digest of API key), value is the generation
+# of the user's API key when verified & scopes.
+API_KEY_CACHE = TTLCache(
+    CACHE_SETTINGS._api_key_ttl,
+    CACHE_SETTINGS._api_key_size
+)
+
+# Generation of each user's API key keyed by SteamID64, changed when
+# it's revoked or its scopes change. Shared so every worker sees it.
+API_KEY_GENERATIONS: Optional[CacheBackend] = RedisCacheBackend.from_url(
+    CACHE_SETTINGS._scoreboard_url, prefix="sqlmatches:api_key:"
+) if CACHE_SETTINGS._scoreboard_url else None
+
+# Random per process, so cached digests are useless outside of it.
+_DIGEST_SECRET = token_bytes(32)
+
+
+def _digest(api_key: str) -> bytes:
+    return hmac.new(_DIGEST_SECRET, api_key.encode(), sha256).digest()
+
+
+class ApiKey:
+    # Incremented by every invalidation in this process.
+    _invalidations = 0
+
+    def __init__(self, steam_id: str) -> None:
+        """Interact with the API key of a user.
+
+        Verified API keys are cached, revoking a key or changing its
+        scopes applies straight away in this process. Other workers
+        see it straight away if SCOREBOARD_CACHE_URL is set, otherwise
+        only once their cached entry expires after API_KEY_CACHE_TTL.
+
+        Parameters
+        ----------
+        steam_id : str
+            SteamID64
+        """
+
+        self.steam_id = steam_id
+
+    async def __generation(self) -> Optional[str]:
+        if API_KEY_GENERATIONS is None:
+            return None
+
+        return await API_KEY_GENERATIONS.get(self.steam_id)
+
+    async def __invalidate(self) -> None:
+        ApiKey._invalidations += 1
+        API_KEY_CACHE.pop_where(lambda key: key[0] == self.steam_id)
+
+        # Outlives every entry cached before it.
+        if (API_KEY_GENERATIONS is not None
+                and CACHE_SETTINGS._api_key_ttl > 0):
+            await API_KEY_GENERATIONS.set(
+                self.steam_id, uuid4().hex, CACHE_SETTINGS._api_key_ttl
+            )
+
+    async def validate(self, api_key: str) -> Optional[str]:
+        """Validate the API key, successful validations are cached.
+
+        Parameters
+        ----------
+        api_key : str
+
+        Returns
+        -------
+        str
+            Comma separated scopes, None if the key is invalid.
+
+        Raises
+        ------
+        HTTPServiceUnavailable
+            Too many pending hashes.
+        """
+
+        cache_key = (self.steam_id, _digest(api_key))
+
+        # Read before the API key, so a entry cached from a key
+        # read before being invalidated is never used.
+        generation = await self.__generation()
+        invalidations = ApiKey._invalidations
+
+        entry = API_KEY_CACHE.get(cache_key)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+
+        row = await Session.db.fetch_one(
+            select(
+                [api_key_table.c.scopes, api_key_table.c.api_key]
+            ).select_from(api_key_table).where(
+                api_key_table.c.steam_id == self.steam_id
+            )
+        )
+
+        if (not row or not row["scopes"] or
+                not await HASHING.checkpw(api_key, row["api_key"].encode())):
+            return None
+
+        # Not cached if invalidated while verifying.
+        if ApiKey._invalidations == invalidations:
+            API_KEY_CACHE.set(cache_key, (generation, row["scopes"]))
+
+        return row["scopes"]
+
+    async def update_scopes(self, scopes: List[str]) -> None:
+        """Update the scopes of the API key.
+
+        Parameters
+        ----------
+        scopes : List[str]
+        """
+
+        await Session.db.execute(
+            api_key_table.update().where(
+                api_key_table.c.steam_id == self.steam_id
+            ).values(scopes=",".join(scopes))
+        )
+
+        await self.__invalidate()
+
+    async def revoke(self) -> None:
+        """Revoke the API key.
+        """
+
+        await Session.db.execute(
+            api_key_table.delete().where(
+                api_key_table.c.steam_id == self.steam_id
+            )
+        )
+
+        await self.__invalidate()
@@ -21,10 +21,10 @@ def request_to_basic_auth(req: Request) -> Tuple[str, str]:
     HTTPUnauthorized
     """
 
-    if "AUTHORIZATION" not in req.headers:
+    auth = req.get_header("Authorization")
+    if not auth:
         raise HTTPUnauthorized()
 
-    auth = req.headers["AUTHORIZATION"]
     try:
         scheme, credentials = auth.split()
         if scheme.lower() != "basic":
@@ -0,0 +1,275 @@
+import json
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, ttl: float, max_size: int,
+                 stale_ttl: float = 0) -> None:
+        """Bounded in-process cache, entries expire after `ttl` seconds
+        & the least recently used entry is evicted once `max_size`
+        is reached.
+
+        Parameters
+        ----------
+        ttl : float
+            Seconds an entry is valid for.
+        max_size : int
+            Max amount of entries.
+        stale_ttl : float, optional
+            Seconds an expired entry is still returned
+            by `get_stale`, by default 0
+        """
+
+        self._ttl = ttl
+        self._max_size = max_size
+        self._stale_ttl = stale_ttl
+        self.__entries = OrderedDict()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not None
+
+    def get(self, key: Hashable, default: Any = None,
+            count: bool = True) -> Any:
+        """Get a entry from the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+        default : Any, optional
+            Returned if entry is missing or expired, by default None
+        count : bool, optional
+            If hit / miss counters should be updated, by default True
+
+        Returns
+        -------
+        Any
+        """
+
+        entry = self.__lookup(key)
+        if entry is not None and entry[1]:
+            if count:
+                self.hits += 1
+            return entry[0]
+
+        if count:
+            self.misses += 1
+
+        return default
+
+    def get_stale(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """Get a entry from the cache, including expired entries
+        within `stale_ttl`.
+
+        Parameters
+        ----------
+        key : Hashable
+
+        Returns
+        -------
+        Any
+            Value of entry.
+        bool
+            False if the entry is stale.
+        None
+            If entry is missing.
+        """
+
+        entry = self.__lookup(key)
+        if entry is None:
+            self.misses += 1
+        elif entry[1]:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+
+        return entry
+
+    def __lookup(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        now = monotonic()
+        if expires + self._stale_ttl <= now:
+            del self.__entries[key]
+            return None
+
+        self.__entries.move_to_end(key)
+
+        return value, expires > now
+
+    def set(self, key: Hashable, value: Any,
+            ttl: Optional[float] = None) -> None:
+        """Set a entry in the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+        value : Any
+        ttl : float, optional
+            Overwrites the default TTL, by default None
+        """
+
+        if self._max_size <= 0:
+            return
+
+        self.__entries[key] = (
+            monotonic() + (self._ttl if ttl is None else ttl), value
+        )
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self._max_size:
+            self.__entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Invalidate a entry.
+
+        Parameters
+        ----------
+        key : Hashable
+        """
+
+        self.__entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Invalidate all entries where the key matches the predicate.
+
+        Parameters
+        ----------
+        predicate : Callable[[Hashable], bool]
+        """
+
+        for key in [key for key in self.__entries if predicate(key)]:
+            del self.__entries[key]
+
+    def clear(self) -> None:
+        """Invalidate all entries.
+        """
+
+        self.__entries.clear()
+
+    @property
+    def stats(self) -> dict:
+        """Hit / miss counters.
+
+        Returns
+        -------
+        dict
+        """
+
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "size": len(self.__entries),
+            "max_size": self._max_size
+        }
+
+
+class CacheBackend(ABC):
+    """Interface for caches shared between workers.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int) -> None:
+        """In-process backend, not shared between workers.
+
+        Parameters
+        ----------
+        max_size : int
+        """
+
+        self._cache = TTLCache(0, max_size)
+
+    async def get(self, key: str) -> Any:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, client: Any, prefix: str = "sqlmatches:",
+                 raw: bool = False) -> None:
+        """Backend shared between workers, values are stored as JSON.
+
+        Parameters
+        ----------
+        client : Any
+            Client with the interface of redis.asyncio.Redis
+        prefix : str, optional
+            by default "sqlmatches:"
+        raw : bool, optional
+            If values are bytes stored as is, by default False
+        """
+
+        self._client = client
+        self._prefix = prefix
+        self._raw = raw
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCacheBackend":
+        """Create backend from a redis URL, requires the redis package.
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        RedisCacheBackend
+        """
+
+        try:
+            from redis.asyncio import Redis
+        except ImportError:
+            raise ImportError(
+                "The redis package is required for shared caches."
+            )
+
+        return cls(Redis.from_url(url), **kwargs)
+
+    async def get(self, key: str) -> Any:
+        value = await self._client.get(self._prefix + key)
+        if value is None or self._raw:
+            return value
+
+        return json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._client.set(
+            self._prefix + key,
+            value if self._raw else json.dumps(value),
+            px=int(ttl * 1000)
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
@@ -0,0 +1,85 @@
+import asyncio
+import bz2
+import lzma
+import zlib
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from ..env import DEMO_SETTINGS
+
+
+# Codec name to compressor factory, all of these release the GIL while
+# compressing so a thread pool is enough to use every core.
+CODECS: Dict[str, Callable[[], Any]] = {
+    "bz2": bz2.BZ2Compressor,
+    "lzma": lzma.LZMACompressor,
+    "gzip": lambda: zlib.compressobj(wbits=31)
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            DEMO_SETTINGS._compression_workers,
+            thread_name_prefix="compression"
+        )
+
+    return _executor
+
+
+class StreamCompressor:
+    def __init__(self, codec: str) -> None:
+        """Compresses a stream chunk by chunk off the event loop.
+
+        Parameters
+        ----------
+        codec : str
+            Key of CODECS.
+        """
+
+        self.__compressor = CODECS[codec]()
+
+    async def compress(self, data: bytes) -> bytes:
+        """Compress the next chunk, chunks must be compressed in order.
+
+        Parameters
+        ----------
+        data : bytes
+
+        Returns
+        -------
+        bytes
+            Might be empty while the compressor is buffering.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), self.__compressor.compress, data
+        )
+
+    async def flush(self) -> bytes:
+        """Finish the stream.
+
+        Returns
+        -------
+        bytes
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), self.__compressor.flush
+        )
+
+
+def shutdown() -> None:
+    """Shutdown the compression workers.
+    """
+
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
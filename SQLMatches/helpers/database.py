@@ -0,0 +1,300 @@
+import asyncio
+
+from contextlib import asynccontextmanager
+from hashlib import sha256
+from time import perf_counter
+from typing import (
+    Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Union
+)
+from databases import Database
+from falcon import HTTPServiceUnavailable
+from sqlalchemy import text
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.elements import TextClause
+
+from ..resources import Session
+from ..env import DATABASE_SETTINGS
+
+from .cache import TTLCache
+from .metrics import LatencyHistogram, METRICS
+
+
+def statement_type(query: Union[ClauseElement, str]) -> str:
+    """select, insert, update, delete or other.
+    """
+
+    if isinstance(query, TextClause):
+        query = query.text
+
+    if isinstance(query, str):
+        words = query.split(None, 1)
+        name = words[0].lower() if words else ""
+    else:
+        name = getattr(query, "__visit_name__", "")
+
+    return name if name in ("select", "insert", "update", "delete") \
+        else "other"
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        """Connection pool & query metrics.
+        """
+
+        self.checked_out = 0
+        self.max_checked_out = 0
+        self.acquire_timeouts = 0
+        self.wait = LatencyHistogram()
+        self.queries: Dict[str, LatencyHistogram] = {}
+
+    def observe_query(self, query: Union[ClauseElement, str],
+                      seconds: float) -> None:
+        """Record the latency of a query.
+
+        Parameters
+        ----------
+        query : Union[ClauseElement, str]
+        seconds : float
+        """
+
+        type_ = statement_type(query)
+        histogram = self.queries.get(type_)
+        if histogram is None:
+            histogram = self.queries[type_] = LatencyHistogram()
+
+        histogram.observe(seconds)
+        METRICS.query(seconds)
+
+    @property
+    def stats(self) -> dict:
+        """Metrics of the pool.
+
+        Returns
+        -------
+        dict
+        """
+
+        return {
+            "checked_out": self.checked_out,
+            "max_checked_out": self.max_checked_out,
+            "acquire_timeouts": self.acquire_timeouts,
+            "wait": self.wait.stats,
+            "queries": {
+                type_: histogram.stats
+                for type_, histogram in self.queries.items()
+            }
+        }
+
+
+class _InstrumentedConnection:
+    """Wraps a backend connection, times how long acquiring a
+    connection from the pool & each query takes.
+    """
+
+    def __init__(self, connection: Any, metrics: PoolMetrics,
+                 acquire_timeout: float) -> None:
+        self._connection = connection
+        self._metrics = metrics
+        self._acquire_timeout = acquire_timeout
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    async def acquire(self) -> None:
+        start = perf_counter()
+        try:
+            if self._acquire_timeout > 0:
+                await asyncio.wait_for(
+                    self._connection.acquire(), self._acquire_timeout
+                )
+            else:
+                await self._connection.acquire()
+        except asyncio.TimeoutError:
+            self._metrics.acquire_timeouts += 1
+            raise HTTPServiceUnavailable(retry_after=1)
+        finally:
+            self._metrics.wait.observe(perf_counter() - start)
+
+        self._metrics.checked_out += 1
+        self._metrics.max_checked_out = max(
+            self._metrics.max_checked_out, self._metrics.checked_out
+        )
+
+    async def release(self) -> None:
+        try:
+            await self._connection.release()
+        finally:
+            self._metrics.checked_out -= 1
+
+    async def __timed(self, query: Any, coro: Any) -> Any:
+        start = perf_counter()
+        try:
+            return await coro
+        finally:
+            self._metrics.observe_query(query, perf_counter() - start)
+
+    async def fetch_all(self, query: ClauseElement) -> List:
+        return await self.__timed(query, self._connection.fetch_all(query))
+
+    async def fetch_one(self, query: ClauseElement) -> Any:
+        return await self.__timed(query, self._connection.fetch_one(query))
+
+    async def fetch_val(self, query: ClauseElement, column: Any = 0) -> Any:
+        return await self.__timed(
+            query, self._connection.fetch_val(query, column)
+        )
+
+    async def execute(self, query: ClauseElement) -> Any:
+        return await self.__timed(query, self._connection.execute(query))
+
+    async def execute_many(self, queries: List[ClauseElement]) -> None:
+        if not queries:
+            return
+
+        await self.__timed(
+            queries[0], self._connection.execute_many(queries)
+        )
+
+    async def iterate(self, query: ClauseElement
+                      ) -> AsyncGenerator[Any, None]:
+        start = perf_counter()
+        try:
+            async for record in self._connection.iterate(query):
+                yield record
+        finally:
+            self._metrics.observe_query(query, perf_counter() - start)
+
+
+class _InstrumentedBackend:
+    def __init__(self, backend: Any, metrics: PoolMetrics,
+                 acquire_timeout: float) -> None:
+        self._backend = backend
+        self._metrics = metrics
+        self._acquire_timeout = acquire_timeout
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+    def connection(self) -> _InstrumentedConnection:
+        return _InstrumentedConnection(
+            self._backend.connection(), self._metrics, self._acquire_timeout
+        )
+
+
+class InstrumentedDatabase(Database):
+    def __init__(self, url: str, acquire_timeout: float = 0,
+                 **options) -> None:
+        """Database which records pool & query metrics.
+
+        Parameters
+        ----------
+        url : str
+        acquire_timeout : float, optional
+            Seconds to wait for a pooled connection before raising
+            HTTPServiceUnavailable, by default 0 for no limit.
+        **options
+            Passed to the pool.
+        """
+
+        super().__init__(url, **options)
+
+        self.metrics = PoolMetrics()
+        self._backend = _InstrumentedBackend(
+            self._backend, self.metrics, acquire_timeout
+        )
+
+
+class ReadRouter:
+    def __init__(self, window: float, max_size: int = 10000) -> None:
+        """Routes read-only queries to the replica, unless the match
+        was updated within `window` seconds by this worker.
+
+        Parameters
+        ----------
+        window : float
+        max_size : int, optional
+            Max amount of recently updated matches tracked,
+            by default 10000
+        """
+
+        self._recent = TTLCache(window, max_size)
+
+    def written(self, match_id: str) -> None:
+        """Called after a match is updated.
+
+        Parameters
+        ----------
+        match_id : str
+        """
+
+        self._recent.set(match_id, True)
+
+    def database(self, match_id: Optional[str] = None) -> Database:
+        """Database to read from.
+
+        Parameters
+        ----------
+        match_id : str, optional
+            Match being read, by default None
+
+        Returns
+        -------
+        Database
+        """
+
+        if match_id is not None and self._recent.get(match_id):
+            return Session.db
+
+        return Session.replica
+
+
+@asynccontextmanager
+async def advisory_lock(name: str) -> AsyncIterator[bool]:
+    """Try to take a lock held across every worker, without waiting.
+    Queries in the same task use the connection holding it.
+
+    SQLite has no such locks, as a SQLite database is local to one
+    host the lock is always taken.
+
+    Parameters
+    ----------
+    name : str
+        At most 64 characters.
+
+    Yields
+    ------
+    bool
+        False if another worker holds the lock.
+    """
+
+    dialect = Session.db.url.dialect
+    if dialect not in ("mysql", "postgresql"):
+        yield True
+        return
+
+    async with Session.db.connection() as connection:
+        if dialect == "mysql":
+            acquire = text("SELECT GET_LOCK(:name, 0)").bindparams(name=name)
+            release = text("SELECT RELEASE_LOCK(:name)").bindparams(
+                name=name
+            )
+        else:
+            key = int.from_bytes(
+                sha256(name.encode()).digest()[:8], "big", signed=True
+            )
+            acquire = text("SELECT pg_try_advisory_lock(:key)").bindparams(
+                key=key
+            )
+            release = text("SELECT pg_advisory_unlock(:key)").bindparams(
+                key=key
+            )
+
+        acquired = bool(await connection.fetch_val(acquire))
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await connection.fetch_val(release)
+
+
+READS = ReadRouter(DATABASE_SETTINGS._replica_window)
@@ -0,0 +1,123 @@
+import asyncio
+
+from concurrent.futures import (
+    Executor, ThreadPoolExecutor, ProcessPoolExecutor
+)
+from typing import Any, Callable, Optional
+from bcrypt import checkpw, gensalt, hashpw
+from falcon import HTTPServiceUnavailable
+
+from ..env import HASHING_SETTINGS
+
+
+def _hashpw(password: bytes) -> bytes:
+    return hashpw(password, gensalt())
+
+
+class HashingPool:
+    def __init__(self, workers: int, max_queue: int,
+                 process: bool = False) -> None:
+        """Runs bcrypt off the event loop.
+
+        Parameters
+        ----------
+        workers : int
+        max_queue : int
+            Max amount of pending hashes, once reached
+            HTTPServiceUnavailable is raised.
+        process : bool, optional
+            Use a process pool instead of a thread pool, by default False
+        """
+
+        self._workers = workers
+        self._max_queue = max_queue
+        self._process = process
+
+        self.__executor: Optional[Executor] = None
+        self.__pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Amount of hashes queued or running.
+
+        Returns
+        -------
+        int
+        """
+
+        return self.__pending
+
+    def __get_executor(self) -> Executor:
+        if self.__executor is None:
+            if self._process:
+                self.__executor = ProcessPoolExecutor(self._workers)
+            else:
+                self.__executor = ThreadPoolExecutor(
+                    self._workers, thread_name_prefix="hashing"
+                )
+
+        return self.__executor
+
+    async def __submit(self, func: Callable, *args) -> Any:
+        if self.__pending >= self._max_queue:
+            raise HTTPServiceUnavailable(retry_after=1)
+
+        self.__pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__get_executor(), func, *args
+            )
+        finally:
+            self.__pending -= 1
+
+    async def checkpw(self, password: str, hashed: bytes) -> bool:
+        """Verify a password / API key against its hash.
+
+        Parameters
+        ----------
+        password : str
+        hashed : bytes
+
+        Returns
+        -------
+        bool
+
+        Raises
+        ------
+        HTTPServiceUnavailable
+        """
+
+        return await self.__submit(checkpw, password.encode(), hashed)
+
+    async def hashpw(self, password: str) -> bytes:
+        """Hash a password / API key.
+
+        Parameters
+        ----------
+        password : str
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        HTTPServiceUnavailable
+        """
+
+        return await self.__submit(_hashpw, password.encode())
+
+    def shutdown(self) -> None:
+        """Shutdown the workers.
+        """
+
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+
+HASHING = HashingPool(
+    HASHING_SETTINGS._workers,
+    HASHING_SETTINGS._max_queue,
+    HASHING_SETTINGS._executor == "process"
+)
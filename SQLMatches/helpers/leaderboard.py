@@ -0,0 +1,418 @@
+import asyncio
+import logging
+
+from datetime import datetime
+from random import random
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+)
+from sqlalchemy import select
+
+from ..resources import Session
+from ..tables import statistic_table
+from ..env import LEADERBOARD_SETTINGS
+
+
+logger = logging.getLogger(__name__)
+
+
+# Stats players can be ranked by.
+LEADERBOARD_METRICS = (
+    "kills", "kdr", "hs_percentage", "hit_percentage", "mvps"
+)
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Any, level: int) -> None:
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        # Amount of positions each link skips.
+        self.width = [1] * level
+
+
+class RankedIndex:
+    # Enough levels for ~16 million keys.
+    max_level = 24
+
+    def __init__(self) -> None:
+        """Sorted keys, as a skiplist which also tracks how many keys
+        each link skips. Inserting, removing & finding a key by its
+        position or the position of a key are O(log n).
+        """
+
+        self.__head = _Node(None, self.max_level)
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __path(self, key: Any) -> Tuple[List[_Node], List[int]]:
+        """Last node before `key` on each level & positions skipped
+        on each level to reach it.
+        """
+
+        path = [self.__head] * self.max_level
+        steps = [0] * self.max_level
+
+        node = self.__head
+        for level in reversed(range(self.max_level)):
+            while node.next[level] is not None \
+                    and node.next[level].key < key:
+                steps[level] += node.width[level]
+                node = node.next[level]
+            path[level] = node
+
+        return path, steps
+
+    def insert(self, key: Any) -> None:
+        """Insert a key.
+
+        Parameters
+        ----------
+        key : Any
+        """
+
+        path, steps = self.__path(key)
+
+        level = 1
+        while level < self.max_level and random() < 0.5:
+            level += 1
+
+        node = _Node(key, level)
+        skipped = 0
+        for index in range(level):
+            previous = path[index]
+            node.next[index] = previous.next[index]
+            node.width[index] = previous.width[index] - skipped
+            previous.next[index] = node
+            previous.width[index] = skipped + 1
+            skipped += steps[index]
+
+        for index in range(level, self.max_level):
+            path[index].width[index] += 1
+
+        self.__size += 1
+
+    def remove(self, key: Any) -> None:
+        """Remove a key.
+
+        Parameters
+        ----------
+        key : Any
+
+        Raises
+        ------
+        KeyError
+        """
+
+        path, _ = self.__path(key)
+
+        node = path[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+
+        for index in range(len(node.next)):
+            previous = path[index]
+            previous.width[index] += node.width[index] - 1
+            previous.next[index] = node.next[index]
+
+        for index in range(len(node.next), self.max_level):
+            path[index].width[index] -= 1
+
+        self.__size -= 1
+
+    def index(self, key: Any) -> int:
+        """Position of a key.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        KeyError
+        """
+
+        path, steps = self.__path(key)
+
+        node = path[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+
+        return sum(steps)
+
+    def slice(self, start: int, stop: int) -> Iterator[Any]:
+        """Keys from position `start` to `stop`.
+
+        Parameters
+        ----------
+        start : int
+        stop : int
+
+        Yields
+        ------
+        Any
+        """
+
+        start = max(start, 0)
+        stop = min(stop, self.__size)
+        if start >= stop:
+            return
+
+        node = self.__head
+        remaining = start + 1
+        for level in reversed(range(self.max_level)):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+
+        for _ in range(stop - start):
+            yield node.key
+            node = node.next[0]
+
+
+class Leaderboard:
+    def __init__(self) -> None:
+        """Players ranked by a value, highest first, players with
+        the same value are ranked by SteamID64.
+        """
+
+        self.__index = RankedIndex()
+        self.__keys: Dict[str, Tuple[float, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def set(self, steam_id: str, value: float) -> None:
+        """Set the value of a player.
+
+        Parameters
+        ----------
+        steam_id : str
+        value : float
+        """
+
+        key = (-value, steam_id)
+
+        old = self.__keys.get(steam_id)
+        if old == key:
+            return
+
+        if old is not None:
+            self.__index.remove(old)
+
+        self.__index.insert(key)
+        self.__keys[steam_id] = key
+
+    def rank(self, steam_id: str) -> Optional[int]:
+        """Rank of a player, starting at 1.
+
+        Parameters
+        ----------
+        steam_id : str
+
+        Returns
+        -------
+        int
+            None if the player isn't ranked.
+        """
+
+        key = self.__keys.get(steam_id)
+        if key is None:
+            return None
+
+        return self.__index.index(key) + 1
+
+    def top(self, limit: int, offset: int = 0
+            ) -> List[Tuple[int, str, float]]:
+        """Highest ranked players.
+
+        Parameters
+        ----------
+        limit : int
+        offset : int, optional
+            by default 0
+
+        Returns
+        -------
+        List[Tuple[int, str, float]]
+            Rank, SteamID64 & value of each player.
+        """
+
+        return [
+            (rank, steam_id, -value)
+            for rank, (value, steam_id) in enumerate(
+                self.__index.slice(offset, offset + limit), offset + 1
+            )
+        ]
+
+    def around(self, steam_id: str, radius: int
+               ) -> List[Tuple[int, str, float]]:
+        """Players ranked around a player.
+
+        Parameters
+        ----------
+        steam_id : str
+        radius : int
+            Amount of players above & below.
+
+        Returns
+        -------
+        List[Tuple[int, str, float]]
+            Rank, SteamID64 & value of each player,
+            empty if the player isn't ranked.
+        """
+
+        rank = self.rank(steam_id)
+        if rank is None:
+            return []
+
+        start = max(rank - 1 - radius, 0)
+        return self.top(rank + radius - start, start)
+
+
+class Leaderboards:
+    def __init__(self, rebuild_interval: float) -> None:
+        """Leaderboard of each metric, kept up to date by statistic
+        writes & rebuilt every interval.
+
+        Leaderboards are per process, updates only apply to the
+        worker which wrote the statistics. Other workers see them
+        once they next rebuild, so ranks can be up to the rebuild
+        interval stale.
+
+        Parameters
+        ----------
+        rebuild_interval : float
+        """
+
+        self._rebuild_interval = rebuild_interval
+
+        self.__boards = {
+            metric: Leaderboard() for metric in LEADERBOARD_METRICS
+        }
+        # Players updated while rebuilding.
+        self.__dirty: Optional[Set[str]] = None
+        self.__task: Optional[asyncio.Task] = None
+
+        self.rebuilds = 0
+        self.updates = 0
+        self.last_rebuild: Optional[datetime] = None
+
+    def __getitem__(self, metric: str) -> Leaderboard:
+        return self.__boards[metric]
+
+    @property
+    def stats(self) -> dict:
+        """Rebuild & update counters.
+
+        Returns
+        -------
+        dict
+        """
+
+        return {
+            "players": len(self.__boards[LEADERBOARD_METRICS[0]]),
+            "rebuilds": self.rebuilds,
+            "updates": self.updates,
+            "last_rebuild": self.last_rebuild
+        }
+
+    def start(self) -> None:
+        """Build the leaderboards & rebuild them every interval.
+        """
+
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__loop())
+
+    async def stop(self) -> None:
+        """Stop rebuilding.
+        """
+
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
+
+    async def __loop(self) -> None:
+        while True:
+            try:
+                await self.rebuild()
+            except Exception:
+                logger.exception("Rebuilding leaderboards failed")
+
+            if self._rebuild_interval <= 0:
+                return
+
+            await asyncio.sleep(self._rebuild_interval)
+
+    def __query(self) -> Any:
+        return select([
+            statistic_table.c.steam_id,
+            *[statistic_table.c[metric] for metric in LEADERBOARD_METRICS]
+        ]).select_from(statistic_table)
+
+    def __set(self, boards: Dict[str, Leaderboard], row: Any) -> None:
+        for metric in LEADERBOARD_METRICS:
+            boards[metric].set(row["steam_id"], row[metric] or 0)
+
+    async def rebuild(self) -> None:
+        """Build the leaderboards from scratch, they're swapped in
+        once built so reads aren't blocked.
+        """
+
+        boards = {metric: Leaderboard() for metric in LEADERBOARD_METRICS}
+
+        self.__dirty = set()
+        try:
+            async for row in Session.db.iterate(self.__query()):
+                self.__set(boards, row)
+        finally:
+            dirty = self.__dirty
+            self.__dirty = None
+
+        self.__boards = boards
+
+        # Updates made while reading might be missing.
+        if dirty:
+            await self.update(dirty)
+
+        self.rebuilds += 1
+        self.last_rebuild = datetime.now()
+
+    async def update(self, steam_ids: Iterable[str]) -> None:
+        """Update players, called after their statistics are written.
+
+        Parameters
+        ----------
+        steam_ids : Iterable[str]
+            SteamID64s
+        """
+
+        steam_ids = set(steam_ids)
+        if not steam_ids:
+            return
+
+        if self.__dirty is not None:
+            self.__dirty.update(steam_ids)
+
+        for row in await Session.db.fetch_all(self.__query().where(
+                statistic_table.c.steam_id.in_(steam_ids))):
+            self.__set(self.__boards, row)
+
+        self.updates += 1
+
+
+LEADERBOARDS = Leaderboards(LEADERBOARD_SETTINGS._rebuild_interval)
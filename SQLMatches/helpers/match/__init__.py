@@ -1,6 +1,6 @@
 from uuid import uuid4
 from sqlalchemy import select, func
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from sqlalchemy.sql.elements import ClauseElement
@@ -12,10 +12,29 @@ from ...tables import (
 )
 from ...resources import Session
 
-from ...models.match import ScoreboardModel
+from ...models.match import (
+    ScoreboardModel, ScoreboardPlayerModel, derived_stats
+)
+
+from ..sql_on_conflict import (
+    on_scoreboard_total_conflict, on_scoreboard_conflict,
+    on_statistic_conflict
+)
+from ..database import READS
+from ..leaderboard import LEADERBOARDS
+from ..media import dumps, loads
 
 from .players import MatchPlayers
 from .demo import DemoFile
+from .upload import DemoUpload
+from .cache import SCOREBOARD_CACHE
+
+
+# Stats sent as deltas for each round.
+ROUND_STATS = (
+    "kills", "headshots", "assists", "deaths",
+    "shots_fired", "shots_hit", "mvps"
+)
 
 
 class Match:
@@ -60,6 +79,22 @@ class Match:
 
         return DemoFile(self)
 
+    def upload(self, upload_id: Optional[str] = None) -> DemoUpload:
+        """Interact with a resumable demo upload.
+
+        Parameters
+        ----------
+        upload_id : str, optional
+            ID of upload, by default None
+            If None a new ID is generated.
+
+        Returns
+        -------
+        DemoUpload
+        """
+
+        return DemoUpload(self, upload_id or str(uuid4()))
+
     def players(self, players: List[str]) -> MatchPlayers:
         """Interact with players in a match.
 
@@ -90,20 +125,29 @@ class Match:
             spectator_table.c.match_id == self.match_id
         )
         spectators = {}
-        async for spectator in Session.db.iterate(query):
+        async for spectator in READS.database(self.match_id).iterate(query):
             spectators[spectator["steam_id"]] = spectator["team"]
 
         return spectators
 
-    async def exists(self) -> bool:
+    async def exists(self, primary: bool = False) -> bool:
         """Returns True if the current match exists.
 
+        Parameters
+        ----------
+        primary : bool, optional
+            Read from the primary, for checks before writing as the
+            match might of been created by another worker & not
+            replicated yet, by default False
+
         Returns
         -------
         bool
         """
 
-        return await Session.db.fetch_val(
+        database = Session.db if primary else READS.database(self.match_id)
+
+        return await database.fetch_val(
             select([func.count()]).select_from(
                 scoreboard_total_table
             ).where(
@@ -153,10 +197,12 @@ class Match:
             scoreboard_total_table.join(
                 scoreboard_table,
                 scoreboard_table.c.match_id ==
-                scoreboard_total_table.c.match_id
+                scoreboard_total_table.c.match_id,
+                isouter=True
             ).join(
                 statistic_table,
-                statistic_table.c.steam_id == scoreboard_table.c.steam_id
+                statistic_table.c.steam_id == scoreboard_table.c.steam_id,
+                isouter=True
             )
         ).where(
             scoreboard_total_table.c.match_id == self.match_id
@@ -171,7 +217,7 @@ class Match:
         team_1_append = scoreboard_data["team_1"].append
         team_2_append = scoreboard_data["team_2"].append
 
-        async for row in Session.db.iterate(query=query):
+        async for row in READS.database(self.match_id).iterate(query=query):
             if not scoreboard_data["match"]:
                 scoreboard_data["match"] = {
                     "match_id": self.match_id,
@@ -187,31 +233,67 @@ class Match:
                     "team_2_side": row["team_2_side"]
                 }
 
+            if row["steam_id"] is None:
+                continue  # Match without players.
+
             team_append = team_1_append if row["team"] == 0 else team_2_append
 
-            team_append({
-                "steam_id": row["steam_id"],
-                "name": row["name"],
-                "pfp": row["pfp"],
-                "team": row["team"],
-                "alive": row["alive"],
-                "ping": row["ping"],
-                "kills": row["kills"],
-                "headshots": row["headshots"],
-                "assists": row["assists"],
-                "deaths": row["deaths"],
-                "shots_fired": row["shots_fired"],
-                "shots_hit": row["shots_hit"],
-                "mvps": row["mvps"],
-                "score": row["score"],
-                "disconnected": row["disconnected"]
-            })
+            team_append(ScoreboardPlayerModel(
+                name=row["name"],
+                steam_id=row["steam_id"],
+                team=row["team"],
+                alive=row["alive"],
+                ping=row["ping"],
+                kills=row["kills"],
+                headshots=row["headshots"],
+                assists=row["assists"],
+                deaths=row["deaths"],
+                shots_fired=row["shots_fired"],
+                shots_hit=row["shots_hit"],
+                mvps=row["mvps"],
+                score=row["score"],
+                disconnected=row["disconnected"],
+                pfp=row["pfp"]
+            ))
 
         if scoreboard_data["match"]:
             return ScoreboardModel(**scoreboard_data)
         else:
             raise MatchNotFound()
 
+    async def scoreboard_json(self) -> bytes:
+        """Get the API schema of the match scoreboard encoded as JSON,
+        read through the scoreboard cache so it's encoded once.
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        MatchNotFound
+        """
+
+        return await SCOREBOARD_CACHE.get(self.match_id, self.__load_json)
+
+    async def __load_json(self) -> bytes:
+        return dumps((await self.scoreboard()).api_schema)
+
+    async def scoreboard_schema(self) -> dict:
+        """Get the API schema of the match scoreboard,
+        read through the scoreboard cache.
+
+        Returns
+        -------
+        dict
+
+        Raises
+        ------
+        MatchNotFound
+        """
+
+        return loads(await self.scoreboard_json())
+
     async def update(self, team_1_name: Optional[str] = None,
                      map_: Optional[str] = None,
                      status: Optional[int] = None,
@@ -223,8 +305,9 @@ class Match:
                      team_2_side: Optional[int] = None,
                      pre_setup: Optional[bool] = None,
                      require_ready: Optional[bool] = None,
-                     connect_wait: Optional[int] = None
-                     ) -> ScoreboardModel:
+                     connect_wait: Optional[int] = None,
+                     scoreboard: bool = True
+                     ) -> Optional[ScoreboardModel]:
         """Update / create the match.
 
         Parameters
@@ -253,10 +336,14 @@ class Match:
             by default None
         connect_wait : int, optional
             by default None
+        scoreboard : bool, optional
+            If False the scoreboard isn't re-read after the update,
+            by default True
 
         Returns
         -------
         ScoreboardModel
+            None if `scoreboard` is False.
         """
 
         values = {}
@@ -285,15 +372,73 @@ class Match:
         if connect_wait is not None:
             values["connect_wait"] = connect_wait
 
-        if await self.exists():
-            scoreboard_total_table.update().where(
-                self.__match_id_query
-            ).values(**values)
-        else:
-            values["match_id"] = self.match_id
-            values["created"] = datetime.now()
-            scoreboard_total_table.insert(
+        await Session.db.execute(
+            on_scoreboard_total_conflict(list(values.keys())).values(
+                match_id=self.match_id,
+                created=datetime.now(),
                 **values
             )
+        )
+
+        await SCOREBOARD_CACHE.invalidate(self.match_id)
+
+        return await self.scoreboard() if scoreboard else None
+
+    async def round_results(self, players: List[Dict[str, Any]]) -> None:
+        """Apply the stat deltas of every player for a round.
+
+        Parameters
+        ----------
+        players : List[Dict[str, Any]]
+            Each containing steam_id & team, optionally alive, ping,
+            disconnected, score & the deltas of ROUND_STATS.
+
+        Raises
+        ------
+        MatchNotFound
+        """
+
+        if not await self.exists(primary=True):
+            raise MatchNotFound()
+
+        scoreboard = []
+        stats = []
+
+        now = datetime.now()
+        for player in players:
+            deltas = {stat: player.get(stat, 0) for stat in ROUND_STATS}
+
+            scoreboard.append({
+                "steam_id": player["steam_id"],
+                "match_id": self.match_id,
+                "team": player["team"],
+                "alive": player.get("alive", True),
+                "ping": player.get("ping", 0),
+                "score": player.get("score", 0),
+                "disconnected": player.get("disconnected", False),
+                **deltas
+            })
+            stats.append({
+                "steam_id": player["steam_id"],
+                "created": now,
+                **deltas,
+                # Ratios if the player has no stats yet.
+                **derived_stats(
+                    deltas["kills"], deltas["deaths"], deltas["headshots"],
+                    deltas["shots_hit"], deltas["shots_fired"]
+                )
+            })
+
+        # Statistics first, scoreboard rows reference them.
+        async with Session.db.transaction():
+            await Session.db.execute_many(
+                on_statistic_conflict(profile=False),
+                stats
+            )
+            await Session.db.execute_many(
+                on_scoreboard_conflict(),
+                scoreboard
+            )
 
-        return await self.scoreboard()
+        await SCOREBOARD_CACHE.invalidate(self.match_id)
+        await LEADERBOARDS.update(stat["steam_id"] for stat in stats)
@@ -0,0 +1,111 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+from ...env import CACHE_SETTINGS
+
+from ..cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from ..database import READS
+
+
+class ScoreboardCache:
+    def __init__(self, backend: CacheBackend, ttl: float) -> None:
+        """Read-through cache of encoded scoreboard API schemas
+        keyed by match ID.
+
+        Parameters
+        ----------
+        backend : CacheBackend
+        ttl : float
+        """
+
+        self.backend = backend
+        self._ttl = ttl
+
+        # Called with the match ID after it's invalidated.
+        self.listeners: List[Callable[[str], None]] = []
+
+        self.__loading: Dict[str, asyncio.Future] = {}
+        self.__invalidated: Set[str] = set()
+
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, match_id: str,
+                  loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Get the cached scoreboard, on a miss `loader` is called once
+        no matter how many requests are waiting on it.
+
+        Parameters
+        ----------
+        match_id : str
+        loader : Callable[[], Awaitable[Any]]
+
+        Returns
+        -------
+        Any
+        """
+
+        value = await self.backend.get(match_id)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+
+        future = self.__loading.get(match_id)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        # Stops "exception never retrieved" if nobody else was waiting.
+        future.add_done_callback(
+            lambda future_: future_.cancelled() or future_.exception()
+        )
+        self.__loading[match_id] = future
+
+        try:
+            value = await loader()
+            # Not cached if invalidated while loading, as it might be
+            # older then the write that invalidated it.
+            if match_id not in self.__invalidated:
+                await self.backend.set(match_id, value, self._ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self.__loading.pop(match_id, None)
+            self.__invalidated.discard(match_id)
+
+    async def invalidate(self, match_id: str) -> None:
+        """Invalidate the cached scoreboard.
+
+        Parameters
+        ----------
+        match_id : str
+        """
+
+        if match_id in self.__loading:
+            self.__invalidated.add(match_id)
+
+        await self.backend.delete(match_id)
+
+        for listener in self.listeners:
+            listener(match_id)
+
+
+SCOREBOARD_CACHE = ScoreboardCache(
+    RedisCacheBackend.from_url(CACHE_SETTINGS._scoreboard_url, raw=True)
+    if CACHE_SETTINGS._scoreboard_url else
+    MemoryCacheBackend(CACHE_SETTINGS._scoreboard_size),
+    CACHE_SETTINGS._scoreboard_ttl
+)
+
+# Reads of a updated match go to the primary for a while.
+SCOREBOARD_CACHE.listeners.append(READS.written)
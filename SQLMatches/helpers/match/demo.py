@@ -1,24 +1,115 @@
-import aiofiles
-import aiofiles.os
+import asyncio
 
-from falcon import Request, Response
+from falcon import (
+    Request, Response, HTTP_206, HTTP_304, HTTPRangeNotSatisfiable
+)
 
+from typing import (
+    TYPE_CHECKING, AsyncGenerator, AsyncIterator, Awaitable, Callable, List,
+    Optional, Tuple
+)
+from datetime import datetime, timezone
 from sqlalchemy import select
-from os import path
-from typing import TYPE_CHECKING, Optional
-from datetime import datetime
-from uuid import uuid4
 
 from ...resources import Session
-from ...tables import scoreboard_total_table, demo_log_table
-from ...errors import DemoNotFound
-from ...env import DEMO_SETTINGS
+from ...tables import scoreboard_total_table
+from ...errors import DemoNotFound, DemoTooLarge, DemoCompressionDisabled
+from ...env import DEMO_SETTINGS, CACHE_SETTINGS
+
+from ..cache import CacheBackend, RedisCacheBackend
+from ..compression import StreamCompressor
+from ..storage import DEMO_STORAGE, DemoStat
+from ..metrics import METRICS
+
+from .cache import SCOREBOARD_CACHE
+from .demo_log import DEMO_LOG
 
 
 if TYPE_CHECKING:
     from . import Match
 
 
+class DemoStatCache:
+    def __init__(self, backend: Optional[CacheBackend], ttl: float) -> None:
+        """Cache of the DemoStat of demos keyed by match ID.
+
+        Only cached in a backend shared between workers, as a demo can
+        be replaced by any worker & every worker must see it. Without
+        one demos are stat'ed every download.
+
+        Parameters
+        ----------
+        backend : Optional[CacheBackend]
+        ttl : float
+        """
+
+        self.backend = backend
+        self._ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, match_id: str,
+                  loader: Callable[[], Awaitable[Optional[DemoStat]]]
+                  ) -> Optional[DemoStat]:
+        """Get the cached DemoStat, `loader` is called on a miss.
+
+        Parameters
+        ----------
+        match_id : str
+        loader : Callable[[], Awaitable[Optional[DemoStat]]]
+
+        Returns
+        -------
+        DemoStat
+            None if the demo doesn't exist.
+        """
+
+        if self.backend is None:
+            return await loader()
+
+        value = await self.backend.get(match_id)
+        if value is not None:
+            self.hits += 1
+            return DemoStat(
+                value["size"],
+                value["etag"],
+                datetime.fromtimestamp(value["last_modified"], timezone.utc)
+            )
+
+        self.misses += 1
+
+        stat = await loader()
+        if stat is not None:
+            await self.backend.set(match_id, {
+                "size": stat.size,
+                "etag": stat.etag,
+                "last_modified": stat.last_modified.timestamp()
+            }, self._ttl)
+
+        return stat
+
+    async def invalidate(self, match_id: str) -> None:
+        """Invalidate the cached DemoStat, called after the demo
+        is stored or deleted.
+
+        Parameters
+        ----------
+        match_id : str
+        """
+
+        if self.backend is not None:
+            await self.backend.delete(match_id)
+
+
+DEMO_CACHE = DemoStatCache(
+    RedisCacheBackend.from_url(
+        CACHE_SETTINGS._scoreboard_url, prefix="sqlmatches:demo:"
+    ) if CACHE_SETTINGS._scoreboard_url else None,
+    CACHE_SETTINGS._demo_ttl
+)
+
+
 class DemoFile:
     def __init__(self, upper: "Match") -> None:
         """Interact with the demo file.
@@ -29,28 +120,42 @@ class DemoFile:
         """
 
         self.__upper = upper
-        self._pathway = path.join(
-            DEMO_SETTINGS._pathway,
-            self.__upper.match_id + DEMO_SETTINGS._extension
-        )
+        self._key = self.__upper.match_id + DEMO_SETTINGS._extension
 
-    async def __update_match(self, **kwargs) -> None:
+    async def _update_match(self, **kwargs) -> None:
         await Session.db.execute(
-            scoreboard_total_table.update(**kwargs).where(
+            scoreboard_total_table.update().where(
                 scoreboard_total_table.c.match_id == self.__upper.match_id
-            )
+            ).values(**kwargs)
         )
 
-    async def __exist_raise(self) -> None:
-        """Raise a DemoNotFound if the demo doesn't exist.
+        await DEMO_CACHE.invalidate(self.__upper.match_id)
+        await SCOREBOARD_CACHE.invalidate(self.__upper.match_id)
 
-        Raises
-        ------
-        DemoNotFound
+    async def _begin_upload(self) -> Optional[int]:
+        """Mark the demo as processing.
+
+        Returns
+        -------
+        int
+            Demo status before, passed to _reset_status if the
+            upload fails.
         """
 
-        if not await self.exists():
-            raise DemoNotFound()
+        previous = await Session.db.fetch_val(
+            select([scoreboard_total_table.c.demo_status]).where(
+                scoreboard_total_table.c.match_id == self.__upper.match_id
+            )
+        )
+
+        await self._update_match(demo_status=1)
+
+        return previous
+
+    async def __stat(self) -> Optional[DemoStat]:
+        return await DEMO_CACHE.get(
+            self.__upper.match_id, lambda: DEMO_STORAGE.stat(self._key)
+        )
 
     async def exists(self) -> bool:
         """Return True if the path exists False otherwise.
@@ -60,14 +165,58 @@ class DemoFile:
         bool
         """
 
-        return await aiofiles.os.path.exists(self._pathway)  # type: ignore
+        return await self.__stat() is not None
+
+    @staticmethod
+    def __not_modified(req: Request, etag: str,
+                       last_modified: datetime) -> bool:
+        if req.if_none_match:
+            return any(
+                tag == "*" or tag == etag.strip('"')
+                for tag in req.if_none_match
+            )
 
-    async def download(self, resp: Response,
+        if req.if_modified_since:
+            since = req.if_modified_since
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+
+            return int(last_modified.timestamp()) <= since.timestamp()
+
+        return False
+
+    @staticmethod
+    def __range(req: Request, etag: str, last_modified: datetime,
+                size: int) -> Optional[Tuple[int, int]]:
+        if not req.range or req.range_unit != "bytes":
+            return None
+
+        if_range = req.get_header("If-Range")
+        if if_range and if_range != etag and (
+                if_range != last_modified.strftime(
+                    "%a, %d %b %Y %H:%M:%S GMT")):
+            return None  # Demo changed, send it all.
+
+        start, end = req.range
+        if start < 0:
+            start = max(size + start, 0)
+            end = size - 1
+        elif end < 0 or end >= size:
+            end = size - 1
+
+        if start >= size or start > end:
+            raise HTTPRangeNotSatisfiable(size)
+
+        return start, end
+
+    async def download(self, req: Request, resp: Response,
                        steam_id: Optional[str] = None) -> None:
-        """Stream the demo to client.
+        """Stream the demo to client, supports range & conditional
+        requests.
 
         Parameters
         ----------
+        req : Request
         resp : Response
         steam_id : str, optional
             If provided download will be logged, by default None
@@ -75,46 +224,184 @@ class DemoFile:
         Raises
         ------
         DemoNotFound
+        HTTPRangeNotSatisfiable
         """
 
-        await self.__exist_raise()
+        stat = await self.__stat()
+        if stat is None:
+            raise DemoNotFound()
+
+        size = stat.size
+        etag = stat.etag
+        last_modified = stat.last_modified
 
-        if steam_id is not None:
-            await Session.db.execute(demo_log_table.insert().values(
-                match_id=self.__upper.match_id,
-                steam_id=steam_id,
-                downloaded=datetime.now(),
-                log_id=str(uuid4())
-            ))
+        resp.etag = etag
+        resp.last_modified = last_modified
+        resp.accept_ranges = "bytes"
 
-        demo_size = await Session.db.fetch_val(
-            select([scoreboard_total_table.c.demo_size]).select_from(
-                scoreboard_total_table
-            ).where(
-                scoreboard_total_table.c.match_id == self.__upper.match_id
-            )
+        if self.__not_modified(req, etag, last_modified):
+            resp.status = HTTP_304
+            return
+
+        byte_range = self.__range(req, etag, last_modified, size)
+
+        if steam_id is not None and (not byte_range or byte_range[0] == 0):
+            # Resumed downloads aren't logged again.
+            DEMO_LOG.add(self.__upper.match_id, steam_id)
+
+        resp.downloadable_as = self._key
+
+        if byte_range:
+            start, end = byte_range
+            resp.status = HTTP_206
+            resp.content_range = (start, end, size)
+        else:
+            start, end = 0, size - 1
+
+        resp.content_length = end - start + 1
+        resp.stream = DEMO_STORAGE.read(self._key, start, end - start + 1)
+        if METRICS.enabled:
+            resp.stream = METRICS.count_stream(resp.stream, "download")
+
+    async def __encode(self, stream: AsyncIterator[bytes],
+                       compressor: Optional[StreamCompressor],
+                       raw_size: List[int]) -> AsyncGenerator[bytes, None]:
+        pending: Optional[asyncio.Future] = None
+
+        try:
+            buffer = bytearray()
+            async for chunk in stream:
+                raw_size[0] += len(chunk)
+                if raw_size[0] > DEMO_SETTINGS._max_size:
+                    raise DemoTooLarge()
+
+                # Small chunks are coalesced into one write.
+                buffer += chunk
+                if len(buffer) < DEMO_SETTINGS._chunk_size:
+                    continue
+
+                if compressor is None:
+                    yield bytes(buffer)
+                else:
+                    # Compressing the buffer overlaps with receiving
+                    # the next & storing the last.
+                    data = await pending if pending is not None else b""
+                    pending = asyncio.ensure_future(
+                        compressor.compress(bytes(buffer))
+                    )
+                    if data:
+                        yield data
+
+                buffer = bytearray()
+
+            if pending is not None:
+                data = await pending
+                pending = None
+                if data:
+                    yield data
+
+            if compressor is None:
+                if buffer:
+                    yield bytes(buffer)
+            else:
+                if buffer:
+                    data = await compressor.compress(bytes(buffer))
+                    if data:
+                        yield data
+
+                yield await compressor.flush()
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                try:
+                    await pending
+                except BaseException:
+                    pass
+
+    async def _commit(self, stream: AsyncIterator[bytes],
+                      raw: bool = False) -> None:
+        """Store the stream, the current demo is only replaced once
+        complete & the match is only updated after.
+
+        Parameters
+        ----------
+        stream : AsyncIterator[bytes]
+        raw : bool, optional
+            If the stream is a uncompressed .dem, by default False
+
+        Raises
+        ------
+        DemoTooLarge
+        """
+
+        raw_size = [0]
+        size = await DEMO_STORAGE.save(self._key, self.__encode(
+            stream,
+            StreamCompressor(DEMO_SETTINGS._compression) if raw else None,
+            raw_size
+        ))
+
+        await self._update_match(
+            demo_size=size,
+            demo_raw_size=raw_size[0] if raw else None,
+            demo_status=2
         )
 
-        resp.content_length = str(demo_size) if demo_size is not None else None
-        resp.stream = await aiofiles.open(self._pathway, "rb")  # falcon magic
+    async def _reset_status(self, previous: Optional[int]) -> None:
+        """Reset the demo status after a failed upload,
+        the previous demo is untouched if there was one.
 
-    async def save(self, req: Request) -> None:
-        """Save the match to the local path.
+        Parameters
+        ----------
+        previous : Optional[int]
+            Demo status before the upload, kept if the demo
+            was deleted.
+        """
+
+        if await self.exists():
+            status = 2
+        elif previous == 3:
+            status = 3
+        else:
+            status = 0
+
+        await self._update_match(demo_status=status)
+
+    async def save(self, req: Request, raw: bool = False) -> None:
+        """Save the match to the local path, the demo is written to a
+        temporary file & only replaces the current demo once complete.
 
         Parameters
         ----------
         req : Request
+        raw : bool, optional
+            If the upload is a uncompressed .dem, it's compressed while
+            being uploaded, by default False
+
+        Raises
+        ------
+        DemoTooLarge
+        DemoCompressionDisabled
         """
 
-        await self.__update_match(demo_status=1)
+        if (req.content_length is not None
+                and req.content_length > DEMO_SETTINGS._max_size):
+            raise DemoTooLarge()
+
+        if raw and not DEMO_SETTINGS._compression:
+            raise DemoCompressionDisabled()
+
+        previous = await self._begin_upload()
 
-        size = 0
-        async with aiofiles.open(self._pathway, "wb") as f_:
-            async for chunk in req.stream:
-                size += len(chunk)
-                await f_.write(chunk)
+        stream = req.stream
+        if METRICS.enabled:
+            stream = METRICS.count_stream(stream, "upload")
 
-        await self.__update_match(demo_size=size, demo_status=2)
+        try:
+            await self._commit(stream, raw)
+        except BaseException:
+            await self._reset_status(previous)
+            raise
 
     async def delete(self) -> None:
         """Delete the match from disk.
@@ -124,6 +411,9 @@ class DemoFile:
         DemoNotFound
         """
 
-        await self.__exist_raise()
-        await aiofiles.os.remove(self._pathway)
-        await self.__update_match(demo_size=0, demo_status=3)
+        if not await DEMO_STORAGE.delete(self._key):
+            raise DemoNotFound()
+
+        await self._update_match(
+            demo_size=0, demo_raw_size=None, demo_status=3
+        )
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+
+from datetime import datetime
+from typing import List, Optional, Set
+from uuid import uuid4
+
+from ...resources import Session
+from ...tables import demo_log_table
+from ...env import DEMO_SETTINGS
+
+from ..metrics import background
+
+
+logger = logging.getLogger(__name__)
+
+
+class DemoLog:
+    def __init__(self, batch_size: int, interval: float) -> None:
+        """Buffers demo downloads & logs them together, a download is
+        logged once `batch_size` are buffered or after `interval`.
+
+        Parameters
+        ----------
+        batch_size : int
+        interval : float
+        """
+
+        self._batch_size = batch_size
+        self._interval = interval
+
+        self.__buffer: List[dict] = []
+        self.__flush_handle: Optional[asyncio.TimerHandle] = None
+        self.__tasks: Set[asyncio.Task] = set()
+
+        self.logged = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Amount of downloads not logged yet.
+
+        Returns
+        -------
+        int
+        """
+
+        return len(self.__buffer)
+
+    def add(self, match_id: str, steam_id: str) -> None:
+        """Buffer a download.
+
+        Parameters
+        ----------
+        match_id : str
+        steam_id : str
+            SteamID64 of who downloaded it.
+        """
+
+        self.__buffer.append({
+            "match_id": match_id,
+            "steam_id": steam_id,
+            "downloaded": datetime.now(),
+            "log_id": str(uuid4())
+        })
+
+        if len(self.__buffer) >= self._batch_size:
+            self.__start_flush()
+        elif self.__flush_handle is None:
+            self.__flush_handle = asyncio.get_running_loop().call_later(
+                self._interval, self.__start_flush
+            )
+
+    def __start_flush(self) -> None:
+        task = asyncio.create_task(background(self.flush()))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def flush(self) -> None:
+        """Log all buffered downloads.
+        """
+
+        if self.__flush_handle is not None:
+            self.__flush_handle.cancel()
+            self.__flush_handle = None
+
+        rows = self.__buffer
+        self.__buffer = []
+        if not rows:
+            return
+
+        try:
+            await Session.db.execute_many(demo_log_table.insert(), rows)
+        except Exception:
+            self.dropped += len(rows)
+            logger.exception("Logging %s downloads failed", len(rows))
+        else:
+            self.logged += len(rows)
+
+    async def close(self) -> None:
+        """Wait for running flushes & log what's left.
+        """
+
+        if self.__tasks:
+            await asyncio.gather(*self.__tasks, return_exceptions=True)
+
+        await self.flush()
+
+
+DEMO_LOG = DemoLog(DEMO_SETTINGS._log_batch, DEMO_SETTINGS._log_interval)
@@ -0,0 +1,149 @@
+import json
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select, and_, or_
+
+from ...tables import scoreboard_total_table, scoreboard_table
+from ...errors import InvalidCursor
+from ...models.match import MatchModel
+
+from ..database import READS
+
+
+def _encode_cursor(created: datetime, match_id: str) -> str:
+    return urlsafe_b64encode(
+        json.dumps([created.isoformat(), match_id]).encode()
+    ).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created, match_id = json.loads(
+            urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        return datetime.fromisoformat(created), str(match_id)
+    except Exception:
+        raise InvalidCursor()
+
+
+class Matches:
+    def __init__(self, status: Optional[int] = None,
+                 map_: Optional[str] = None,
+                 steam_id: Optional[str] = None) -> None:
+        """List matches newest first, filters are optional.
+
+        Parameters
+        ----------
+        status : int, optional
+            by default None
+        map_ : str, optional
+            by default None
+        steam_id : str, optional
+            Only matches this SteamID64 played in, by default None
+        """
+
+        self.status = status
+        self.map_ = map_
+        self.steam_id = steam_id
+
+    async def page(self, limit: int, cursor: Optional[str] = None
+                   ) -> Tuple[List[MatchModel], Optional[str]]:
+        """Get a page of matches, pages are seeked to using the
+        (created, match_id) indexes so every page costs the same.
+        Filtering by player only reads that player's matches.
+
+        Parameters
+        ----------
+        limit : int
+        cursor : str, optional
+            Cursor of the previous page, by default None
+
+        Returns
+        -------
+        List[MatchModel]
+        str
+            Cursor of the next page, None if this is the last.
+
+        Raises
+        ------
+        InvalidCursor
+        """
+
+        conditions = []
+
+        if self.status is not None:
+            conditions.append(scoreboard_total_table.c.status == self.status)
+
+        if self.map_ is not None:
+            conditions.append(scoreboard_total_table.c.map == self.map_)
+
+        if self.steam_id is not None:
+            # Driven from the player's scoreboard rows (primary key
+            # starts with steam_id) instead of walking every match.
+            from_ = scoreboard_table.join(
+                scoreboard_total_table,
+                scoreboard_total_table.c.match_id ==
+                scoreboard_table.c.match_id
+            )
+            conditions.append(scoreboard_table.c.steam_id == self.steam_id)
+        else:
+            from_ = scoreboard_total_table
+
+        if cursor:
+            created, match_id = _decode_cursor(cursor)
+            # Row value comparisons aren't range scanned by every
+            # backend, the expanded form is.
+            conditions.append(or_(
+                scoreboard_total_table.c.created < created,
+                and_(
+                    scoreboard_total_table.c.created == created,
+                    scoreboard_total_table.c.match_id < match_id
+                )
+            ))
+
+        query = select([
+            scoreboard_total_table.c.match_id,
+            scoreboard_total_table.c.created,
+            scoreboard_total_table.c.status,
+            scoreboard_total_table.c.demo_status,
+            scoreboard_total_table.c.map,
+            scoreboard_total_table.c.team_1_name,
+            scoreboard_total_table.c.team_2_name,
+            scoreboard_total_table.c.team_1_score,
+            scoreboard_total_table.c.team_2_score,
+            scoreboard_total_table.c.team_1_side,
+            scoreboard_total_table.c.team_2_side
+        ]).select_from(from_).where(
+            and_(*conditions)
+        ).order_by(
+            scoreboard_total_table.c.created.desc(),
+            scoreboard_total_table.c.match_id.desc()
+        ).limit(limit + 1)
+
+        rows = await READS.database().fetch_all(query)
+
+        matches = [
+            MatchModel(
+                match_id=row["match_id"],
+                created=row["created"],
+                status=row["status"],
+                demo_status=row["demo_status"],
+                map_=row["map"],
+                team_1_name=row["team_1_name"],
+                team_2_name=row["team_2_name"],
+                team_1_score=row["team_1_score"],
+                team_2_score=row["team_2_score"],
+                team_1_side=row["team_1_side"],
+                team_2_side=row["team_2_side"]
+            )
+            for row in rows[:limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = matches[-1]
+            next_cursor = _encode_cursor(last.created, last.match_id)
+
+        return matches, next_cursor
@@ -0,0 +1,208 @@
+import asyncio
+
+from typing import Dict, Optional, Set
+
+from ...errors import MatchNotFound
+from ...env import LIVE_SETTINGS
+
+from ..metrics import background
+
+from . import Match
+from .cache import SCOREBOARD_CACHE
+
+
+def _players(schema: dict) -> Dict[str, dict]:
+    return {
+        player["steam_id"]: player
+        for player in schema["team_1"] + schema["team_2"]
+    }
+
+
+def scoreboard_diff(old: dict, new: dict) -> Optional[dict]:
+    """Difference between two scoreboard API schemas.
+
+    Parameters
+    ----------
+    old : dict
+    new : dict
+
+    Returns
+    -------
+    dict
+        "match" contains changed match fields, "players" contains
+        changed players keyed by SteamID64, None if they left.
+        None if nothing changed.
+    """
+
+    match = {
+        key: value for key, value in new.items()
+        if key not in ("team_1", "team_2") and old.get(key) != value
+    }
+
+    old_players = _players(old)
+    new_players = _players(new)
+
+    players = {
+        steam_id: player for steam_id, player in new_players.items()
+        if old_players.get(steam_id) != player
+    }
+    for steam_id in old_players.keys() - new_players.keys():
+        players[steam_id] = None
+
+    if not match and not players:
+        return None
+
+    return {"match": match, "players": players}
+
+
+class ScoreboardBroadcaster:
+    def __init__(self, queue_size: int, debounce: float,
+                 refresh_interval: float) -> None:
+        """Pushes scoreboard changes to viewers, the scoreboard is
+        computed once per change no matter how many are watching.
+
+        Parameters
+        ----------
+        queue_size : int
+        debounce : float
+        refresh_interval : float
+        """
+
+        self._queue_size = queue_size
+        self._debounce = debounce
+        self._refresh_interval = refresh_interval
+
+        self.__subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self.__last: Dict[str, dict] = {}
+        self.__scheduled: Set[str] = set()
+        self.__tasks: Set[asyncio.Task] = set()
+        self.__refresher: Optional[asyncio.Task] = None
+
+    @property
+    def viewers(self) -> int:
+        """Amount of viewers across all matches.
+
+        Returns
+        -------
+        int
+        """
+
+        return sum(len(queues) for queues in self.__subscribers.values())
+
+    async def subscribe(self, match_id: str) -> asyncio.Queue:
+        """Subscribe to a match, the full scoreboard is the first message
+        followed by diffs.
+
+        Parameters
+        ----------
+        match_id : str
+
+        Returns
+        -------
+        asyncio.Queue
+
+        Raises
+        ------
+        MatchNotFound
+        """
+
+        schema = await Match(match_id).scoreboard_schema()
+        # A newer scoreboard might of been pushed while loading.
+        schema = self.__last.setdefault(match_id, schema)
+
+        queue = asyncio.Queue(self._queue_size)
+        queue.put_nowait({"type": "scoreboard", "data": schema})
+        self.__subscribers.setdefault(match_id, set()).add(queue)
+
+        if self.__refresher is None or self.__refresher.done():
+            self.__refresher = asyncio.create_task(
+                background(self.__refresh_loop())
+            )
+
+        return queue
+
+    def unsubscribe(self, match_id: str, queue: asyncio.Queue) -> None:
+        """Stop receiving updates.
+
+        Parameters
+        ----------
+        match_id : str
+        queue : asyncio.Queue
+        """
+
+        queues = self.__subscribers.get(match_id)
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self.__subscribers[match_id]
+            self.__last.pop(match_id, None)
+
+    def notify(self, match_id: str) -> None:
+        """Called when a match has changed.
+
+        Parameters
+        ----------
+        match_id : str
+        """
+
+        if (match_id not in self.__subscribers
+                or match_id in self.__scheduled):
+            return
+
+        self.__scheduled.add(match_id)
+        asyncio.get_running_loop().call_later(
+            self._debounce, self.__start_publish, match_id
+        )
+
+    def __start_publish(self, match_id: str) -> None:
+        task = asyncio.create_task(background(self.__publish(match_id)))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __publish(self, match_id: str) -> None:
+        # Changes from now on schedule another publish.
+        self.__scheduled.discard(match_id)
+
+        try:
+            schema = await Match(match_id).scoreboard_schema()
+        except MatchNotFound:
+            return
+
+        last = self.__last.get(match_id)
+        queues = self.__subscribers.get(match_id)
+        if last is None or not queues:
+            return
+
+        diff = scoreboard_diff(last, schema)
+        if diff is None:
+            return
+
+        self.__last[match_id] = schema
+
+        message = {"type": "diff", "data": diff}
+        for queue in queues:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Viewer is too far behind, start them over.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "scoreboard", "data": schema})
+
+    async def __refresh_loop(self) -> None:
+        # Picks up changes made by other workers.
+        while self.__subscribers:
+            await asyncio.sleep(self._refresh_interval)
+            for match_id in list(self.__subscribers):
+                self.notify(match_id)
+
+
+LIVE_SCOREBOARDS = ScoreboardBroadcaster(
+    LIVE_SETTINGS._queue_size,
+    LIVE_SETTINGS._debounce,
+    LIVE_SETTINGS._refresh_interval
+)
+
+SCOREBOARD_CACHE.listeners.append(LIVE_SCOREBOARDS.notify)
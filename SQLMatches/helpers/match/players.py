@@ -7,9 +7,12 @@ from sqlalchemy.sql.elements import ClauseElement
 from ...tables import scoreboard_table, spectator_table
 from ...resources import Session
 from ...errors import MatchNotFound
-from ...env import STEAM_SETTINGS
 
 from ..sql_on_conflict import on_scoreboard_conflict, on_statistic_conflict
+from ..steam import player_summaries
+from ..database import READS
+
+from .cache import SCOREBOARD_CACHE
 
 
 if TYPE_CHECKING:
@@ -33,17 +36,7 @@ class MatchPlayers:
         return self.__players
 
     async def __format_stats(self) -> dict:
-        steam_data = {}
-        async with Session.requests.get(
-            STEAM_SETTINGS._api_url +
-            (f"ISteamUser/GetPlayerSummaries/v2/?key={STEAM_SETTINGS._api_key}"
-             f"&steamids={','.join(self.players)}")
-        ) as resp:
-            if resp.status == 200:
-                for user in (await resp.json())["response"]["players"]:
-                    steam_data[user["steamid"]] = user
-
-        return steam_data
+        return await player_summaries(self.players)
 
     def __format_player(self, steam_id: str, steam_data: dict,
                         now: datetime) -> dict:
@@ -62,6 +55,9 @@ class MatchPlayers:
             "shots_fired": 0,
             "shots_hit": 0,
             "mvps": 0,
+            "kdr": 0,
+            "hs_percentage": 0,
+            "hit_percentage": 0,
             "created": now
         }
 
@@ -80,7 +76,7 @@ class MatchPlayers:
         MatchNotFound
         """
 
-        if not await self.__upper.exists():
+        if not await self.__upper.exists(primary=True):
             raise MatchNotFound()
 
         steam_data = await self.__format_stats()
@@ -106,6 +102,8 @@ class MatchPlayers:
             specs
         )
 
+        READS.written(self.__upper.match_id)
+
     async def add_as_player(self, team: int) -> None:
         """Add the players to the match.
 
@@ -119,7 +117,7 @@ class MatchPlayers:
         MatchNotFound
         """
 
-        if not await self.__upper.exists():
+        if not await self.__upper.exists(primary=True):
             raise MatchNotFound()
 
         stats = []
@@ -157,6 +155,8 @@ class MatchPlayers:
             scoreboard
         )
 
+        await SCOREBOARD_CACHE.invalidate(self.__upper.match_id)
+
     async def remove_from_match(self, spectator: bool = False) -> None:
         """Remove players / spectators from match.
 
@@ -170,12 +170,16 @@ class MatchPlayers:
             await Session.db.execute(scoreboard_table.delete(
                 self.__player_in_match_query
             ))
+
+            await SCOREBOARD_CACHE.invalidate(self.__upper.match_id)
         else:
             await Session.db.execute(spectator_table.delete(and_(
                 spectator_table.c.match_id == self.__upper.match_id,
                 spectator_table.c.steam_id.in_(self.players)
             )))
 
+            READS.written(self.__upper.match_id)
+
     async def who_in_match(self) -> List[str]:
         """list of players who have played in match.
 
@@ -187,12 +191,11 @@ class MatchPlayers:
 
         query = select([scoreboard_table.c.steam_id]).select_from(
             scoreboard_table
-        ).where(scoreboard_table.c.steam_id.in_(
-            self.__player_in_match_query
-        ))
+        ).where(self.__player_in_match_query)
 
         steam_ids = []
-        async for player in Session.db.iterate(query):
+        async for player in READS.database(
+                self.__upper.match_id).iterate(query):
             steam_ids.append(player["steam_id"])
 
         return steam_ids
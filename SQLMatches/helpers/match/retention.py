@@ -0,0 +1,307 @@
+import asyncio
+import logging
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+from sqlalchemy import select, func, and_, desc
+from sqlalchemy.sql.elements import ClauseElement
+
+from ...resources import Session
+from ...tables import (
+    scoreboard_total_table, demo_log_table, demo_upload_table
+)
+from ...errors import DemoUploadNotFound
+from ...env import DEMO_SETTINGS, RETENTION_SETTINGS
+
+from ..storage import DEMO_STORAGE
+from ..database import advisory_lock
+
+from . import Match
+from .cache import SCOREBOARD_CACHE
+from .demo import DEMO_CACHE
+
+
+logger = logging.getLogger(__name__)
+
+
+class DemoRetention:
+    def __init__(self, interval: float, max_age: float, max_size: int,
+                 keep_downloaded: int, batch_size: int,
+                 upload_max_age: float) -> None:
+        """Deletes demos past their retention in the background,
+        see RetentionSettings.
+
+        Parameters
+        ----------
+        interval : float
+        max_age : float
+        max_size : int
+        keep_downloaded : int
+        batch_size : int
+        upload_max_age : float
+        """
+
+        self._interval = interval
+        self._max_age = max_age
+        self._max_size = max_size
+        self._keep_downloaded = keep_downloaded
+        self._batch_size = batch_size
+        self._upload_max_age = upload_max_age
+
+        self.__task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.skipped = 0
+        self.errors = 0
+        self.demos_deleted = 0
+        self.bytes_reclaimed = 0
+        self.uploads_aborted = 0
+        self.last_run: Optional[datetime] = None
+
+    @property
+    def stats(self) -> dict:
+        """Collection counters.
+
+        Returns
+        -------
+        dict
+        """
+
+        return {
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "demos_deleted": self.demos_deleted,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "uploads_aborted": self.uploads_aborted,
+            "last_run": self.last_run
+        }
+
+    def start(self) -> None:
+        """Start collecting every interval.
+        """
+
+        if self._interval > 0 and (self.__task is None
+                                   or self.__task.done()):
+            self.__task = asyncio.create_task(self.__loop())
+
+    async def stop(self) -> None:
+        """Stop collecting.
+        """
+
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+        self.__task = None
+
+    async def __loop(self) -> None:
+        while True:
+            try:
+                await self.collect()
+            except Exception:
+                self.errors += 1
+                logger.exception("Demo retention failed")
+
+            await asyncio.sleep(self._interval)
+
+    async def __protected(self) -> Set[str]:
+        if self._keep_downloaded <= 0:
+            return set()
+
+        downloads = func.count(demo_log_table.c.log_id)
+
+        return {
+            row["match_id"] for row in await Session.db.fetch_all(
+                select([demo_log_table.c.match_id]).select_from(
+                    demo_log_table
+                ).group_by(demo_log_table.c.match_id).order_by(
+                    desc(downloads)
+                ).limit(self._keep_downloaded)
+            )
+        }
+
+    async def __candidates(self, excluded: Set[str],
+                           *conditions: ClauseElement) -> List:
+        """Oldest stored demos not excluded.
+        """
+
+        return await Session.db.fetch_all(
+            select([
+                scoreboard_total_table.c.match_id,
+                scoreboard_total_table.c.demo_size
+            ]).select_from(scoreboard_total_table).where(and_(
+                scoreboard_total_table.c.demo_status == 2,
+                scoreboard_total_table.c.match_id.notin_(excluded),
+                *conditions
+            )).order_by(
+                scoreboard_total_table.c.created,
+                scoreboard_total_table.c.match_id
+            ).limit(self._batch_size)
+        )
+
+    async def __delete(self, rows: List, excluded: Set[str]) -> int:
+        """Delete a batch of demos, failed deletes are excluded from
+        later batches.
+
+        Returns
+        -------
+        int
+            Bytes reclaimed.
+        """
+
+        results = await asyncio.gather(*[
+            DEMO_STORAGE.delete(row["match_id"] + DEMO_SETTINGS._extension)
+            for row in rows
+        ], return_exceptions=True)
+
+        deleted = []
+        reclaimed = 0
+        for row, result in zip(rows, results):
+            if isinstance(result, BaseException):
+                excluded.add(row["match_id"])
+                self.errors += 1
+                logger.error(
+                    "Deleting demo of %s failed", row["match_id"],
+                    exc_info=result
+                )
+            else:
+                deleted.append(row["match_id"])
+                reclaimed += row["demo_size"] or 0
+
+        if deleted:
+            await Session.db.execute(
+                scoreboard_total_table.update().where(
+                    scoreboard_total_table.c.match_id.in_(deleted)
+                ).values(demo_size=0, demo_raw_size=None, demo_status=3)
+            )
+
+            for match_id in deleted:
+                await DEMO_CACHE.invalidate(match_id)
+                await SCOREBOARD_CACHE.invalidate(match_id)
+
+        self.demos_deleted += len(deleted)
+        self.bytes_reclaimed += reclaimed
+
+        return reclaimed
+
+    async def __expire(self, excluded: Set[str]) -> int:
+        cutoff = datetime.now() - timedelta(seconds=self._max_age)
+
+        reclaimed = 0
+        while True:
+            rows = await self.__candidates(
+                excluded, scoreboard_total_table.c.created < cutoff
+            )
+            if not rows:
+                return reclaimed
+
+            reclaimed += await self.__delete(rows, excluded)
+
+    async def __enforce_size(self, excluded: Set[str]) -> int:
+        total = await Session.db.fetch_val(
+            select([
+                func.coalesce(func.sum(scoreboard_total_table.c.demo_size), 0)
+            ]).select_from(scoreboard_total_table).where(
+                scoreboard_total_table.c.demo_status == 2
+            )
+        )
+
+        reclaimed = 0
+        while total > self._max_size:
+            rows = await self.__candidates(excluded)
+            if not rows:
+                break
+
+            # Only as many of the oldest as needed to get under the limit.
+            batch = []
+            remaining = total
+            for row in rows:
+                batch.append(row)
+                remaining -= row["demo_size"] or 0
+                if remaining <= self._max_size:
+                    break
+
+            # Failed deletes are made up for by the next batch.
+            batch_reclaimed = await self.__delete(batch, excluded)
+            total -= batch_reclaimed
+            reclaimed += batch_reclaimed
+
+        return reclaimed
+
+    async def __abort_uploads(self) -> None:
+        cutoff = datetime.now() - timedelta(seconds=self._upload_max_age)
+
+        for row in await Session.db.fetch_all(
+                select([
+                    demo_upload_table.c.upload_id,
+                    demo_upload_table.c.match_id
+                ]).select_from(demo_upload_table).where(
+                    func.coalesce(
+                        demo_upload_table.c.updated,
+                        demo_upload_table.c.created
+                    ) < cutoff
+                )):
+            try:
+                await Match(row["match_id"]).upload(
+                    row["upload_id"]
+                ).abort()
+            except DemoUploadNotFound:
+                # Every worker collects, another aborted it first.
+                continue
+            except Exception:
+                self.errors += 1
+                logger.exception(
+                    "Aborting upload %s failed", row["upload_id"]
+                )
+                continue
+
+            self.uploads_aborted += 1
+
+    async def collect(self) -> int:
+        """Delete demos past their retention & abort stale uploads,
+        skipped if another worker is collecting.
+
+        Returns
+        -------
+        int
+            Bytes reclaimed.
+        """
+
+        # Every worker collects, only one at a time.
+        async with advisory_lock("sqlmatches.demo_retention") as acquired:
+            if not acquired:
+                self.skipped += 1
+                return 0
+
+            reclaimed = 0
+            excluded = await self.__protected()
+
+            if self._max_age > 0:
+                reclaimed += await self.__expire(excluded)
+
+            if self._max_size > 0:
+                reclaimed += await self.__enforce_size(excluded)
+
+            if self._upload_max_age > 0:
+                await self.__abort_uploads()
+
+        self.runs += 1
+        self.last_run = datetime.now()
+
+        return reclaimed
+
+
+DEMO_RETENTION = DemoRetention(
+    RETENTION_SETTINGS._interval,
+    RETENTION_SETTINGS._max_age,
+    RETENTION_SETTINGS._max_size,
+    RETENTION_SETTINGS._keep_downloaded,
+    RETENTION_SETTINGS._batch_size,
+    RETENTION_SETTINGS._upload_max_age
+)
@@ -0,0 +1,267 @@
+import os
+import shutil
+import aiofiles
+import aiofiles.os
+
+from hashlib import sha256
+from os import path
+from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterator, Dict, List
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import select, and_
+
+from ...resources import Session
+from ...tables import demo_upload_table
+from ...errors import (
+    MatchNotFound, DemoTooLarge, DemoCompressionDisabled,
+    DemoUploadNotFound, DemoChunkInvalid
+)
+from ...env import DEMO_SETTINGS
+
+from ..metrics import METRICS
+from ..storage.base import write_file
+
+
+if TYPE_CHECKING:
+    from . import Match
+
+
+def _chunk_sizes(pathway: str) -> Dict[int, int]:
+    sizes = {}
+    with os.scandir(pathway) as entries:
+        for entry in entries:
+            index, _, extension = entry.name.partition(".")
+            if extension == "chunk" and index.isdigit():
+                sizes[int(index)] = entry.stat().st_size
+
+    return sizes
+
+
+class DemoUpload:
+    def __init__(self, upper: "Match", upload_id: str) -> None:
+        """Resumable demo upload, the demo is uploaded in numbered
+        chunks which are only committed once their checksum matches.
+
+        Parameters
+        ----------
+        upper : Match
+        upload_id : str
+        """
+
+        self.__upper = upper
+        self.upload_id = upload_id
+        self._pathway = path.join(
+            DEMO_SETTINGS._pathway, "uploads", upload_id
+        )
+
+    def __chunk_pathway(self, index: int) -> str:
+        return path.join(self._pathway, f"{index}.chunk")
+
+    async def __session(self) -> dict:
+        row = await Session.db.fetch_one(
+            select([
+                demo_upload_table.c.chunk_size,
+                demo_upload_table.c.raw,
+                demo_upload_table.c.demo_status
+            ]).select_from(demo_upload_table).where(and_(
+                demo_upload_table.c.upload_id == self.upload_id,
+                demo_upload_table.c.match_id == self.__upper.match_id
+            ))
+        )
+
+        if not row:
+            raise DemoUploadNotFound()
+
+        return {
+            "chunk_size": row["chunk_size"],
+            "raw": bool(row["raw"]),
+            "demo_status": row["demo_status"]
+        }
+
+    async def __remove(self) -> None:
+        await Session.db.execute(demo_upload_table.delete().where(
+            demo_upload_table.c.upload_id == self.upload_id
+        ))
+        await aiofiles.os.wrap(shutil.rmtree)(self._pathway, True)
+
+    async def create(self, chunk_size: int, raw: bool = False) -> None:
+        """Start the upload, the demo status is processing until the
+        upload is finalized or aborted.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Size of every chunk in bytes, besides the last.
+        raw : bool, optional
+            If the demo is a uncompressed .dem, by default False
+
+        Raises
+        ------
+        MatchNotFound
+        DemoChunkInvalid
+        DemoCompressionDisabled
+        """
+
+        if not 0 < chunk_size <= DEMO_SETTINGS._upload_chunk_size:
+            raise DemoChunkInvalid()
+
+        if raw and not DEMO_SETTINGS._compression:
+            raise DemoCompressionDisabled()
+
+        if not await self.__upper.exists(primary=True):
+            raise MatchNotFound()
+
+        await aiofiles.os.makedirs(self._pathway, exist_ok=True)
+
+        previous = await self.__upper.demo._begin_upload()
+
+        await Session.db.execute(demo_upload_table.insert().values(
+            upload_id=self.upload_id,
+            match_id=self.__upper.match_id,
+            chunk_size=chunk_size,
+            raw=raw,
+            demo_status=previous,
+            created=datetime.now()
+        ))
+
+    async def chunks(self) -> List[int]:
+        """Indexes of committed chunks.
+
+        Returns
+        -------
+        List[int]
+
+        Raises
+        ------
+        DemoUploadNotFound
+        """
+
+        await self.__session()
+
+        return sorted(
+            await aiofiles.os.wrap(_chunk_sizes)(self._pathway)
+        )
+
+    @staticmethod
+    async def __coalesce(stream: AsyncIterator[bytes], offset: int,
+                         chunk_size: int) -> AsyncGenerator[bytes, None]:
+        """Small reads are coalesced into writes of the demo chunk size.
+        """
+
+        size = 0
+        buffer = bytearray()
+        async for data in stream:
+            size += len(data)
+            if size > chunk_size:
+                raise DemoChunkInvalid()
+            if offset + size > DEMO_SETTINGS._max_size:
+                raise DemoTooLarge()
+
+            buffer += data
+            if len(buffer) >= DEMO_SETTINGS._chunk_size:
+                yield bytes(buffer)
+                buffer = bytearray()
+
+        if buffer:
+            yield bytes(buffer)
+
+    async def put_chunk(self, index: int, offset: int, checksum: str,
+                        stream: AsyncIterator[bytes]) -> None:
+        """Upload a chunk, uploading a committed chunk again replaces it.
+
+        Parameters
+        ----------
+        index : int
+        offset : int
+            Offset of the chunk in the demo, must be index * chunk_size.
+        checksum : str
+            Hex SHA256 of the chunk.
+        stream : AsyncIterator[bytes]
+
+        Raises
+        ------
+        DemoUploadNotFound
+        DemoChunkInvalid
+        DemoTooLarge
+        """
+
+        chunk_size = (await self.__session())["chunk_size"]
+
+        if index < 0 or offset != index * chunk_size:
+            raise DemoChunkInvalid()
+
+        temp_pathway = f"{self.__chunk_pathway(index)}.{uuid4().hex}.part"
+        try:
+            hash_ = sha256()
+            size = await write_file(
+                temp_pathway,
+                self.__coalesce(stream, offset, chunk_size),
+                hash_
+            )
+
+            if size == 0 or hash_.hexdigest() != checksum.lower():
+                raise DemoChunkInvalid()
+
+            await aiofiles.os.replace(
+                temp_pathway, self.__chunk_pathway(index)
+            )
+        except BaseException:
+            try:
+                await aiofiles.os.remove(temp_pathway)
+            except OSError:
+                pass
+            raise
+
+        await Session.db.execute(demo_upload_table.update().where(
+            demo_upload_table.c.upload_id == self.upload_id
+        ).values(updated=datetime.now()))
+
+        METRICS.demo("upload", size)
+
+    async def __read_chunks(self, count: int
+                            ) -> AsyncGenerator[bytes, None]:
+        for index in range(count):
+            async with aiofiles.open(self.__chunk_pathway(index), "rb") as f_:
+                while True:
+                    chunk = await f_.read(DEMO_SETTINGS._chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+
+    async def finalize(self) -> None:
+        """Join the chunks into the demo.
+
+        Raises
+        ------
+        DemoUploadNotFound
+        DemoChunkInvalid
+            Chunks are missing or aren't the chunk size.
+        DemoTooLarge
+        """
+
+        session = await self.__session()
+        sizes = await aiofiles.os.wrap(_chunk_sizes)(self._pathway)
+
+        count = len(sizes)
+        if (count == 0 or max(sizes) != count - 1 or any(
+                sizes[index] != session["chunk_size"]
+                for index in range(count - 1))):
+            raise DemoChunkInvalid()
+
+        await self.__upper.demo._commit(
+            self.__read_chunks(count), session["raw"]
+        )
+
+        await self.__remove()
+
+    async def abort(self) -> None:
+        """Abort the upload & remove its chunks.
+
+        Raises
+        ------
+        DemoUploadNotFound
+        """
+
+        session = await self.__session()
+        await self.__remove()
+        await self.__upper.demo._reset_status(session["demo_status"])
@@ -0,0 +1,81 @@
+import json
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple
+from falcon import media
+
+from ..env import MEDIA_SETTINGS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    # Datetimes are sent as Unix timestamps.
+    if isinstance(value, datetime):
+        return value.timestamp()
+
+    raise TypeError(f"{type(value).__name__} isn't JSON serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+# Encoder name to dumps & loads, dumps returns UTF-8 JSON.
+ENCODERS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[Any], Any]]] = {
+    "json": (_json_dumps, json.loads)
+}
+
+if orjson is not None:
+    ENCODERS["orjson"] = (
+        lambda value: orjson.dumps(
+            value, default=_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME
+        ),
+        orjson.loads
+    )
+
+
+def _encoder(name: str) -> Tuple[Callable[[Any], bytes],
+                                 Callable[[Any], Any]]:
+    if name == "orjson" and orjson is None:
+        raise ImportError("The orjson package is required for orjson.")
+
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown JSON encoder {name}")
+
+    return ENCODERS[name]
+
+
+dumps, loads = _encoder(
+    MEDIA_SETTINGS._json_encoder or (
+        "orjson" if orjson is not None else "json"
+    )
+)
+
+JSON_HANDLER = media.JSONHandler(dumps=dumps, loads=loads)
+JSON_HANDLER_WS = media.JSONHandlerWS(
+    dumps=lambda value: dumps(value).decode(), loads=loads
+)
+
+
+def envelope(data: bytes) -> bytes:
+    """Wrap encoded data in the response format,
+    so encoded data can be sent as is.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded JSON.
+
+    Returns
+    -------
+    bytes
+    """
+
+    return b'{"data":' + data + b',"error":null}'
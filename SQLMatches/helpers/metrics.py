@@ -0,0 +1,337 @@
+from contextvars import ContextVar, Token
+from datetime import datetime
+from time import perf_counter
+from typing import (
+    AsyncIterator, Awaitable, Dict, List, Optional, Tuple, TypeVar
+)
+
+from ..env import METRICS_SETTINGS
+
+
+T = TypeVar("T")
+
+# Upper bounds of latency histograms in seconds.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        """Cumulative histogram of latencies.
+        """
+
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def observe(self, seconds: float) -> None:
+        """Record a latency.
+
+        Parameters
+        ----------
+        seconds : float
+        """
+
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+
+    @property
+    def stats(self) -> dict:
+        """Count, total & max in seconds & count per bucket.
+
+        Returns
+        -------
+        dict
+        """
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "buckets": dict(zip(LATENCY_BUCKETS, self.buckets))
+        }
+
+
+class RequestMetrics:
+    __slots__ = (
+        "start", "queries", "query_seconds",
+        "steam_requests", "steam_seconds"
+    )
+
+    def __init__(self) -> None:
+        """Work done by the request being handled.
+        """
+
+        self.start = perf_counter()
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.steam_requests = 0
+        self.steam_seconds = 0.0
+
+
+class RouteMetrics:
+    def __init__(self) -> None:
+        """Totals of the requests to a route.
+        """
+
+        self.latency = LatencyHistogram()
+        self.statuses: Dict[int, int] = {}
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.steam_requests = 0
+        self.steam_seconds = 0.0
+
+
+_REQUEST: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+class Metrics:
+    def __init__(self, enabled: bool) -> None:
+        """Per route request metrics, if not enabled nothing is
+        recorded & every method returns straight away.
+
+        Parameters
+        ----------
+        enabled : bool
+        """
+
+        self.enabled = enabled
+
+        # Keyed by method & route template.
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.steam_requests = 0
+        self.steam_seconds = 0.0
+        self.demo_bytes = {"download": 0, "upload": 0}
+
+    def start_request(self) -> Tuple[RequestMetrics, Token]:
+        """Start recording a request, work done in the current
+        context is attributed to it.
+
+        Returns
+        -------
+        RequestMetrics
+        Token
+            Passed to end_request.
+        """
+
+        request = RequestMetrics()
+        return request, _REQUEST.set(request)
+
+    def end_request(self, request: RequestMetrics, token: Token,
+                    method: str, route: str, status: int) -> None:
+        """Record a handled request.
+
+        Parameters
+        ----------
+        request : RequestMetrics
+        token : Token
+        method : str
+        route : str
+            Template of the route, not the path, so the amount of
+            routes recorded is bounded.
+        status : int
+        """
+
+        _REQUEST.reset(token)
+
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+
+        metrics.latency.observe(perf_counter() - request.start)
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        metrics.queries += request.queries
+        metrics.query_seconds += request.query_seconds
+        metrics.steam_requests += request.steam_requests
+        metrics.steam_seconds += request.steam_seconds
+
+    def query(self, seconds: float) -> None:
+        """Record a database query.
+
+        Parameters
+        ----------
+        seconds : float
+        """
+
+        if not self.enabled:
+            return
+
+        request = _REQUEST.get()
+        if request is not None:
+            request.queries += 1
+            request.query_seconds += seconds
+
+    def steam(self, seconds: float) -> None:
+        """Record a Steam API request, lookups are batched so requests
+        are attributed by steam_wait instead.
+
+        Parameters
+        ----------
+        seconds : float
+        """
+
+        if self.enabled:
+            self.steam_requests += 1
+            self.steam_seconds += seconds
+
+    def steam_wait(self, seconds: float) -> None:
+        """Record the current request waiting on a Steam lookup.
+
+        Parameters
+        ----------
+        seconds : float
+        """
+
+        if not self.enabled:
+            return
+
+        request = _REQUEST.get()
+        if request is not None:
+            request.steam_requests += 1
+            request.steam_seconds += seconds
+
+    def demo(self, direction: str, size: int) -> None:
+        """Record demo bytes streamed.
+
+        Parameters
+        ----------
+        direction : str
+            download or upload
+        size : int
+        """
+
+        if self.enabled:
+            self.demo_bytes[direction] += size
+
+    async def count_stream(self, stream: AsyncIterator[bytes],
+                           direction: str) -> AsyncIterator[bytes]:
+        """Record demo bytes of a stream as it's read.
+
+        Parameters
+        ----------
+        stream : AsyncIterator[bytes]
+        direction : str
+
+        Yields
+        ------
+        bytes
+        """
+
+        async for chunk in stream:
+            self.demo_bytes[direction] += len(chunk)
+            yield chunk
+
+
+async def background(awaitable: Awaitable[T]) -> T:
+    """Await without attributing work to a request, wraps the
+    coroutines of background tasks as tasks inherit the request
+    they're created in.
+
+    Parameters
+    ----------
+    awaitable : Awaitable[T]
+
+    Returns
+    -------
+    T
+    """
+
+    # Only changes the context of the task running this.
+    _REQUEST.set(None)
+    return await awaitable
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace(
+        "\n", "\\n"
+    )
+
+
+class Exposition:
+    def __init__(self, prefix: str = "sqlmatches_") -> None:
+        """Builds metrics in the Prometheus text format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefixed to every metric, by default "sqlmatches_"
+        """
+
+        self._prefix = prefix
+        self.__lines: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.__lines) + "\n"
+
+    def metric(self, name: str, type_: str, help_: str) -> None:
+        """Start a metric, samples of it are added after.
+
+        Parameters
+        ----------
+        name : str
+        type_ : str
+            counter, gauge or histogram
+        help_ : str
+        """
+
+        self.__lines.append(f"# HELP {self._prefix}{name} {help_}")
+        self.__lines.append(f"# TYPE {self._prefix}{name} {type_}")
+
+    def sample(self, name: str, value: Optional[float],
+               **labels: object) -> None:
+        """Add a sample, None values are left out.
+
+        Parameters
+        ----------
+        name : str
+        value : Optional[float]
+            Datetimes are added as Unix timestamps.
+        **labels : object
+        """
+
+        if value is None:
+            return
+
+        if isinstance(value, datetime):
+            value = value.timestamp()
+
+        label_text = ",".join(
+            f"{key}=\"{_escape(str(label))}\""
+            for key, label in labels.items()
+        )
+
+        self.__lines.append("{}{}{} {}".format(
+            self._prefix,
+            name,
+            "{" + label_text + "}" if label_text else "",
+            float(value)
+        ))
+
+    def histogram(self, name: str, histogram: LatencyHistogram,
+                  **labels: object) -> None:
+        """Add the samples of a histogram.
+
+        Parameters
+        ----------
+        name : str
+        histogram : LatencyHistogram
+        **labels : object
+        """
+
+        for bound, count in zip(LATENCY_BUCKETS, histogram.buckets):
+            self.sample(f"{name}_bucket", count, **labels, le=bound)
+        self.sample(f"{name}_bucket", histogram.count, **labels, le="+Inf")
+        self.sample(f"{name}_sum", histogram.total, **labels)
+        self.sample(f"{name}_count", histogram.count, **labels)
+
+
+METRICS = Metrics(METRICS_SETTINGS._enabled)
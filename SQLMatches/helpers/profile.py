@@ -0,0 +1,96 @@
+from typing import Dict, List
+from sqlalchemy import select
+
+from ..tables import statistic_table
+from ..errors import ProfileNotFound
+from ..models.match import ProfileModel
+
+from .database import READS
+
+
+async def profiles(steam_ids: List[str]) -> Dict[str, ProfileModel]:
+    """Get the profiles of many players in one query.
+
+    Parameters
+    ----------
+    steam_ids : List[str]
+        SteamID64s
+
+    Returns
+    -------
+    Dict[str, ProfileModel]
+        Profiles by SteamID64, players without one are left out.
+    """
+
+    if not steam_ids:
+        return {}
+
+    query = select([
+        statistic_table.c.steam_id,
+        statistic_table.c.name,
+        statistic_table.c.pfp,
+        statistic_table.c.kills,
+        statistic_table.c.headshots,
+        statistic_table.c.assists,
+        statistic_table.c.deaths,
+        statistic_table.c.shots_fired,
+        statistic_table.c.shots_hit,
+        statistic_table.c.mvps,
+        statistic_table.c.created,
+        statistic_table.c.kdr,
+        statistic_table.c.hs_percentage,
+        statistic_table.c.hit_percentage
+    ]).select_from(statistic_table).where(
+        statistic_table.c.steam_id.in_(set(steam_ids))
+    )
+
+    return {
+        row["steam_id"]: ProfileModel(
+            name=row["name"],
+            steam_id=row["steam_id"],
+            kills=row["kills"],
+            headshots=row["headshots"],
+            assists=row["assists"],
+            deaths=row["deaths"],
+            pfp=row["pfp"],
+            shots_fired=row["shots_fired"],
+            shots_hit=row["shots_hit"],
+            mvps=row["mvps"],
+            created=row["created"],
+            kdr=row["kdr"],
+            hs_percentage=row["hs_percentage"],
+            hit_percentage=row["hit_percentage"]
+        )
+        for row in await READS.database().fetch_all(query)
+    }
+
+
+class Profile:
+    def __init__(self, steam_id: str) -> None:
+        """Interact with a player's profile.
+
+        Parameters
+        ----------
+        steam_id : str
+            SteamID64
+        """
+
+        self.steam_id = steam_id
+
+    async def get(self) -> ProfileModel:
+        """Get the profile.
+
+        Returns
+        -------
+        ProfileModel
+
+        Raises
+        ------
+        ProfileNotFound
+        """
+
+        found = await profiles([self.steam_id])
+        if self.steam_id not in found:
+            raise ProfileNotFound()
+
+        return found[self.steam_id]
@@ -1,97 +1,156 @@
+from typing import Callable, Dict, List
+from sqlalchemy import Table, case, and_, func, literal_column
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql.elements import ClauseElement
 
-from ..tables import scoreboard_table, statistic_table
+from ..tables import scoreboard_table, statistic_table, scoreboard_total_table
 from ..resources import Session
 
 
-def on_statistic_conflict() -> ClauseElement:
-    """Used for updating a statistics on conflict.
+def _on_conflict(table: Table, index_elements: List[str],
+                 set_: Callable[[Table], Dict[str, ClauseElement]]
+                 ) -> ClauseElement:
+    """Dialect aware insert, what to update on conflict
+    is built by `set_` using the proposed row.
     """
 
-    if Session.db.url.dialect == "mysql":
-        query_insert = mysql_insert(statistic_table)
-        return query_insert.on_duplicate_key_update(
-            name=query_insert.inserted.name,
-            kills=statistic_table.c.kills + query_insert.inserted.kills,
-            headshots=statistic_table.c.headshots +
-            query_insert.inserted.headshots,
-            assists=statistic_table.c.assists + query_insert.inserted.assists,
-            deaths=statistic_table.c.deaths + query_insert.inserted.deaths,
-            shots_fired=statistic_table.c.shots_fired +
-            query_insert.inserted.shots_fired,
-            shots_hit=statistic_table.c.shots_hit +
-            query_insert.inserted.shots_hit,
-            mvps=statistic_table.c.mvps + query_insert.inserted.mvps
-        )
-    elif Session.db.url.dialect == "psycopg2":
-        query_insert = postgresql_insert(statistic_table)
-        return query_insert.on_conflict_do_update(
-            set_=dict(
-                name=query_insert.inserted.name,
-                kills=statistic_table.c.kills + query_insert.inserted.kills,
-                headshots=statistic_table.c.headshots +
-                query_insert.inserted.headshots,
-                assists=statistic_table.c.assists +
-                query_insert.inserted.assists,
-                deaths=statistic_table.c.deaths + query_insert.inserted.deaths,
-                shots_fired=statistic_table.c.shots_fired +
-                query_insert.inserted.shots_fired,
-                shots_hit=statistic_table.c.shots_hit +
-                query_insert.inserted.shots_hit,
-                mvps=statistic_table.c.mvps + query_insert.inserted.mvps
+    dialect = Session.db.url.dialect
+
+    if dialect == "mysql":
+        query_insert = mysql_insert(table)
+        values = set_(query_insert.inserted)
+        if not values:
+            # MySQL has no "do nothing", so set the key to itself.
+            values = {index_elements[0]: table.c[index_elements[0]]}
+
+        # Assigned in order, as MySQL sees columns assigned before.
+        return query_insert.on_duplicate_key_update(list(values.items()))
+    elif dialect in ("postgresql", "sqlite"):
+        query_insert = (
+            postgresql_insert if dialect == "postgresql" else sqlite_insert
+        )(table)
+        values = set_(query_insert.excluded)
+        if not values:
+            return query_insert.on_conflict_do_nothing(
+                index_elements=index_elements
             )
+
+        return query_insert.on_conflict_do_update(
+            index_elements=index_elements,
+            set_=values
         )
     else:
-        return statistic_table.insert  # type: ignore
+        return table.insert()
+
+
+def _ratio(numerator: ClauseElement, denominator: ClauseElement,
+           scale: str) -> ClauseElement:
+    """numerator / denominator * scale rounded to 2 places,
+    0 if either is 0. Same as models.match.derived_stats.
+    """
+
+    # A numeric literal so the division isn't integer division
+    # & ROUND accepts it on PostgreSQL.
+    return case(
+        [(and_(numerator > 0, denominator > 0), func.round(
+            numerator * literal_column(scale) / denominator, 2
+        ))],
+        else_=0
+    )
+
+
+def derived_stats(kills: ClauseElement, deaths: ClauseElement,
+                  headshots: ClauseElement, shots_hit: ClauseElement,
+                  shots_fired: ClauseElement) -> Dict[str, ClauseElement]:
+    """Ratios of stats to store alongside them.
+
+    Returns
+    -------
+    Dict[str, ClauseElement]
+        kdr, hs_percentage & hit_percentage
+    """
+
+    return {
+        "kdr": _ratio(kills, deaths, "1.0"),
+        "hs_percentage": _ratio(headshots, kills, "100.0"),
+        "hit_percentage": _ratio(shots_hit, shots_fired, "100.0")
+    }
+
+
+def on_statistic_conflict(profile: bool = True) -> ClauseElement:
+    """Used for updating a statistics on conflict.
+
+    Parameters
+    ----------
+    profile : bool, optional
+        If False the name isn't overwritten, used when only
+        applying stat deltas, by default True
+    """
+
+    return _on_conflict(
+        statistic_table,
+        ["steam_id"],
+        lambda inserted: dict(
+            **({"name": inserted.name} if profile else {}),
+            # Before the stats, as MySQL would use the updated ones.
+            **derived_stats(
+                statistic_table.c.kills + inserted.kills,
+                statistic_table.c.deaths + inserted.deaths,
+                statistic_table.c.headshots + inserted.headshots,
+                statistic_table.c.shots_hit + inserted.shots_hit,
+                statistic_table.c.shots_fired + inserted.shots_fired
+            ),
+            kills=statistic_table.c.kills + inserted.kills,
+            headshots=statistic_table.c.headshots + inserted.headshots,
+            assists=statistic_table.c.assists + inserted.assists,
+            deaths=statistic_table.c.deaths + inserted.deaths,
+            shots_fired=statistic_table.c.shots_fired + inserted.shots_fired,
+            shots_hit=statistic_table.c.shots_hit + inserted.shots_hit,
+            mvps=statistic_table.c.mvps + inserted.mvps
+        )
+    )
 
 
 def on_scoreboard_conflict() -> ClauseElement:
     """Used for updating a player on a scoreboard on conflict.
     """
 
-    if Session.db.url.dialect == "mysql":
-        query_insert = mysql_insert(scoreboard_table)
-        return query_insert.on_duplicate_key_update(
-            team=query_insert.inserted.team,
-            alive=query_insert.inserted.alive,
-            ping=query_insert.inserted.ping,
-            kills=scoreboard_table.c.kills + query_insert.inserted.kills,
-            headshots=scoreboard_table.c.headshots +
-            query_insert.inserted.headshots,
-            assists=scoreboard_table.c.assists + query_insert.inserted.assists,
-            deaths=scoreboard_table.c.deaths + query_insert.inserted.deaths,
-            shots_fired=scoreboard_table.c.shots_fired +
-            query_insert.inserted.shots_fired,
-            shots_hit=scoreboard_table.c.shots_hit +
-            query_insert.inserted.shots_hit,
-            mvps=scoreboard_table.c.mvps + query_insert.inserted.mvps,
-            score=scoreboard_table.c.score + query_insert.inserted.score,
-            disconnected=query_insert.inserted.disconnected
-        )
-    elif Session.db.url.dialect == "psycopg2":
-        query_insert = postgresql_insert(scoreboard_table)
-        return query_insert.on_conflict_do_update(
-            set_=dict(
-                team=query_insert.inserted.team,
-                alive=query_insert.inserted.alive,
-                ping=query_insert.inserted.ping,
-                kills=scoreboard_table.c.kills + query_insert.inserted.kills,
-                headshots=scoreboard_table.c.headshots +
-                query_insert.inserted.headshots,
-                assists=scoreboard_table.c.assists +
-                query_insert.inserted.assists,
-                deaths=scoreboard_table.c.deaths +
-                query_insert.inserted.deaths,
-                shots_fired=scoreboard_table.c.shots_fired +
-                query_insert.inserted.shots_fired,
-                shots_hit=scoreboard_table.c.shots_hit +
-                query_insert.inserted.shots_hit,
-                mvps=scoreboard_table.c.mvps + query_insert.inserted.mvps,
-                score=scoreboard_table.c.score + query_insert.inserted.score,
-                disconnected=query_insert.inserted.disconnected
-            )
+    return _on_conflict(
+        scoreboard_table,
+        ["steam_id", "match_id"],
+        lambda inserted: dict(
+            team=inserted.team,
+            alive=inserted.alive,
+            ping=inserted.ping,
+            kills=scoreboard_table.c.kills + inserted.kills,
+            headshots=scoreboard_table.c.headshots + inserted.headshots,
+            assists=scoreboard_table.c.assists + inserted.assists,
+            deaths=scoreboard_table.c.deaths + inserted.deaths,
+            shots_fired=scoreboard_table.c.shots_fired + inserted.shots_fired,
+            shots_hit=scoreboard_table.c.shots_hit + inserted.shots_hit,
+            mvps=scoreboard_table.c.mvps + inserted.mvps,
+            score=scoreboard_table.c.score + inserted.score,
+            disconnected=inserted.disconnected
         )
-    else:
-        return scoreboard_table.insert  # type: ignore
+    )
+
+
+def on_scoreboard_total_conflict(columns: List[str]) -> ClauseElement:
+    """Used for creating a match or updating the given columns
+    if it already exists.
+
+    Parameters
+    ----------
+    columns : List[str]
+        Columns to overwrite on conflict.
+    """
+
+    return _on_conflict(
+        scoreboard_total_table,
+        ["match_id"],
+        lambda inserted: {
+            column: inserted[column] for column in columns
+        }
+    )
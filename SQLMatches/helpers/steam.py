@@ -0,0 +1,229 @@
+import asyncio
+import logging
+
+from time import perf_counter
+from typing import Dict, List, Optional, Set
+
+from ..resources import Session
+from ..env import STEAM_SETTINGS, CACHE_SETTINGS
+
+from .cache import TTLCache
+from .metrics import METRICS, background
+
+
+logger = logging.getLogger(__name__)
+
+
+class SteamClient:
+    # Max amount of IDs GetPlayerSummaries accepts per call.
+    chunk_size = 100
+
+    def __init__(self, api_key: str, api_url: str,
+                 batch_window: float) -> None:
+        """Batches player summary lookups, lookups within `batch_window`
+        are sent together in chunks of `chunk_size` & lookups for a ID
+        already being fetched share the same request.
+
+        Parameters
+        ----------
+        api_key : str
+        api_url : str
+        batch_window : float
+            Seconds to collect lookups for.
+        """
+
+        self._api_key = api_key
+        self._api_url = api_url
+        self._batch_window = batch_window
+
+        self.__in_flight: Dict[str, asyncio.Future] = {}
+        self.__pending: List[str] = []
+        self.__flush_handle: Optional[asyncio.TimerHandle] = None
+        self.__tasks: Set[asyncio.Task] = set()
+
+    async def __fetch_chunk(self, steam_ids: List[str]) -> None:
+        # None resolves lookups as failed, so they aren't cached.
+        steam_data = None
+        start = perf_counter()
+        try:
+            async with Session.requests.get(
+                self._api_url + "ISteamUser/GetPlayerSummaries/v2/",
+                params={"key": self._api_key, "steamids": ",".join(steam_ids)}
+            ) as resp:
+                # Errors of the response include the URL & so API key.
+                if resp.status != 200:
+                    logger.error(
+                        "Fetching %d player summaries failed with status %d",
+                        len(steam_ids), resp.status
+                    )
+                    return
+
+                # Only used once the whole response is parsed.
+                parsed = {}
+                for user in (await resp.json(content_type=None)
+                             )["response"]["players"]:
+                    parsed[user["steamid"]] = {
+                        "name": user["personaname"],
+                        "avatarfull": user["avatarfull"]
+                    }
+
+                steam_data = parsed
+        except Exception:
+            logger.exception(
+                "Fetching %d player summaries failed", len(steam_ids)
+            )
+        finally:
+            METRICS.steam(perf_counter() - start)
+
+            for steam_id in steam_ids:
+                future = self.__in_flight.pop(steam_id)
+                if not future.done():
+                    future.set_result(
+                        steam_data.get(steam_id, {})
+                        if steam_data is not None else None
+                    )
+
+    def __flush(self) -> None:
+        pending = self.__pending
+        self.__pending = []
+        self.__flush_handle = None
+
+        for index in range(0, len(pending), self.chunk_size):
+            task = asyncio.create_task(background(
+                self.__fetch_chunk(pending[index:index + self.chunk_size])
+            ))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    async def player_summaries(self, steam_ids: List[str]
+                               ) -> Dict[str, Optional[dict]]:
+        """Get player summaries.
+
+        Parameters
+        ----------
+        steam_ids : List[str]
+            List of SteamID64s
+
+        Returns
+        -------
+        Dict[str, Optional[dict]]
+            Key is SteamID64, value contains name & avatarfull,
+            empty if Steam doesn't know the player or
+            None if the lookup failed.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        futures = {}
+        for steam_id in steam_ids:
+            if steam_id in futures:
+                continue
+
+            future = self.__in_flight.get(steam_id)
+            if future is None:
+                future = loop.create_future()
+                self.__in_flight[steam_id] = future
+                self.__pending.append(steam_id)
+
+            futures[steam_id] = future
+
+        if self.__pending:
+            if len(self.__pending) >= self.chunk_size:
+                if self.__flush_handle is not None:
+                    self.__flush_handle.cancel()
+                self.__flush()
+            elif self.__flush_handle is None:
+                self.__flush_handle = loop.call_later(
+                    self._batch_window, self.__flush
+                )
+
+        start = perf_counter()
+        # Shielded so one caller cancelling doesn't fail the others.
+        results = await asyncio.gather(*[
+            asyncio.shield(future) for future in futures.values()
+        ])
+        if futures:
+            METRICS.steam_wait(perf_counter() - start)
+
+        return dict(zip(futures.keys(), results))
+
+
+STEAM = SteamClient(
+    STEAM_SETTINGS._api_key,
+    STEAM_SETTINGS._api_url,
+    STEAM_SETTINGS._batch_window
+)
+
+# Keyed by SteamID64, value is the fields of the player summary we use
+# or a empty dict if Steam doesn't know the player.
+STEAM_PROFILE_CACHE = TTLCache(
+    CACHE_SETTINGS._steam_profile_ttl,
+    CACHE_SETTINGS._steam_profile_size,
+    CACHE_SETTINGS._steam_profile_stale
+)
+
+_refreshing: Set[str] = set()
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+async def _cache_summaries(steam_ids: List[str]) -> Dict[str, dict]:
+    steam_data = {}
+    for steam_id, profile in (
+            await STEAM.player_summaries(steam_ids)).items():
+        if profile is not None:
+            STEAM_PROFILE_CACHE.set(steam_id, profile)
+            if profile:
+                steam_data[steam_id] = profile
+
+    return steam_data
+
+
+async def _refresh(steam_ids: List[str]) -> None:
+    try:
+        await _cache_summaries(steam_ids)
+    finally:
+        _refreshing.difference_update(steam_ids)
+
+
+async def player_summaries(steam_ids: List[str]) -> Dict[str, dict]:
+    """Get Steam profiles, cached profiles are returned straight away
+    & stale ones are refreshed in the background.
+
+    Parameters
+    ----------
+    steam_ids : List[str]
+        List of SteamID64s
+
+    Returns
+    -------
+    Dict[str, dict]
+        Key is SteamID64, value contains name & avatarfull,
+        unknown players are left out.
+    """
+
+    steam_data = {}
+    missing = []
+    stale = []
+
+    for steam_id in steam_ids:
+        entry = STEAM_PROFILE_CACHE.get_stale(steam_id)
+        if entry is None:
+            missing.append(steam_id)
+            continue
+
+        profile, fresh = entry
+        if profile:
+            steam_data[steam_id] = profile
+        if not fresh and steam_id not in _refreshing:
+            stale.append(steam_id)
+
+    if stale:
+        _refreshing.update(stale)
+        task = asyncio.create_task(background(_refresh(stale)))
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+    if missing:
+        steam_data.update(await _cache_summaries(missing))
+
+    return steam_data
@@ -0,0 +1,37 @@
+from ...env import DEMO_SETTINGS, STORAGE_SETTINGS
+
+from .base import DemoStorage, DemoStat
+from .local import LocalStorage, ContentStorage
+from .s3 import S3Storage
+
+
+__all__ = [
+    "DemoStorage",
+    "DemoStat",
+    "LocalStorage",
+    "ContentStorage",
+    "S3Storage",
+    "DEMO_STORAGE"
+]
+
+
+def _storage() -> DemoStorage:
+    if STORAGE_SETTINGS._backend == "s3":
+        return S3Storage(
+            STORAGE_SETTINGS._s3_endpoint,
+            STORAGE_SETTINGS._s3_bucket,
+            STORAGE_SETTINGS._s3_region,
+            STORAGE_SETTINGS._s3_access_key,
+            STORAGE_SETTINGS._s3_secret_key,
+            STORAGE_SETTINGS._s3_part_size,
+            DEMO_SETTINGS._chunk_size
+        )
+    elif STORAGE_SETTINGS._backend == "content":
+        return ContentStorage(
+            DEMO_SETTINGS._pathway, DEMO_SETTINGS._chunk_size
+        )
+    else:
+        return LocalStorage(DEMO_SETTINGS._pathway, DEMO_SETTINGS._chunk_size)
+
+
+DEMO_STORAGE = _storage()
@@ -0,0 +1,164 @@
+import asyncio
+import aiofiles
+import aiofiles.os
+
+from abc import ABC, abstractmethod
+from os import fsync
+from datetime import datetime
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
+
+
+class DemoStat:
+    def __init__(self, size: int, etag: str,
+                 last_modified: datetime) -> None:
+        """Metadata of a stored demo.
+
+        Parameters
+        ----------
+        size : int
+            Size in bytes.
+        etag : str
+            Quoted strong ETag, changes whenever the demo does.
+        last_modified : datetime
+            Timezone aware.
+        """
+
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class DemoStorage(ABC):
+    """Interface for where demos are stored, keys are file names.
+    """
+
+    @abstractmethod
+    async def save(self, key: str, stream: AsyncIterator[bytes]) -> int:
+        """Store the stream under the key, replacing what was there
+        only once the whole stream has been stored.
+
+        Parameters
+        ----------
+        key : str
+        stream : AsyncIterator[bytes]
+
+        Returns
+        -------
+        int
+            Bytes stored.
+        """
+
+    @abstractmethod
+    async def stat(self, key: str) -> Optional[DemoStat]:
+        """Metadata of the demo, None if it doesn't exist.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        DemoStat
+        """
+
+    @abstractmethod
+    def read(self, key: str, start: int, length: int
+             ) -> AsyncIterator[bytes]:
+        """Read `length` bytes of the demo from `start`.
+
+        Parameters
+        ----------
+        key : str
+        start : int
+        length : int
+
+        Returns
+        -------
+        AsyncIterator[bytes]
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete the demo.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        bool
+            False if it didn't exist.
+        """
+
+    async def exists(self, key: str) -> bool:
+        """Return True if the demo exists False otherwise.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        bool
+        """
+
+        return await self.stat(key) is not None
+
+
+async def read_file(pathway: str, start: int, length: int,
+                    chunk_size: int) -> AsyncGenerator[bytes, None]:
+    """Read part of a file in chunks.
+    """
+
+    async with aiofiles.open(pathway, "rb") as f_:
+        await f_.seek(start)
+
+        # First read ends on a chunk boundary so the rest are aligned.
+        read_size = chunk_size - (start % chunk_size)
+        while length > 0:
+            chunk = await f_.read(min(read_size, length))
+            if not chunk:
+                break
+
+            length -= len(chunk)
+            read_size = chunk_size
+
+            yield chunk
+
+
+async def write_file(pathway: str, stream: AsyncIterator[bytes],
+                     hash_: Optional[Any] = None) -> int:
+    """Write the stream to a new file & fsync it, `hash_` is updated
+    with everything written if given.
+    """
+
+    size = 0
+    pending: Optional[asyncio.Future] = None
+
+    try:
+        async with aiofiles.open(pathway, "wb") as f_:
+            async for data in stream:
+                size += len(data)
+                if hash_ is not None:
+                    hash_.update(data)
+
+                # Writing the last chunk overlaps with producing the next.
+                if pending is not None:
+                    await pending
+                pending = asyncio.ensure_future(f_.write(data))
+
+            if pending is not None:
+                await pending
+
+            await f_.flush()
+            await aiofiles.os.wrap(fsync)(f_.fileno())
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except BaseException:
+                pass
+
+    return size
@@ -0,0 +1,249 @@
+import os
+import errno
+import shutil
+import threading
+import aiofiles
+import aiofiles.os
+
+from hashlib import sha256
+from os import path
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterator, Optional
+from contextlib import contextmanager
+from uuid import uuid4
+
+from .base import DemoStorage, DemoStat, read_file, write_file
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+
+async def _remove(pathway: str) -> None:
+    try:
+        await aiofiles.os.remove(pathway)
+    except OSError:
+        pass
+
+
+class LocalStorage(DemoStorage):
+    def __init__(self, pathway: str, chunk_size: int) -> None:
+        """Demos are stored as is in a directory.
+
+        Parameters
+        ----------
+        pathway : str
+        chunk_size : int
+            Bytes read from disk at a time.
+        """
+
+        self._pathway = pathway
+        self._chunk_size = chunk_size
+
+    def __file(self, key: str) -> str:
+        return path.join(self._pathway, key)
+
+    async def save(self, key: str, stream: AsyncIterator[bytes]) -> int:
+        temp_pathway = f"{self.__file(key)}.{uuid4().hex}.part"
+        try:
+            size = await write_file(temp_pathway, stream)
+            await aiofiles.os.replace(temp_pathway, self.__file(key))
+        except BaseException:
+            await _remove(temp_pathway)
+            raise
+
+        return size
+
+    async def stat(self, key: str) -> Optional[DemoStat]:
+        try:
+            stat = await aiofiles.os.stat(self.__file(key))
+        except FileNotFoundError:
+            return None
+
+        return DemoStat(
+            stat.st_size,
+            f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+            datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+        )
+
+    def read(self, key: str, start: int, length: int
+             ) -> AsyncIterator[bytes]:
+        return read_file(self.__file(key), start, length, self._chunk_size)
+
+    async def delete(self, key: str) -> bool:
+        try:
+            await aiofiles.os.remove(self.__file(key))
+        except FileNotFoundError:
+            return False
+
+        return True
+
+
+class ContentStorage(DemoStorage):
+    # Used when fcntl isn't available, only locks within the process.
+    _thread_lock = threading.Lock()
+
+    def __init__(self, pathway: str, chunk_size: int) -> None:
+        """Demos are stored by their SHA256 in sharded directories,
+        so identical demos are only stored once.
+
+        objects/ab/cd/<digest> is the demo, objects/ab/cd/<digest>.refs
+        has a empty file for every key using it & refs/<key> contains
+        the digest of the key. Shards can be mounted on different disks.
+
+        Parameters
+        ----------
+        pathway : str
+        chunk_size : int
+            Bytes read from disk at a time.
+        """
+
+        self._pathway = pathway
+        self._chunk_size = chunk_size
+
+        for directory in ("objects", "refs", "tmp"):
+            os.makedirs(path.join(pathway, directory), exist_ok=True)
+
+    def __shard(self, digest: str) -> str:
+        return path.join(self._pathway, "objects", digest[:2], digest[2:4])
+
+    def __object(self, digest: str) -> str:
+        return path.join(self.__shard(digest), digest)
+
+    def __ref(self, key: str) -> str:
+        return path.join(self._pathway, "refs", key)
+
+    @contextmanager
+    def __locked(self, digest: str) -> Iterator[None]:
+        """Locks the shard across workers while refs are changed.
+        """
+
+        if fcntl is None:
+            with self._thread_lock:
+                yield
+            return
+
+        shard = self.__shard(digest)
+        os.makedirs(shard, exist_ok=True)
+        with open(path.join(shard, ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def __read_ref(self, key: str) -> Optional[str]:
+        try:
+            with open(self.__ref(key)) as f_:
+                return f_.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def __release(self, digest: str, key: str) -> None:
+        with self.__locked(digest):
+            refs = self.__object(digest) + ".refs"
+            try:
+                os.remove(path.join(refs, key))
+                # Only succeeds once no key uses the demo.
+                os.rmdir(refs)
+            except OSError:
+                return
+
+            try:
+                os.remove(self.__object(digest))
+            except FileNotFoundError:
+                pass
+
+    def __link(self, key: str, digest: str, temp_pathway: str) -> None:
+        pathway = self.__object(digest)
+
+        with self.__locked(digest):
+            refs = pathway + ".refs"
+            os.makedirs(refs, exist_ok=True)
+            open(path.join(refs, key), "a").close()
+
+            if path.exists(pathway):
+                os.remove(temp_pathway)
+            else:
+                try:
+                    os.replace(temp_pathway, pathway)
+                except OSError as error:
+                    if error.errno != errno.EXDEV:
+                        raise
+
+                    # Shard is on another disk, copy then swap in.
+                    part = f"{pathway}.{uuid4().hex}.part"
+                    try:
+                        shutil.copyfile(temp_pathway, part)
+                        with open(part, "rb") as f_:
+                            os.fsync(f_.fileno())
+                        os.replace(part, pathway)
+                    except BaseException:
+                        if path.exists(part):
+                            os.remove(part)
+                        raise
+                    os.remove(temp_pathway)
+
+        previous = self.__read_ref(key)
+
+        ref_part = f"{self.__ref(key)}.{uuid4().hex}.part"
+        with open(ref_part, "w") as f_:
+            f_.write(digest)
+            f_.flush()
+            os.fsync(f_.fileno())
+        os.replace(ref_part, self.__ref(key))
+
+        if previous is not None and previous != digest:
+            self.__release(previous, key)
+
+    async def save(self, key: str, stream: AsyncIterator[bytes]) -> int:
+        temp_pathway = path.join(self._pathway, "tmp", uuid4().hex)
+        hash_ = sha256()
+        try:
+            size = await write_file(temp_pathway, stream, hash_)
+            await aiofiles.os.wrap(self.__link)(
+                key, hash_.hexdigest(), temp_pathway
+            )
+        except BaseException:
+            await _remove(temp_pathway)
+            raise
+
+        return size
+
+    async def stat(self, key: str) -> Optional[DemoStat]:
+        digest = await aiofiles.os.wrap(self.__read_ref)(key)
+        if digest is None:
+            return None
+
+        try:
+            stat = await aiofiles.os.stat(self.__object(digest))
+            ref_stat = await aiofiles.os.stat(self.__ref(key))
+        except FileNotFoundError:
+            return None
+
+        return DemoStat(
+            stat.st_size,
+            f'"{digest}"',
+            datetime.fromtimestamp(ref_stat.st_mtime, timezone.utc)
+        )
+
+    async def read(self, key: str, start: int, length: int
+                   ) -> AsyncIterator[bytes]:
+        digest = await aiofiles.os.wrap(self.__read_ref)(key)
+        if digest is None:
+            raise FileNotFoundError(key)
+
+        async for chunk in read_file(self.__object(digest), start,
+                                     length, self._chunk_size):
+            yield chunk
+
+    async def delete(self, key: str) -> bool:
+        digest = await aiofiles.os.wrap(self.__read_ref)(key)
+        if digest is None:
+            return False
+
+        await _remove(self.__ref(key))
+        await aiofiles.os.wrap(self.__release)(digest, key)
+
+        return True
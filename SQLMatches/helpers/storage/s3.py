@@ -0,0 +1,270 @@
+import asyncio
+import hmac
+
+from contextlib import asynccontextmanager
+from hashlib import sha256
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, List, Optional
+from aiohttp import ClientResponse
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+from yarl import URL
+
+from ...resources import Session
+
+from .base import DemoStorage, DemoStat
+
+
+def _quote(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode(), sha256).digest()
+
+
+_EMPTY_SHA256 = sha256(b"").hexdigest()
+
+
+async def _payload_hash(payload: bytes) -> str:
+    if not payload:
+        return _EMPTY_SHA256
+
+    # Parts are megabytes, hashing them would block the loop.
+    return await asyncio.get_running_loop().run_in_executor(
+        None, lambda: sha256(payload).hexdigest()
+    )
+
+
+class S3Storage(DemoStorage):
+    def __init__(self, endpoint: str, bucket: str, region: str,
+                 access_key: Optional[str], secret_key: Optional[str],
+                 part_size: int, chunk_size: int) -> None:
+        """Demos are stored in a S3 compatible bucket, requests are
+        path-style & signed with AWS Signature Version 4.
+
+        Parameters
+        ----------
+        endpoint : str
+        bucket : str
+        region : str
+        access_key : Optional[str]
+            If None requests aren't signed.
+        secret_key : Optional[str]
+        part_size : int
+            Demos larger then this are uploaded in parts of this size.
+        chunk_size : int
+            Bytes read from the response at a time.
+        """
+
+        self._endpoint = endpoint.rstrip("/")
+        self._host = urlsplit(self._endpoint).netloc
+        self._bucket = bucket
+        self._region = region
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._part_size = part_size
+        self._chunk_size = chunk_size
+
+    def __sign(self, method: str, uri: str, query: Dict[str, str],
+               headers: Dict[str, str], payload_hash: str
+               ) -> Dict[str, str]:
+        now = datetime.now(timezone.utc)
+        date = now.strftime("%Y%m%d")
+
+        headers = {
+            **headers,
+            "host": self._host,
+            "x-amz-date": now.strftime("%Y%m%dT%H%M%SZ"),
+            "x-amz-content-sha256": payload_hash
+        }
+
+        if self._access_key is None or self._secret_key is None:
+            return headers
+
+        signed = sorted(headers, key=str.lower)
+        canonical_request = "\n".join([
+            method,
+            uri,
+            "&".join(
+                f"{_quote(name)}={_quote(value)}"
+                for name, value in sorted(query.items())
+            ),
+            "".join(
+                f"{name.lower()}:{headers[name].strip()}\n"
+                for name in signed
+            ),
+            ";".join(name.lower() for name in signed),
+            headers["x-amz-content-sha256"]
+        ])
+
+        scope = f"{date}/{self._region}/s3/aws4_request"
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256",
+            headers["x-amz-date"],
+            scope,
+            sha256(canonical_request.encode()).hexdigest()
+        ])
+
+        key = ("AWS4" + self._secret_key).encode()
+        for part in (date, self._region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+
+        signature = hmac.new(
+            key, string_to_sign.encode(), sha256
+        ).hexdigest()
+
+        headers["Authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self._access_key}/{scope}, "
+            f"SignedHeaders={';'.join(name.lower() for name in signed)}, "
+            f"Signature={signature}"
+        )
+
+        return headers
+
+    @asynccontextmanager
+    async def __request(self, method: str, key: str,
+                        query: Optional[Dict[str, str]] = None,
+                        headers: Optional[Dict[str, str]] = None,
+                        payload: bytes = b""
+                        ) -> AsyncIterator[ClientResponse]:
+        query = query or {}
+        uri = f"/{_quote(self._bucket)}/{_quote(key)}"
+
+        url = self._endpoint + uri
+        if query:
+            url += "?" + "&".join(
+                f"{_quote(name)}={_quote(value)}" if value else _quote(name)
+                for name, value in sorted(query.items())
+            )
+
+        headers = self.__sign(
+            method, uri, query, headers or {}, await _payload_hash(payload)
+        )
+
+        async with Session.requests.request(
+                method,
+                URL(url, encoded=True),
+                headers=headers,
+                data=payload or None) as resp:
+            yield resp
+
+    async def __put_part(self, key: str, upload_id: str, number: int,
+                         data: bytes) -> str:
+        async with self.__request("PUT", key, {
+                    "partNumber": str(number), "uploadId": upload_id
+                }, payload=data) as resp:
+            resp.raise_for_status()
+            return resp.headers["ETag"]
+
+    async def __multipart(self, key: str, first: bytes,
+                          stream: AsyncIterator[bytes]) -> int:
+        async with self.__request("POST", key, {"uploads": ""}) as resp:
+            resp.raise_for_status()
+            upload_id = ElementTree.fromstring(
+                await resp.read()
+            ).findtext("{*}UploadId")
+
+        parts: List[asyncio.Future] = []
+        size = len(first)
+        try:
+            # Uploading a part overlaps with receiving the next.
+            parts.append(asyncio.ensure_future(
+                self.__put_part(key, upload_id, 1, first)
+            ))
+
+            buffer = bytearray()
+            async for data in stream:
+                buffer += data
+                if len(buffer) >= self._part_size:
+                    await parts[-1]
+                    size += len(buffer)
+                    parts.append(asyncio.ensure_future(self.__put_part(
+                        key, upload_id, len(parts) + 1, bytes(buffer)
+                    )))
+                    buffer = bytearray()
+
+            if buffer:
+                await parts[-1]
+                size += len(buffer)
+                parts.append(asyncio.ensure_future(self.__put_part(
+                    key, upload_id, len(parts) + 1, bytes(buffer)
+                )))
+
+            etags = await asyncio.gather(*parts)
+
+            complete = "".join(
+                f"<Part><PartNumber>{number}</PartNumber>"
+                f"<ETag>{etag}</ETag></Part>"
+                for number, etag in enumerate(etags, 1)
+            )
+            async with self.__request(
+                    "POST", key, {"uploadId": upload_id},
+                    payload=(
+                        "<CompleteMultipartUpload>"
+                        f"{complete}</CompleteMultipartUpload>"
+                    ).encode()) as resp:
+                resp.raise_for_status()
+                # Errors after the upload started are in the body.
+                if b"<Error>" in await resp.read():
+                    raise IOError("Completing multipart upload failed.")
+        except BaseException:
+            for part in parts:
+                part.cancel()
+
+            async with self.__request(
+                    "DELETE", key, {"uploadId": upload_id}):
+                pass
+            raise
+
+        return size
+
+    async def save(self, key: str, stream: AsyncIterator[bytes]) -> int:
+        buffer = bytearray()
+        async for data in stream:
+            buffer += data
+            if len(buffer) >= self._part_size:
+                return await self.__multipart(key, bytes(buffer), stream)
+
+        async with self.__request("PUT", key,
+                                  payload=bytes(buffer)) as resp:
+            resp.raise_for_status()
+
+        return len(buffer)
+
+    async def stat(self, key: str) -> Optional[DemoStat]:
+        async with self.__request("HEAD", key) as resp:
+            if resp.status == 404:
+                return None
+            resp.raise_for_status()
+
+            return DemoStat(
+                int(resp.headers["Content-Length"]),
+                resp.headers["ETag"],
+                parsedate_to_datetime(resp.headers["Last-Modified"])
+            )
+
+    async def read(self, key: str, start: int, length: int
+                   ) -> AsyncIterator[bytes]:
+        # A empty range can't be requested.
+        if length <= 0:
+            return
+
+        async with self.__request("GET", key, headers={
+                    "range": f"bytes={start}-{start + length - 1}"
+                }) as resp:
+            resp.raise_for_status()
+
+            async for chunk in resp.content.iter_chunked(self._chunk_size):
+                yield chunk
+
+    async def delete(self, key: str) -> bool:
+        # S3 doesn't say if the object existed.
+        if await self.stat(key) is None:
+            return False
+
+        async with self.__request("DELETE", key) as resp:
+            resp.raise_for_status()
+
+        return True
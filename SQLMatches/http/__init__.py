@@ -1,13 +1,58 @@
-from falcon import asgi
+from falcon import asgi, MEDIA_JSON
+from falcon.constants import WebSocketPayloadType
+
+from ..errors import SQLMatchesError
+from ..helpers.media import JSON_HANDLER, JSON_HANDLER_WS
+from ..helpers.metrics import METRICS
 
 # Request serializers
-from .serializers import json_serialize
+from .serializers import json_serialize, sqlmatches_error
 
 # Middlewares
-from .middlewares import SessionComponent
+from .middlewares import SessionComponent, MetricsComponent
+
+# Routes
+from .routes.demo import (
+    DemoResource, DemoUploadsResource, DemoUploadResource, DemoChunkResource
+)
+from .routes.match import (
+    MatchesResource, MatchResource, MatchRoundResource
+)
+from .routes.profile import ProfilesResource, ProfileResource
+from .routes.leaderboard import (
+    LeaderboardResource, LeaderboardPlayerResource
+)
+from .routes.metrics import MetricsResource
 
 
 APP = asgi.App()
 
+APP.req_options.media_handlers[MEDIA_JSON] = JSON_HANDLER
+APP.resp_options.media_handlers[MEDIA_JSON] = JSON_HANDLER
+APP.ws_options.media_handlers[WebSocketPayloadType.TEXT] = JSON_HANDLER_WS
+
 APP.add_middleware(SessionComponent())
+if METRICS.enabled:
+    APP.add_middleware(MetricsComponent())
 APP.set_error_serializer(json_serialize)
+APP.add_error_handler(SQLMatchesError, sqlmatches_error)
+
+APP.add_route("/matches", MatchesResource())
+APP.add_route("/match/{match_id}", MatchResource())
+APP.add_route("/match/{match_id}/demo", DemoResource())
+APP.add_route("/match/{match_id}/demo/upload", DemoUploadsResource())
+APP.add_route(
+    "/match/{match_id}/demo/upload/{upload_id}", DemoUploadResource()
+)
+APP.add_route(
+    "/match/{match_id}/demo/upload/{upload_id}/{index:int(min=0)}",
+    DemoChunkResource()
+)
+APP.add_route("/match/{match_id}/round", MatchRoundResource())
+APP.add_route("/profiles", ProfilesResource())
+APP.add_route("/profile/{steam_id}", ProfileResource())
+APP.add_route("/leaderboard/{metric}", LeaderboardResource())
+APP.add_route(
+    "/leaderboard/{metric}/{steam_id}", LeaderboardPlayerResource()
+)
+APP.add_route("/metrics", MetricsResource())
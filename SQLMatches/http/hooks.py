@@ -1,17 +1,17 @@
 from typing import Callable, List, Union
-from bcrypt import checkpw
 from falcon import Request, Response, HTTPUnauthorized
-from sqlalchemy import select
 
 from ..helpers.basic_auth import request_to_basic_auth
-from ..resources import Config, Session
-from ..tables import api_key_table
+from ..helpers.api_key import ApiKey
+from ..helpers.hashing import HASHING
+from ..resources import Config
 
 
-def root_required(req: Request, resp: Response, resource, params) -> None:
+async def root_required(req: Request, resp: Response,
+                        resource, params) -> None:
     _, password = request_to_basic_auth(req)
 
-    if not checkpw(password.encode(), Config.root_generate_hash):
+    if not await HASHING.checkpw(password, Config.root_generate_hash):
         raise HTTPUnauthorized()
 
 
@@ -36,19 +36,12 @@ def required_scopes(scopes: Union[List[str], str]) -> Callable:
     async def hook_(req: Request, resp: Response, resource, params) -> None:
         steam_id, api_key = request_to_basic_auth(req)
 
-        row = await Session.db.fetch_one(
-            select(
-                [api_key_table.c.scopes, api_key_table.c.api_key]
-            ).select_from(api_key_table).where(
-                api_key_table.c.steam_id == steam_id
-            )
-        )
+        user_scopes = await ApiKey(steam_id).validate(api_key)
 
-        if (not row or not row["scopes"] or
-                not checkpw(api_key.encode(), row["api_key"].encode())):
+        if not user_scopes:
             raise HTTPUnauthorized()
         else:
-            user_scopes = row["scopes"].strip(",")
+            user_scopes = user_scopes.strip(",")
             for scope in scopes:
                 if scope not in user_scopes:
                     raise HTTPUnauthorized()
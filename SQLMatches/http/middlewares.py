@@ -1,13 +1,54 @@
 from aiohttp import ClientSession
+from falcon import Request, Response, http_status_to_code
 
 from ..resources import Session
+from ..helpers.hashing import HASHING
+from ..helpers import compression
+from ..helpers.match.retention import DEMO_RETENTION
+from ..helpers.match.demo_log import DEMO_LOG
+from ..helpers.leaderboard import LEADERBOARDS
+from ..helpers.metrics import METRICS
 
 
 class SessionComponent:
     async def process_startup(self, scope, event) -> None:
         await Session.db.connect()
+        if Session.replica is not Session.db:
+            await Session.replica.connect()
         Session.requests = ClientSession()
+        DEMO_RETENTION.start()
+        LEADERBOARDS.start()
 
     async def process_shutdown(self, scope, event) -> None:
+        await DEMO_RETENTION.stop()
+        await LEADERBOARDS.stop()
+        await DEMO_LOG.close()
         await Session.db.disconnect()
+        if Session.replica is not Session.db:
+            await Session.replica.disconnect()
         await Session.requests.close()
+        HASHING.shutdown()
+        compression.shutdown()
+
+
+class MetricsComponent:
+    """Records the latency, queries & Steam API requests of each
+    request by route, only added if metrics are enabled.
+    """
+
+    async def process_request(self, req: Request, resp: Response) -> None:
+        req.context.metrics = METRICS.start_request()
+
+    async def process_response(self, req: Request, resp: Response,
+                               resource, req_succeeded: bool) -> None:
+        if "metrics" not in req.context:
+            return
+
+        request, token = req.context.metrics
+        METRICS.end_request(
+            request,
+            token,
+            req.method,
+            req.uri_template or "unrouted",
+            http_status_to_code(resp.status)
+        )
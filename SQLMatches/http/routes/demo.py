@@ -1,6 +1,8 @@
 from falcon import Request, Response, before
+from falcon.media.validators import jsonschema
 
 from ..hooks import required_scopes
+from ..schemas import DEMO_UPLOAD_SCHEMA
 from ...helpers.match import Match
 
 
@@ -8,16 +10,73 @@ class DemoResource:
     async def on_get(self, req: Request, resp: Response,
                      match_id: str) -> None:
         await Match(match_id).demo.download(
+            req,
             resp,
-            req.context.get_session("steam_id")
+            req.context.get("steam_id")
         )
 
-    @before(required_scopes("demo.upload"), is_async=True)
+    @before(required_scopes("demo.upload"))
     async def on_put(self, req: Request, resp: Response,
                      match_id: str) -> None:
-        await Match(match_id).demo.save(req)
+        await Match(match_id).demo.save(
+            req,
+            req.get_param_as_bool("raw", default=False)
+        )
 
-    @before(required_scopes("demo.delete"), is_async=True)
+    @before(required_scopes("demo.delete"))
     async def on_delete(self, req: Request, resp: Response,
                         match_id: str) -> None:
         await Match(match_id).demo.delete()
+
+
+class DemoUploadsResource:
+    @before(required_scopes("demo.upload"))
+    @jsonschema.validate(DEMO_UPLOAD_SCHEMA)
+    async def on_post(self, req: Request, resp: Response,
+                      match_id: str) -> None:
+        media = await req.get_media()
+
+        upload = Match(match_id).upload()
+        await upload.create(media["chunk_size"], media.get("raw", False))
+
+        resp.media = {
+            "data": {
+                "upload_id": upload.upload_id,
+                "chunk_size": media["chunk_size"]
+            },
+            "error": None
+        }
+
+
+class DemoUploadResource:
+    @before(required_scopes("demo.upload"))
+    async def on_get(self, req: Request, resp: Response,
+                     match_id: str, upload_id: str) -> None:
+        resp.media = {
+            "data": {
+                "chunks": await Match(match_id).upload(upload_id).chunks()
+            },
+            "error": None
+        }
+
+    @before(required_scopes("demo.upload"))
+    async def on_post(self, req: Request, resp: Response,
+                      match_id: str, upload_id: str) -> None:
+        await Match(match_id).upload(upload_id).finalize()
+
+    @before(required_scopes("demo.upload"))
+    async def on_delete(self, req: Request, resp: Response,
+                        match_id: str, upload_id: str) -> None:
+        await Match(match_id).upload(upload_id).abort()
+
+
+class DemoChunkResource:
+    @before(required_scopes("demo.upload"))
+    async def on_put(self, req: Request, resp: Response,
+                     match_id: str, upload_id: str, index: int) -> None:
+        await Match(match_id).upload(upload_id).put_chunk(
+            index,
+            req.get_param_as_int("offset", required=True),
+            req.get_param("sha256", required=True),
+            req.stream
+        )
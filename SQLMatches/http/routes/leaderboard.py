@@ -0,0 +1,69 @@
+from typing import List, Tuple
+from falcon import Request, Response
+
+from ...errors import LeaderboardNotFound, ProfileNotFound
+from ...helpers.leaderboard import LEADERBOARDS, Leaderboard
+from ...helpers.profile import profiles
+
+
+def _leaderboard(metric: str) -> Leaderboard:
+    try:
+        return LEADERBOARDS[metric]
+    except KeyError:
+        raise LeaderboardNotFound()
+
+
+async def _players(ranked: List[Tuple[int, str, float]]) -> List[dict]:
+    found = await profiles([steam_id for _, steam_id, _ in ranked])
+
+    return [
+        {
+            "rank": rank,
+            "value": value,
+            "profile": found[steam_id].api_schema
+        }
+        for rank, steam_id, value in ranked if steam_id in found
+    ]
+
+
+class LeaderboardResource:
+    async def on_get(self, req: Request, resp: Response,
+                     metric: str) -> None:
+        leaderboard = _leaderboard(metric)
+
+        resp.media = {
+            "data": {
+                "players": await _players(leaderboard.top(
+                    req.get_param_as_int(
+                        "limit", min_value=1, max_value=100, default=25
+                    ),
+                    req.get_param_as_int("offset", min_value=0, default=0)
+                )),
+                "total": len(leaderboard)
+            },
+            "error": None
+        }
+
+
+class LeaderboardPlayerResource:
+    async def on_get(self, req: Request, resp: Response,
+                     metric: str, steam_id: str) -> None:
+        leaderboard = _leaderboard(metric)
+
+        rank = leaderboard.rank(steam_id)
+        if rank is None:
+            raise ProfileNotFound()
+
+        resp.media = {
+            "data": {
+                "rank": rank,
+                "players": await _players(leaderboard.around(
+                    steam_id,
+                    req.get_param_as_int(
+                        "radius", min_value=0, max_value=50, default=5
+                    )
+                )),
+                "total": len(leaderboard)
+            },
+            "error": None
+        }
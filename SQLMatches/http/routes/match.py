@@ -0,0 +1,95 @@
+import asyncio
+
+from falcon import Request, Response, before, MEDIA_JSON
+from falcon.asgi import WebSocket
+from falcon.errors import PayloadTypeError, WebSocketDisconnected
+from falcon.media.validators import jsonschema
+
+from ..hooks import required_scopes
+from ..schemas import ROUND_RESULTS_SCHEMA
+from ...helpers.match import Match
+from ...helpers.match.live import LIVE_SCOREBOARDS
+from ...helpers.match.listing import Matches
+from ...helpers.media import envelope
+
+
+class MatchesResource:
+    async def on_get(self, req: Request, resp: Response) -> None:
+        matches, cursor = await Matches(
+            req.get_param_as_int("status"),
+            req.get_param("map"),
+            req.get_param("steam_id")
+        ).page(
+            req.get_param_as_int(
+                "limit", min_value=1, max_value=100, default=25
+            ),
+            req.get_param("cursor")
+        )
+
+        resp.media = {
+            "data": {
+                "matches": [match.api_schema for match in matches],
+                "cursor": cursor
+            },
+            "error": None
+        }
+
+
+class MatchResource:
+    async def on_get(self, req: Request, resp: Response,
+                     match_id: str) -> None:
+        # Cached already encoded.
+        resp.data = envelope(await Match(match_id).scoreboard_json())
+        resp.content_type = MEDIA_JSON
+
+    async def on_websocket(self, req: Request, ws: WebSocket,
+                           match_id: str) -> None:
+        queue = await LIVE_SCOREBOARDS.subscribe(match_id)
+
+        async def send() -> None:
+            while True:
+                await ws.send_media(await queue.get())
+
+        async def receive() -> None:
+            # Viewers don't send anything, waits till they disconnect.
+            while True:
+                try:
+                    await ws.receive_data()
+                except PayloadTypeError:
+                    pass
+
+        try:
+            await ws.accept()
+
+            tasks = [
+                asyncio.create_task(send()),
+                asyncio.create_task(receive())
+            ]
+            try:
+                done, _ = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            for task in done:
+                try:
+                    task.result()
+                except WebSocketDisconnected:
+                    pass
+        finally:
+            LIVE_SCOREBOARDS.unsubscribe(match_id, queue)
+
+
+class MatchRoundResource:
+    @before(required_scopes("match.update"))
+    @jsonschema.validate(req_schema=ROUND_RESULTS_SCHEMA)
+    async def on_post(self, req: Request, resp: Response,
+                      match_id: str) -> None:
+        await Match(match_id).round_results(
+            (await req.get_media())["players"]
+        )
+
+        resp.media = {"data": None, "error": None}
@@ -0,0 +1,197 @@
+from falcon import Request, Response, before
+
+from ..hooks import root_required
+from ...resources import Session
+from ...helpers.metrics import METRICS, Exposition
+from ...helpers.api_key import API_KEY_CACHE
+from ...helpers.steam import STEAM_PROFILE_CACHE
+from ...helpers.leaderboard import LEADERBOARDS
+from ...helpers.match.cache import SCOREBOARD_CACHE
+from ...helpers.match.demo import DEMO_CACHE
+from ...helpers.match.demo_log import DEMO_LOG
+from ...helpers.match.retention import DEMO_RETENTION
+
+
+def _requests(exposition: Exposition) -> None:
+    routes = METRICS.routes.items()
+
+    exposition.metric(
+        "http_request_duration_seconds", "histogram",
+        "Time to handle a request, till the body starts streaming."
+    )
+    for (method, route), metrics in routes:
+        exposition.histogram(
+            "http_request_duration_seconds", metrics.latency,
+            method=method, route=route
+        )
+
+    exposition.metric(
+        "http_requests_total", "counter", "Requests handled."
+    )
+    for (method, route), metrics in routes:
+        for status, count in metrics.statuses.items():
+            exposition.sample(
+                "http_requests_total", count,
+                method=method, route=route, status=status
+            )
+
+    for name, attribute, help_ in (
+            ("http_request_queries_total", "queries",
+             "Database queries made by requests."),
+            ("http_request_query_seconds_total", "query_seconds",
+             "Time spent on database queries by requests."),
+            ("http_request_steam_requests_total", "steam_requests",
+             "Steam lookups requests waited on."),
+            ("http_request_steam_seconds_total", "steam_seconds",
+             "Time requests waited on Steam lookups.")):
+        exposition.metric(name, "counter", help_)
+        for (method, route), metrics in routes:
+            exposition.sample(
+                name, getattr(metrics, attribute),
+                method=method, route=route
+            )
+
+    exposition.metric(
+        "steam_requests_total", "counter", "Steam API requests."
+    )
+    exposition.sample("steam_requests_total", METRICS.steam_requests)
+    exposition.metric(
+        "steam_request_seconds_total", "counter",
+        "Time spent on Steam API requests."
+    )
+    exposition.sample("steam_request_seconds_total", METRICS.steam_seconds)
+
+    exposition.metric(
+        "demo_bytes_total", "counter", "Demo bytes streamed."
+    )
+    for direction, size in METRICS.demo_bytes.items():
+        exposition.sample("demo_bytes_total", size, direction=direction)
+
+
+def _databases(exposition: Exposition) -> None:
+    databases = [("primary", Session.db)]
+    if Session.replica is not Session.db:
+        databases.append(("replica", Session.replica))
+
+    # Not every database is instrumented.
+    pools = [
+        (name, database.metrics) for name, database in databases
+        if hasattr(database, "metrics")
+    ]
+
+    for name, attribute, type_, help_ in (
+            ("db_connections_checked_out", "checked_out", "gauge",
+             "Connections in use."),
+            ("db_connections_max_checked_out", "max_checked_out", "gauge",
+             "Most connections in use at once."),
+            ("db_acquire_timeouts_total", "acquire_timeouts", "counter",
+             "Requests rejected waiting for a connection.")):
+        exposition.metric(name, type_, help_)
+        for database, metrics in pools:
+            exposition.sample(
+                name, getattr(metrics, attribute), database=database
+            )
+
+    exposition.metric(
+        "db_acquire_wait_seconds", "histogram",
+        "Time waited for a connection."
+    )
+    for database, metrics in pools:
+        exposition.histogram(
+            "db_acquire_wait_seconds", metrics.wait, database=database
+        )
+
+    exposition.metric(
+        "db_query_duration_seconds", "histogram", "Time queries took."
+    )
+    for database, metrics in pools:
+        for type_, histogram in metrics.queries.items():
+            exposition.histogram(
+                "db_query_duration_seconds", histogram,
+                database=database, type=type_
+            )
+
+
+def _caches(exposition: Exposition) -> None:
+    caches = {
+        "api_key": API_KEY_CACHE.stats,
+        "steam_profile": STEAM_PROFILE_CACHE.stats,
+        "demo": {
+            "hits": DEMO_CACHE.hits,
+            "misses": DEMO_CACHE.misses
+        },
+        "scoreboard": {
+            "hits": SCOREBOARD_CACHE.hits,
+            "misses": SCOREBOARD_CACHE.misses
+        }
+    }
+
+    for name, key, type_, help_ in (
+            ("cache_hits_total", "hits", "counter", "Cache hits."),
+            ("cache_stale_hits_total", "stale_hits", "counter",
+             "Cache hits of stale values."),
+            ("cache_misses_total", "misses", "counter", "Cache misses."),
+            ("cache_size", "size", "gauge", "Cached values.")):
+        exposition.metric(name, type_, help_)
+        for cache, stats in caches.items():
+            exposition.sample(name, stats.get(key), cache=cache)
+
+
+def _background(exposition: Exposition) -> None:
+    retention = DEMO_RETENTION.stats
+    for name, key, type_, help_ in (
+            ("demo_retention_runs_total", "runs", "counter",
+             "Demo retention collections."),
+            ("demo_retention_skipped_total", "skipped", "counter",
+             "Demo retention collections skipped as another worker "
+             "was collecting."),
+            ("demo_retention_errors_total", "errors", "counter",
+             "Demo retention errors."),
+            ("demo_retention_deleted_total", "demos_deleted", "counter",
+             "Demos deleted by retention."),
+            ("demo_retention_reclaimed_bytes_total", "bytes_reclaimed",
+             "counter", "Bytes reclaimed by retention."),
+            ("demo_retention_uploads_aborted_total", "uploads_aborted",
+             "counter", "Stale uploads aborted by retention."),
+            ("demo_retention_last_run_timestamp_seconds", "last_run",
+             "gauge", "When retention last ran.")):
+        exposition.metric(name, type_, help_)
+        exposition.sample(name, retention[key])
+
+    for name, value, type_, help_ in (
+            ("demo_log_pending", DEMO_LOG.pending, "gauge",
+             "Downloads waiting to be logged."),
+            ("demo_log_logged_total", DEMO_LOG.logged, "counter",
+             "Downloads logged."),
+            ("demo_log_dropped_total", DEMO_LOG.dropped, "counter",
+             "Downloads dropped after logging failed.")):
+        exposition.metric(name, type_, help_)
+        exposition.sample(name, value)
+
+    leaderboards = LEADERBOARDS.stats
+    for name, key, type_, help_ in (
+            ("leaderboard_players", "players", "gauge",
+             "Players ranked."),
+            ("leaderboard_rebuilds_total", "rebuilds", "counter",
+             "Leaderboard rebuilds."),
+            ("leaderboard_updates_total", "updates", "counter",
+             "Incremental leaderboard updates."),
+            ("leaderboard_last_rebuild_timestamp_seconds", "last_rebuild",
+             "gauge", "When leaderboards were last rebuilt.")):
+        exposition.metric(name, type_, help_)
+        exposition.sample(name, leaderboards[key])
+
+
+class MetricsResource:
+    @before(root_required)
+    async def on_get(self, req: Request, resp: Response) -> None:
+        exposition = Exposition()
+
+        if METRICS.enabled:
+            _requests(exposition)
+        _databases(exposition)
+        _caches(exposition)
+        _background(exposition)
+
+        resp.text = exposition.text
+        resp.content_type = "text/plain; version=0.0.4; charset=utf-8"
@@ -0,0 +1,32 @@
+from falcon import Request, Response, HTTPBadRequest
+
+from ...helpers.profile import Profile, profiles
+
+
+class ProfilesResource:
+    # Max amount of SteamIDs per request.
+    max_steam_ids = 100
+
+    async def on_get(self, req: Request, resp: Response) -> None:
+        steam_ids = req.get_param_as_list("steam_id", required=True)
+        if len(steam_ids) > self.max_steam_ids:
+            raise HTTPBadRequest(
+                description=f"Max of {self.max_steam_ids} steam_id"
+            )
+
+        resp.media = {
+            "data": {
+                steam_id: profile.api_schema
+                for steam_id, profile in (await profiles(steam_ids)).items()
+            },
+            "error": None
+        }
+
+
+class ProfileResource:
+    async def on_get(self, req: Request, resp: Response,
+                     steam_id: str) -> None:
+        resp.media = {
+            "data": (await Profile(steam_id).get()).api_schema,
+            "error": None
+        }
@@ -0,0 +1,39 @@
+from ..helpers.match import ROUND_STATS
+
+
+ROUND_RESULTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "players": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "steam_id": {"type": "string", "maxLength": 64},
+                    "team": {"type": "integer", "enum": [0, 1]},
+                    "alive": {"type": "boolean"},
+                    "ping": {"type": "integer", "minimum": 0},
+                    "score": {"type": "integer"},
+                    "disconnected": {"type": "boolean"},
+                    **{
+                        stat: {"type": "integer", "minimum": 0}
+                        for stat in ROUND_STATS
+                    }
+                },
+                "required": ["steam_id", "team"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["players"]
+}
+
+DEMO_UPLOAD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "chunk_size": {"type": "integer", "minimum": 1},
+        "raw": {"type": "boolean"}
+    },
+    "required": ["chunk_size"]
+}
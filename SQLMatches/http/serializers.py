@@ -1,5 +1,10 @@
 import falcon
+
+from typing import Optional
 from falcon import Request, Response
+from falcon.asgi import WebSocket
+
+from ..errors import SQLMatchesError
 
 
 def json_serialize(req: Request, resp: Response, exception) -> None:
@@ -7,3 +12,15 @@ def json_serialize(req: Request, resp: Response, exception) -> None:
     resp.content_type = falcon.MEDIA_JSON
 
     resp.append_header("Vary", "Accept")
+
+
+async def sqlmatches_error(req: Request, resp: Optional[Response],
+                           exception: SQLMatchesError, params,
+                           ws: Optional[WebSocket] = None) -> None:
+    if ws is not None:
+        # Same close codes falcon uses for HTTP errors.
+        await ws.close(3000 + exception.status_code)
+        return
+
+    resp.media = exception.response()
+    resp.status = exception.status_code
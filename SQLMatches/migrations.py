@@ -0,0 +1,179 @@
+from datetime import datetime
+from typing import Callable, List
+from sqlalchemy import Table, select, func, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateColumn
+
+from .tables import (
+    metadata, schema_version_table, scoreboard_total_table,
+    statistic_table, demo_upload_table
+)
+from .helpers.sql_on_conflict import derived_stats
+
+
+def _create_indexes(connection: Connection) -> List[str]:
+    """Create indexes declared in tables.py missing from the database.
+
+    Existing indexes starting with the same columns are reused, e.g.
+    the ones InnoDB creates for foreign keys.
+    """
+
+    inspector = inspect(connection)
+
+    created = []
+    for table in metadata.sorted_tables:
+        existing = [
+            index["column_names"]
+            for index in inspector.get_indexes(table.name)
+        ]
+
+        for index in table.indexes:
+            columns = [column.name for column in index.columns]
+            if any(existing_columns[:len(columns)] == columns
+                   for existing_columns in existing):
+                continue
+
+            # Secondary indexes are built without rebuilding the table.
+            index.create(connection)
+            created.append(index.name)
+
+    return created
+
+
+def _add_columns(table: Table, *columns: str
+                 ) -> Callable[[Connection], List[str]]:
+    """Migration adding columns declared in tables.py
+    missing from the database.
+    """
+
+    def migration(connection: Connection) -> List[str]:
+        existing = {
+            column["name"]
+            for column in inspect(connection).get_columns(table.name)
+        }
+
+        created = []
+        for name in columns:
+            if name in existing:
+                continue
+
+            connection.execute(text("ALTER TABLE {} ADD COLUMN {}".format(
+                table.name,
+                CreateColumn(table.c[name]).compile(
+                    dialect=connection.dialect
+                )
+            )))
+            created.append(f"{table.name}.{name}")
+
+        return created
+
+    return migration
+
+
+def _widen_columns(table: Table, *columns: str
+                   ) -> Callable[[Connection], List[str]]:
+    """Migration changing columns to the type declared in tables.py,
+    for types which only got larger.
+    """
+
+    def migration(connection: Connection) -> List[str]:
+        # SQLite doesn't enforce column types.
+        if connection.dialect.name == "sqlite":
+            return []
+
+        for name in columns:
+            type_ = table.c[name].type.compile(dialect=connection.dialect)
+
+            if connection.dialect.name == "postgresql":
+                statement = "ALTER TABLE {} ALTER COLUMN {} TYPE {}"
+            else:
+                statement = "ALTER TABLE {} MODIFY COLUMN {} {}"
+
+            connection.execute(text(statement.format(
+                table.name, name, type_
+            )))
+
+        return []
+
+    return migration
+
+
+def _migrations(*migrations: Callable[[Connection], List[str]]
+                ) -> Callable[[Connection], List[str]]:
+    """Run multiple migrations as one version.
+    """
+
+    def migration(connection: Connection) -> List[str]:
+        created = []
+        for migration_ in migrations:
+            created += migration_(connection)
+
+        return created
+
+    return migration
+
+
+def _derive_statistics(connection: Connection) -> List[str]:
+    """Store the ratios of existing statistics.
+    """
+
+    connection.execute(statistic_table.update().values(derived_stats(
+        statistic_table.c.kills,
+        statistic_table.c.deaths,
+        statistic_table.c.headshots,
+        statistic_table.c.shots_hit,
+        statistic_table.c.shots_fired
+    )))
+
+    return []
+
+
+# Index of migration + 1 is its version, only ever append to this.
+MIGRATIONS: List[Callable[[Connection], List[str]]] = [
+    _create_indexes,
+    _migrations(
+        _add_columns(scoreboard_total_table, "demo_raw_size"),
+        _widen_columns(scoreboard_total_table, "demo_size")
+    ),
+    _create_indexes,
+    _add_columns(
+        statistic_table, "kdr", "hs_percentage", "hit_percentage"
+    ),
+    _derive_statistics,
+    _add_columns(demo_upload_table, "demo_status"),
+    _add_columns(demo_upload_table, "updated")
+]
+
+
+def migrate(engine: Engine) -> List[str]:
+    """Run migrations newer then the database's schema version,
+    every migration is safe to run against a database it
+    has already been applied to.
+
+    Parameters
+    ----------
+    engine : Engine
+
+    Returns
+    -------
+    List[str]
+        Names of what was created.
+    """
+
+    created = []
+
+    with engine.begin() as connection:
+        version = connection.execute(
+            select([func.max(schema_version_table.c.version)])
+        ).scalar() or 0
+
+        for migration_version, migration in enumerate(
+                MIGRATIONS[version:], start=version + 1):
+            created += migration(connection)
+
+            connection.execute(schema_version_table.insert().values(
+                version=migration_version,
+                applied=datetime.now()
+            ))
+
+    return created
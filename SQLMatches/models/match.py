@@ -1,40 +1,84 @@
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
 
 
+def _ratio(numerator: int, denominator: int, scale: int) -> float:
+    return (
+        round((numerator / denominator) * scale, 2)
+        if numerator > 0 and denominator > 0 else 0.00
+    )
+
+
+def derived_stats(kills: int, deaths: int, headshots: int,
+                  shots_hit: int, shots_fired: int) -> Dict[str, float]:
+    """Ratios worked out from stats, stored alongside them.
+
+    Returns
+    -------
+    Dict[str, float]
+        kdr, hs_percentage & hit_percentage
+    """
+
+    return {
+        "kdr": _ratio(kills, deaths, 1),
+        "hs_percentage": _ratio(headshots, kills, 100),
+        "hit_percentage": _ratio(shots_hit, shots_fired, 100)
+    }
+
+
 class _DepthStatsModel:
+    __slots__ = (
+        "kills", "deaths", "headshots", "shots_hit", "shots_fired",
+        "__kdr", "__hs_percentage", "__hit_percentage"
+    )
+
     def __init__(self, kills: int, deaths: int,
                  headshots: int, shots_hit: int,
-                 shots_fired: int) -> None:
+                 shots_fired: int, kdr: Optional[float] = None,
+                 hs_percentage: Optional[float] = None,
+                 hit_percentage: Optional[float] = None) -> None:
         self.kills = kills
         self.deaths = deaths
         self.headshots = headshots
         self.shots_hit = shots_hit
         self.shots_fired = shots_fired
 
+        # Ratios stored with the stats, otherwise worked out once.
+        self.__kdr = kdr
+        self.__hs_percentage = hs_percentage
+        self.__hit_percentage = hit_percentage
+
     @property
     def kdr(self) -> float:
-        return (
-            round(self.kills / self.deaths, 2)
-            if self.kills > 0 and self.deaths > 0 else 0.00
-        )
+        if self.__kdr is None:
+            self.__kdr = _ratio(self.kills, self.deaths, 1)
+
+        return self.__kdr
 
     @property
     def hs_percentage(self) -> float:
-        return (
-            round((self.headshots / self.kills) * 100, 2)
-            if self.kills > 0 and self.headshots > 0 else 0.00
-        )
+        if self.__hs_percentage is None:
+            self.__hs_percentage = _ratio(self.headshots, self.kills, 100)
+
+        return self.__hs_percentage
 
     @property
     def hit_percentage(self) -> float:
-        return (
-            round((self.shots_hit / self.shots_fired) * 100, 2)
-            if self.shots_fired > 0 and self.shots_hit > 0 else 0.00
-        )
+        if self.__hit_percentage is None:
+            self.__hit_percentage = _ratio(
+                self.shots_hit, self.shots_fired, 100
+            )
+
+        return self.__hit_percentage
 
 
 class MatchModel:
+    __slots__ = (
+        "match_id", "created", "status", "demo_status", "map_",
+        "team_1_name", "team_2_name", "team_1_score", "team_2_score",
+        "team_1_side", "team_2_side"
+    )
+
     def __init__(self, match_id: str, created: datetime, status: int,
                  demo_status: int, map_: str, team_1_name: str,
                  team_2_name: str, team_1_score: int,
@@ -56,7 +100,7 @@ class MatchModel:
     def api_schema(self) -> dict:
         return {
             "match_id": self.match_id,
-            "created": self.created.timestamp(),
+            "created": self.created,
             "status": self.status,
             "demo_status": self.demo_status,
             "map": self.map_,
@@ -70,24 +114,24 @@ class MatchModel:
 
 
 class ProfileModel(_DepthStatsModel):
+    __slots__ = ("name", "steam_id", "assists", "pfp", "mvps", "created")
+
     def __init__(self, name: str, steam_id: str, kills: int, headshots: int,
                  assists: int, deaths: int, pfp: str,
                  shots_fired: int, shots_hit: int,
-                 mvps: int, created: datetime, **kwargs) -> None:
+                 mvps: int, created: datetime,
+                 kdr: Optional[float] = None,
+                 hs_percentage: Optional[float] = None,
+                 hit_percentage: Optional[float] = None) -> None:
         _DepthStatsModel.__init__(
-            self, kwargs["kills"], kwargs["deaths"],
-            kwargs["headshots"], shots_hit, shots_fired
+            self, kills, deaths, headshots, shots_hit, shots_fired,
+            kdr, hs_percentage, hit_percentage
         )
 
         self.name = name
         self.steam_id = steam_id
-        self.kills = kills
-        self.headshots = headshots
         self.assists = assists
-        self.deaths = deaths
         self.pfp = pfp
-        self.shots_fired = shots_fired
-        self.shots_hit = shots_hit
         self.mvps = mvps
         self.created = created
 
@@ -107,11 +151,16 @@ class ProfileModel(_DepthStatsModel):
             "shots_fired": self.shots_fired,
             "shots_hit": self.shots_hit,
             "mvps": self.mvps,
-            "created": self.created.timestamp()
+            "created": self.created
         }
 
 
-class _ScoreboardPlayerModel(_DepthStatsModel):
+class ScoreboardPlayerModel(_DepthStatsModel):
+    __slots__ = (
+        "name", "steam_id", "team", "alive", "ping", "assists",
+        "mvps", "score", "disconnected", "pfp"
+    )
+
     def __init__(self, name: str, steam_id: str, team: int,
                  alive: bool, ping: int, kills: int, headshots: int,
                  assists: int, deaths: int, shots_fired: int,
@@ -125,60 +174,78 @@ class _ScoreboardPlayerModel(_DepthStatsModel):
         self.team = team
         self.alive = alive
         self.ping = ping
-        self.kills = kills
-        self.headshots = headshots
         self.assists = assists
-        self.deaths = deaths
-        self.shots_fired = shots_fired
-        self.shots_hit = shots_hit
         self.mvps = mvps
         self.score = score
         self.disconnected = disconnected
         self.pfp = pfp
 
+    @property
+    def api_schema(self) -> dict:
+        return {
+            "steam_id": self.steam_id,
+            "name": self.name,
+            "pfp": self.pfp,
+            "team": self.team,
+            "alive": self.alive,
+            "ping": self.ping,
+            "kills": self.kills,
+            "headshots": self.headshots,
+            "assists": self.assists,
+            "deaths": self.deaths,
+            "shots_fired": self.shots_fired,
+            "shots_hit": self.shots_hit,
+            "mvps": self.mvps,
+            "score": self.score,
+            "disconnected": self.disconnected
+        }
+
 
 class ScoreboardModel(MatchModel):
-    def __init__(self, team_1: List[Dict[str, Any]],
-                 team_2: List[Dict[str, Any]], match: Dict[str, Any]) -> None:
+    __slots__ = ("__team_1", "__team_2")
+
+    def __init__(self, team_1: List[ScoreboardPlayerModel],
+                 team_2: List[ScoreboardPlayerModel],
+                 match: Dict[str, Any]) -> None:
         super().__init__(**match)
 
         self.__team_1 = team_1
         self.__team_2 = team_2
 
-    def team_1(self) -> Generator[_ScoreboardPlayerModel, None, None]:
+    def team_1(self) -> Iterator[ScoreboardPlayerModel]:
         """Lists players in team 1.
 
-        Yields
-        ------
-        _ScoreboardPlayerModel
+        Returns
+        -------
+        Iterator[ScoreboardPlayerModel]
             Holds player data.
         """
 
-        for player in self.__team_1:
-            yield _ScoreboardPlayerModel(**player)
+        return iter(self.__team_1)
 
-    def team_2(self) -> Generator[_ScoreboardPlayerModel, None, None]:
+    def team_2(self) -> Iterator[ScoreboardPlayerModel]:
         """Lists players in team 2.
 
-        Yields
-        ------
-        _ScoreboardPlayerModel
+        Returns
+        -------
+        Iterator[ScoreboardPlayerModel]
             Holds player data.
         """
 
-        for player in self.__team_2:
-            yield _ScoreboardPlayerModel(**player)
+        return iter(self.__team_2)
 
     @property
     def api_schema(self) -> dict:
         return {
             **super().api_schema,
-            "team_1": self.__team_1,
-            "team_2": self.__team_2
+            "team_1": [player.api_schema for player in self.__team_1],
+            "team_2": [player.api_schema for player in self.__team_2]
         }
 
 
 class ServerModel:
+    __slots__ = ("ip", "port", "name", "players", "max_players", "map_")
+
     def __init__(self, ip: str,
                  port: int, name: str, players: int,
                  max_players: int, map_: str) -> None:
@@ -4,6 +4,8 @@ from aiohttp import ClientSession
 
 class Session:
     db: Database
+    # Read replica, same as db if there isn't one.
+    replica: Database
     requests: ClientSession
 
 
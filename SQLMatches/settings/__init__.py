@@ -1,9 +1,25 @@
 from .demo import DemoSettings
 from .database import DatabaseSettings
 from .steam import SteamSettings
+from .cache import CacheSettings
+from .hashing import HashingSettings
+from .live import LiveSettings
+from .storage import StorageSettings
+from .retention import RetentionSettings
+from .leaderboard import LeaderboardSettings
+from .media import MediaSettings
+from .metrics import MetricsSettings
 
 __all__ = [
     "DemoSettings",
     "DatabaseSettings",
-    "SteamSettings"
+    "SteamSettings",
+    "CacheSettings",
+    "HashingSettings",
+    "LiveSettings",
+    "StorageSettings",
+    "RetentionSettings",
+    "LeaderboardSettings",
+    "MediaSettings",
+    "MetricsSettings"
 ]
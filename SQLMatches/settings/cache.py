@@ -0,0 +1,47 @@
+from typing import Optional
+
+
+class CacheSettings:
+    def __init__(self, api_key_ttl: float, api_key_size: int,
+                 steam_profile_ttl: float, steam_profile_stale: float,
+                 steam_profile_size: int, scoreboard_ttl: float,
+                 scoreboard_size: int, scoreboard_url: Optional[str],
+                 demo_ttl: float) -> None:
+        """Cache settings.
+
+        Parameters
+        ----------
+        api_key_ttl : float
+            Seconds a verified API key is cached for.
+        api_key_size : int
+            Max amount of verified API keys cached.
+        steam_profile_ttl : float
+            Seconds a Steam profile is fresh for.
+        steam_profile_stale : float
+            Seconds a expired Steam profile is still served
+            while being refreshed.
+        steam_profile_size : int
+            Max amount of Steam profiles cached.
+        scoreboard_ttl : float
+            Seconds a scoreboard is cached for.
+        scoreboard_size : int
+            Max amount of scoreboards cached in-process.
+        scoreboard_url : Optional[str]
+            If given scoreboards & the size & ETag of demos are cached
+            in this redis instance, shared between workers. API key
+            invalidations are also shared through it, without it other
+            workers accept a revoked API key till api_key_ttl.
+        demo_ttl : float
+            Seconds the size & ETag of a demo are cached for, only
+            cached if scoreboard_url is given.
+        """
+
+        self._api_key_ttl = api_key_ttl
+        self._api_key_size = api_key_size
+        self._steam_profile_ttl = steam_profile_ttl
+        self._steam_profile_stale = steam_profile_stale
+        self._steam_profile_size = steam_profile_size
+        self._scoreboard_ttl = scoreboard_ttl
+        self._scoreboard_size = scoreboard_size
+        self._scoreboard_url = scoreboard_url
+        self._demo_ttl = demo_ttl
@@ -1,3 +1,4 @@
+from typing import Optional
 from urllib.parse import quote_plus
 
 
@@ -9,7 +10,16 @@ class DatabaseSettings:
                 database: str,
                 server: str,
                 port: int,
-                engine: str
+                engine: str,
+                min_size: int = 1,
+                max_size: int = 10,
+                pool_recycle: int = 3600,
+                connect_timeout: float = 10,
+                command_timeout: float = 0,
+                statement_cache_size: int = 100,
+                acquire_timeout: float = 0,
+                replica_url: Optional[str] = None,
+                replica_window: float = 5
                 ) -> None:
         """Database settings.
         Parameters
@@ -20,6 +30,30 @@ class DatabaseSettings:
         server : str
         port : int
         engine : str
+        min_size : int, optional
+            Min amount of pooled connections, by default 1
+        max_size : int, optional
+            Max amount of pooled connections, by default 10
+        pool_recycle : int, optional
+            Seconds after a idle connection is replaced, by default 3600
+        connect_timeout : float, optional
+            by default 10
+        command_timeout : float, optional
+            Seconds a query can take, 0 for no limit, by default 0
+            Only supported by PostgreSQL.
+        statement_cache_size : int, optional
+            Prepared statements cached per connection, 0 disables it,
+            by default 100. Only supported by PostgreSQL.
+        acquire_timeout : float, optional
+            Seconds a request waits for a pooled connection before
+            being rejected, 0 for no limit, by default 0
+        replica_url : Optional[str], optional
+            URL of a read replica, read-only queries go to it
+            if given, by default None
+        replica_window : float, optional
+            Seconds reads of a updated match go to the primary for,
+            so the update is seen even if the replica is behind,
+            by default 5
         """
 
         self._url = "{}://{}:{}@{}:{}/{}?charset=utf8mb4".format(
@@ -30,3 +64,51 @@ class DatabaseSettings:
             port,
             database
         )
+
+        self._acquire_timeout = acquire_timeout
+        self._replica_url = replica_url
+        self._replica_window = replica_window
+
+        self.__pool = {
+            "min_size": min_size,
+            "max_size": max_size,
+            "pool_recycle": pool_recycle,
+            "connect_timeout": connect_timeout,
+            "command_timeout": command_timeout,
+            "statement_cache_size": statement_cache_size
+        }
+
+        self._options = self._pool_options(self._url)
+
+    def _pool_options(self, url: str) -> dict:
+        """Pool options in the format the driver of the URL takes.
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        dict
+        """
+
+        pool = self.__pool
+
+        if url.startswith("mysql"):
+            return {
+                "min_size": pool["min_size"],
+                "max_size": pool["max_size"],
+                "pool_recycle": pool["pool_recycle"],
+                "connect_timeout": pool["connect_timeout"]
+            }
+        elif url.startswith("postgres"):
+            return {
+                "min_size": pool["min_size"],
+                "max_size": pool["max_size"],
+                "max_inactive_connection_lifetime": pool["pool_recycle"],
+                "timeout": pool["connect_timeout"],
+                "command_timeout": pool["command_timeout"] or None,
+                "statement_cache_size": pool["statement_cache_size"]
+            }
+        else:
+            return {}
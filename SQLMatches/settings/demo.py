@@ -3,14 +3,40 @@ from os import path, mkdir
 
 
 class DemoSettings:
+    # Codec used for each extension when none is given.
+    extension_codecs = {
+        ".bz2": "bz2",
+        ".xz": "lzma",
+        ".gz": "gzip"
+    }
+
     def __init__(self, pathway: Optional[str],
-                 extension: str) -> None:
+                 extension: str, chunk_size: int, max_size: int,
+                 compression: Optional[str],
+                 compression_workers: int,
+                 upload_chunk_size: int, log_batch: int,
+                 log_interval: float) -> None:
         """Initialize the demo directory.
 
         Parameters
         ----------
         pathway : Optional[str]
         extension: str
+        chunk_size : int
+            Bytes read from / written to disk at a time.
+        max_size : int
+            Max size of a uploaded demo in bytes.
+        compression : Optional[str]
+            Codec raw demos are compressed with, "bz2", "lzma" or "gzip".
+            If not given it's worked out from the extension.
+        compression_workers : int
+            Amount of threads compressing demos.
+        upload_chunk_size : int
+            Max chunk size of resumable uploads in bytes.
+        log_batch : int
+            Amount of buffered downloads which triggers logging them.
+        log_interval : float
+            Max seconds a download is buffered before being logged.
         """
 
         if pathway:
@@ -28,3 +54,20 @@ class DemoSettings:
             pass
 
         self._extension = extension
+        self._chunk_size = chunk_size
+        self._max_size = max_size
+        self._compression_workers = compression_workers
+        self._upload_chunk_size = upload_chunk_size
+        self._log_batch = log_batch
+        self._log_interval = log_interval
+
+        if not compression:
+            compression = next((
+                codec for suffix, codec in self.extension_codecs.items()
+                if extension.endswith(suffix)
+            ), None)
+
+        assert compression in (None, "bz2", "lzma", "gzip"), \
+            "Invalid demo compression."
+
+        self._compression = compression
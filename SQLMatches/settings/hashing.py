@@ -0,0 +1,21 @@
+class HashingSettings:
+    def __init__(self, workers: int, max_queue: int,
+                 executor: str) -> None:
+        """Hashing settings.
+
+        Parameters
+        ----------
+        workers : int
+            Amount of workers hashing & verifying passwords / API keys.
+        max_queue : int
+            Max amount of pending hashes before requests are rejected.
+        executor : str
+            "thread" or "process".
+        """
+
+        assert executor in ("thread", "process"), \
+            "Invalid hashing executor."
+
+        self._workers = workers
+        self._max_queue = max_queue
+        self._executor = executor
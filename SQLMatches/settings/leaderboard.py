@@ -0,0 +1,15 @@
+class LeaderboardSettings:
+    def __init__(self, rebuild_interval: float) -> None:
+        """Leaderboard settings.
+
+        Parameters
+        ----------
+        rebuild_interval : float
+            Seconds between leaderboards being rebuilt from the
+            database, 0 only builds them on startup. Each worker
+            only updates its own leaderboards, stats written by other
+            workers are picked up by rebuilding, so with multiple
+            workers ranks can be up to this stale.
+        """
+
+        self._rebuild_interval = rebuild_interval
@@ -0,0 +1,19 @@
+class LiveSettings:
+    def __init__(self, queue_size: int, debounce: float,
+                 refresh_interval: float) -> None:
+        """Live scoreboard settings.
+
+        Parameters
+        ----------
+        queue_size : int
+            Max amount of updates queued per viewer before they're
+            sent a full scoreboard instead.
+        debounce : float
+            Seconds changes are collected for before pushing.
+        refresh_interval : float
+            Seconds between checks for changes made by other workers.
+        """
+
+        self._queue_size = queue_size
+        self._debounce = debounce
+        self._refresh_interval = refresh_interval
@@ -0,0 +1,15 @@
+from typing import Optional
+
+
+class MediaSettings:
+    def __init__(self, json_encoder: Optional[str]) -> None:
+        """Media settings.
+
+        Parameters
+        ----------
+        json_encoder : Optional[str]
+            Key of helpers.media.ENCODERS, if None orjson is used
+            when installed otherwise json.
+        """
+
+        self._json_encoder = json_encoder
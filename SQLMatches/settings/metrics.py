@@ -0,0 +1,12 @@
+class MetricsSettings:
+    def __init__(self, enabled: bool) -> None:
+        """Metrics settings.
+
+        Parameters
+        ----------
+        enabled : bool
+            If per route request metrics are recorded, pool, cache &
+            background task metrics are always exposed.
+        """
+
+        self._enabled = enabled
@@ -0,0 +1,30 @@
+class RetentionSettings:
+    def __init__(self, interval: float, max_age: float, max_size: int,
+                 keep_downloaded: int, batch_size: int,
+                 upload_max_age: float) -> None:
+        """Demo retention settings, limits of 0 are disabled.
+
+        Parameters
+        ----------
+        interval : float
+            Seconds between collections, 0 disables collecting.
+        max_age : float
+            Seconds after a match is created its demo is deleted.
+        max_size : int
+            Max total size of demos in bytes, the oldest demos are
+            deleted once exceeded.
+        keep_downloaded : int
+            Amount of the most downloaded demos never deleted.
+        batch_size : int
+            Amount of demos deleted at a time.
+        upload_max_age : float
+            Seconds after the last chunk a unfinished upload
+            is aborted.
+        """
+
+        self._interval = interval
+        self._max_age = max_age
+        self._max_size = max_size
+        self._keep_downloaded = keep_downloaded
+        self._batch_size = batch_size
+        self._upload_max_age = upload_max_age
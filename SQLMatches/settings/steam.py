@@ -1,4 +1,17 @@
 class SteamSettings:
-    def __init__(self, api_key: str, api_url: str) -> None:
+    def __init__(self, api_key: str, api_url: str,
+                 batch_window: float) -> None:
+        """Steam settings.
+
+        Parameters
+        ----------
+        api_key : str
+        api_url : str
+        batch_window : float
+            Seconds lookups are collected for before being sent
+            as one batched call.
+        """
+
         self._api_key = api_key
         self._api_url = api_url
+        self._batch_window = batch_window
@@ -0,0 +1,42 @@
+from typing import Optional
+
+
+class StorageSettings:
+    backends = ("local", "content", "s3")
+
+    def __init__(self, backend: str, s3_endpoint: Optional[str],
+                 s3_bucket: Optional[str], s3_region: str,
+                 s3_access_key: Optional[str], s3_secret_key: Optional[str],
+                 s3_part_size: int) -> None:
+        """Demo storage settings.
+
+        Parameters
+        ----------
+        backend : str
+            "local" stores demos by match ID in the demo directory,
+            "content" stores them by hash so identical demos are only
+            stored once & "s3" stores them in a S3 compatible bucket.
+        s3_endpoint : Optional[str]
+            e.g. https://s3.eu-west-1.amazonaws.com
+        s3_bucket : Optional[str]
+        s3_region : str
+        s3_access_key : Optional[str]
+        s3_secret_key : Optional[str]
+        s3_part_size : int
+            Size of each part of a multipart upload in bytes,
+            S3 requires at least 5 MiB.
+        """
+
+        assert backend in self.backends, "Invalid demo storage."
+
+        if backend == "s3":
+            assert s3_endpoint and s3_bucket, \
+                "S3 storage requires a endpoint & bucket."
+
+        self._backend = backend
+        self._s3_endpoint = s3_endpoint
+        self._s3_bucket = s3_bucket
+        self._s3_region = s3_region
+        self._s3_access_key = s3_access_key
+        self._s3_secret_key = s3_secret_key
+        self._s3_part_size = s3_part_size
@@ -1,3 +1,4 @@
+from typing import List
 from sqlalchemy import (
     Table,
     MetaData,
@@ -6,8 +7,11 @@ from sqlalchemy import (
     TIMESTAMP,
     ForeignKey,
     Integer,
+    BigInteger,
+    Float,
     Boolean,
     PrimaryKeyConstraint,
+    Index,
     create_engine
 )
 
@@ -107,6 +111,21 @@ statistic_table = Table(
         "created",
         TIMESTAMP
     ),
+    Column(
+        "kdr",
+        Float,
+        default=0
+    ),
+    Column(
+        "hs_percentage",
+        Float,
+        default=0
+    ),
+    Column(
+        "hit_percentage",
+        Float,
+        default=0
+    ),
     mysql_engine="InnoDB",
     mysql_charset="utf8mb4"
 )
@@ -132,6 +151,10 @@ api_key_table = Table(
         "scopes",
         String(length=556)
     ),
+    Index(
+        "ix_api_key_steam_id",
+        "steam_id"
+    ),
     mysql_engine="InnoDB",
     mysql_charset="utf8mb4"
 )
@@ -172,7 +195,11 @@ scoreboard_total_table = Table(
     ),
     Column(
         "demo_size",  # Size of demo in bytes
-        Integer
+        BigInteger
+    ),
+    Column(
+        "demo_raw_size",  # Size of demo before compression in bytes
+        BigInteger
     ),
     Column(
         "map",
@@ -218,6 +245,23 @@ scoreboard_total_table = Table(
         "connect_wait",
         Integer
     ),
+    Index(
+        "ix_scoreboard_total_created",
+        "created",
+        "match_id"
+    ),
+    Index(
+        "ix_scoreboard_total_status_created",
+        "status",
+        "created",
+        "match_id"
+    ),
+    Index(
+        "ix_scoreboard_total_map_created",
+        "map",
+        "created",
+        "match_id"
+    ),
     mysql_engine="InnoDB",
     mysql_charset="utf8mb4"
 )
@@ -243,6 +287,53 @@ demo_log_table = Table(
         "downloaded",
         TIMESTAMP
     ),
+    Index(
+        "ix_demo_log_match_id",
+        "match_id"
+    ),
+    mysql_engine="InnoDB",
+    mysql_charset="utf8mb4"
+)
+
+# Resumable demo uploads, chunks are stored on disk until finalized.
+demo_upload_table = Table(
+    "demo_upload",
+    metadata,
+    Column(
+        "upload_id",
+        String(length=36),
+        primary_key=True
+    ),
+    Column(
+        "match_id",
+        String(length=36),
+        ForeignKey("scoreboard_total.match_id", ondelete="CASCADE")
+    ),
+    Column(
+        "chunk_size",
+        Integer
+    ),
+    Column(
+        "raw",
+        Boolean,
+        default=False
+    ),
+    Column(
+        "demo_status",  # Demo status of the match before the upload
+        Integer
+    ),
+    Column(
+        "created",
+        TIMESTAMP
+    ),
+    Column(
+        "updated",  # When a chunk was last uploaded
+        TIMESTAMP
+    ),
+    Index(
+        "ix_demo_upload_match_id",
+        "match_id"
+    ),
     mysql_engine="InnoDB",
     mysql_charset="utf8mb4"
 )
@@ -275,6 +366,10 @@ spectator_table = Table(
         "match_id",
         sqlite_on_conflict="REPLACE"
     ),
+    Index(
+        "ix_spectator_match_id",
+        "match_id"
+    ),
     mysql_engine="InnoDB",
     mysql_charset="utf8mb4"
 )
@@ -361,31 +456,64 @@ scoreboard_table = Table(
         "match_id",
         sqlite_on_conflict="REPLACE"
     ),
+    Index(
+        "ix_scoreboard_match_id",
+        "match_id"
+    ),
+    mysql_engine="InnoDB",
+    mysql_charset="utf8mb4"
+)
+
+
+# Version of the schema, see migrations.py
+schema_version_table = Table(
+    "schema_version",
+    metadata,
+    Column(
+        "version",
+        Integer,
+        primary_key=True
+    ),
+    Column(
+        "applied",
+        TIMESTAMP
+    ),
     mysql_engine="InnoDB",
     mysql_charset="utf8mb4"
 )
 
 
-def create_tables(url: str) -> None:
-    """Create tables in the URL.
+def create_tables(url: str) -> List[str]:
+    """Create tables in the URL & migrate existing tables.
 
     Parameters
     ----------
     url : str
+
+    Returns
+    -------
+    List[str]
+        Indexes & columns created by migrations.
     """
 
+    from .migrations import migrate
+
     if "mysql" in url:
         old_engine = "mysql"
         engine = "pymysql"
     elif "sqlite" in url:
         old_engine = "sqlite"
-        engine = "sqlite3"
+        engine = "pysqlite"
     elif "postgresql" in url:
         old_engine = "postgresql"
         engine = "psycopg2"
     else:
         assert False, "Invalid database URL engine."
 
-    metadata.create_all(
-        create_engine(url.replace(old_engine, f"{old_engine}+{engine}", 1))
+    db_engine = create_engine(
+        url.replace(old_engine, f"{old_engine}+{engine}", 1)
     )
+
+    metadata.create_all(db_engine)
+
+    return migrate(db_engine)
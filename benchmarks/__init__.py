@@ -0,0 +1,31 @@
+"""Benchmarks of the API's hot paths, see benchmarks/__main__.py.
+
+Settings SQLMatches requires are given defaults on import, so
+benchmarks never connect to a real database or Steam.
+"""
+
+import os
+import socket
+import tempfile
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+STEAM_STUB_PORT = _free_port()
+
+for _name, _value in (("DB_USERNAME", "benchmark"),
+                      ("DB_PASSWORD", "benchmark"),
+                      ("DB_NAME", "benchmark"),
+                      ("STEAM_API_KEY", "benchmark"),
+                      ("FRONTEND_URL", "http://localhost"),
+                      ("DEMO_PATHWAY", tempfile.mkdtemp(prefix="demos")),
+                      ("DEMO_STORAGE", "local"),
+                      ("LEADERBOARD_REBUILD_INTERVAL", "0")):
+    os.environ.setdefault(_name, _value)
+
+# Always the stub, a real API key is never sent.
+os.environ["STEAM_API_URL"] = f"http://127.0.0.1:{STEAM_STUB_PORT}/"
@@ -0,0 +1,119 @@
+"""Run the benchmarks against SQLite & a local Steam stub.
+
+Run from the root of the repository:
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json --filter http.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from SQLMatches.helpers.hashing import HASHING
+from SQLMatches.helpers import compression
+
+from . import cases
+from .harness import Environment, measure
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(filters: List[str], scale: float) -> Dict[str, dict]:
+    results = {}
+
+    async with Environment():
+        await cases.setup()
+
+        for name, setup, iterations, bytes_per_op in cases.CASES:
+            if filters and not any(filter_ in name for filter_ in filters):
+                continue
+
+            iterations = max(int(iterations * scale), 1)
+            results[name] = await measure(
+                await setup(),
+                iterations,
+                warmup=max(iterations // 10, 1),
+                bytes_per_op=bytes_per_op
+            )
+
+            print(_format(name, results[name]), flush=True)
+
+    HASHING.shutdown()
+    compression.shutdown()
+
+    return results
+
+
+def _format(name: str, result: dict,
+            baseline: Optional[dict] = None) -> str:
+    line = "{:<28} p50 {:>9.3f}ms  p99 {:>9.3f}ms  {:>10.1f} ops/s".format(
+        name, result["p50_ms"], result["p99_ms"], result["ops_per_sec"]
+    )
+
+    if "mb_per_sec" in result:
+        line += "  {:>8.1f} MB/s".format(result["mb_per_sec"])
+
+    if baseline is not None:
+        line += "  ({:+.1f}% ops/s)".format(
+            (result["ops_per_sec"] / baseline["ops_per_sec"] - 1) * 100
+        )
+
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--output", help="Write the results to this JSON file"
+    )
+    parser.add_argument(
+        "--compare", help="Results JSON file to compare against"
+    )
+    parser.add_argument(
+        "--filter", action="append", default=[],
+        help="Only run benchmarks containing this, can be repeated"
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0,
+        help="Multiplier of every benchmark's iterations"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.filter, args.scale))
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+        print(f"\nCompared to {baseline.get('commit')}:")
+        for name, result in results.items():
+            if name in baseline["results"]:
+                print(_format(name, result, baseline["results"][name]))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                "commit": _commit(),
+                "created": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "scale": args.scale,
+                "results": results
+            }, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
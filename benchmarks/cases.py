@@ -0,0 +1,250 @@
+import base64
+import hashlib
+import os
+
+from datetime import datetime
+from typing import AsyncIterator, Callable, Awaitable, List, Optional, Tuple
+from falcon import asgi, testing
+
+from SQLMatches.resources import Session
+from SQLMatches.tables import api_key_table, statistic_table, scoreboard_table
+from SQLMatches.helpers.hashing import HASHING
+from SQLMatches.helpers.match import Match
+from SQLMatches.http import APP
+from SQLMatches.http.hooks import required_scopes
+
+from .harness import Operation
+
+
+API_KEY = "benchmark"
+ADMIN_STEAM_ID = "76561197960265728"
+
+DEMO_SIZE = 16 * 1024 * 1024
+DEMO_CHUNK = 64 * 1024
+
+
+def _steam_ids(prefix: int, count: int) -> List[str]:
+    return [str(76561198000000000 + prefix * 1000 + index)
+            for index in range(count)]
+
+
+def _authorization() -> str:
+    return "Basic " + base64.b64encode(
+        f"{ADMIN_STEAM_ID}:{API_KEY}".encode()
+    ).decode()
+
+
+async def _add_players(match: Match, steam_ids: List[str]) -> None:
+    now = datetime.now()
+
+    await Session.db.execute_many(statistic_table.insert(), [
+        {
+            "steam_id": steam_id,
+            "name": f"Player {steam_id}",
+            "pfp": None,
+            "kills": 100,
+            "headshots": 40,
+            "assists": 20,
+            "deaths": 80,
+            "shots_fired": 3000,
+            "shots_hit": 900,
+            "mvps": 10,
+            "kdr": 1.25,
+            "hs_percentage": 40.0,
+            "hit_percentage": 30.0,
+            "created": now
+        }
+        for steam_id in steam_ids
+    ])
+    await Session.db.execute_many(scoreboard_table.insert(), [
+        {
+            "match_id": match.match_id,
+            "steam_id": steam_id,
+            "team": index % 2,
+            "alive": True,
+            "ping": 30,
+            "kills": index,
+            "headshots": index // 2,
+            "assists": 1,
+            "deaths": 3,
+            "shots_fired": 100,
+            "shots_hit": 30,
+            "mvps": 0,
+            "score": index * 2,
+            "disconnected": False
+        }
+        for index, steam_id in enumerate(steam_ids)
+    ])
+
+
+async def setup() -> None:
+    """Data shared by benchmarks, the API key every authenticated
+    benchmark uses & the match requested over HTTP.
+    """
+
+    now = datetime.now()
+
+    await Session.db.execute(statistic_table.insert().values(
+        steam_id=ADMIN_STEAM_ID, name="Admin", created=now
+    ))
+    await Session.db.execute(api_key_table.insert().values(
+        api_key=(await HASHING.hashpw(API_KEY)).decode(),
+        steam_id=ADMIN_STEAM_ID,
+        timestamp=now,
+        scopes="match.update,demo.upload"
+    ))
+
+    match = Match("http")
+    await match.update(map_="de_dust2", scoreboard=False)
+    await _add_players(match, _steam_ids(900, 10))
+
+
+async def auth() -> Operation:
+    hook = required_scopes("match.update")
+    req = testing.create_asgi_req(
+        headers={"Authorization": _authorization()}
+    )
+
+    async def operation() -> None:
+        await hook(req, None, None, {})
+
+    return operation
+
+
+def scoreboard(players: int) -> Callable[[], Awaitable[Operation]]:
+    async def setup() -> Operation:
+        match = Match(f"scoreboard{players}")
+        await match.update(map_="de_dust2", scoreboard=False)
+        await _add_players(match, _steam_ids(players, players))
+
+        return match.scoreboard
+
+    return setup
+
+
+def add_as_player(players: int) -> Callable[[], Awaitable[Operation]]:
+    async def setup() -> Operation:
+        match = Match(f"add_as_player{players}")
+        await match.update(map_="de_dust2", scoreboard=False)
+
+        # Same players every time, so every run after the
+        # first upserts.
+        match_players = match.players(_steam_ids(500 + players, players))
+
+        async def operation() -> None:
+            await match_players.add_as_player(0)
+
+        return operation
+
+    return setup
+
+
+class _DemoRequest:
+    """Just what DemoFile.save reads of a request.
+    """
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self.content_length = len(data)
+        self.__data = data
+        self.__chunk_size = chunk_size
+
+    @property
+    def stream(self) -> AsyncIterator[bytes]:
+        return self.__stream()
+
+    async def __stream(self) -> AsyncIterator[bytes]:
+        for index in range(0, len(self.__data), self.__chunk_size):
+            yield self.__data[index:index + self.__chunk_size]
+
+
+async def demo_save() -> Operation:
+    match = Match("demo_save")
+    await match.update(map_="de_dust2", scoreboard=False)
+
+    req = _DemoRequest(os.urandom(DEMO_SIZE), DEMO_CHUNK)
+
+    async def operation() -> None:
+        await match.demo.save(req)
+
+    return operation
+
+
+async def demo_put_chunk() -> Operation:
+    match = Match("demo_put_chunk")
+    await match.update(map_="de_dust2", scoreboard=False)
+
+    upload = match.upload()
+    await upload.create(DEMO_SIZE)
+
+    data = os.urandom(DEMO_SIZE)
+    checksum = hashlib.sha256(data).hexdigest()
+
+    async def operation() -> None:
+        # Replaces the same chunk every time.
+        await upload.put_chunk(
+            0, 0, checksum, _DemoRequest(data, DEMO_CHUNK).stream
+        )
+
+    return operation
+
+
+async def demo_download() -> Operation:
+    match = Match("demo_download")
+    await match.update(map_="de_dust2", scoreboard=False)
+    await match.demo.save(_DemoRequest(os.urandom(DEMO_SIZE), DEMO_CHUNK))
+
+    async def operation() -> None:
+        resp = asgi.Response()
+        await match.demo.download(testing.create_asgi_req(), resp)
+
+        async for _ in resp.stream:
+            pass
+
+    return operation
+
+
+def http(method: str, path: str, authenticated: bool = False,
+         json: Optional[dict] = None
+         ) -> Callable[[], Awaitable[Operation]]:
+    async def setup() -> Operation:
+        # Lifespan events aren't sent, the environment is used.
+        conductor = testing.ASGIConductor(APP)
+        headers = {"Authorization": _authorization()} \
+            if authenticated else {}
+
+        async def operation() -> None:
+            result = await conductor.simulate_request(
+                method, path, headers=headers, json=json
+            )
+            if result.status_code >= 400:
+                raise RuntimeError(f"{method} {path}: {result.status}")
+
+        return operation
+
+    return setup
+
+
+# Name, setup returning the operation, iterations & bytes per operation.
+CASES: List[Tuple[str, Callable[[], Awaitable[Operation]], int,
+                  Optional[int]]] = [
+    ("auth.required_scopes", auth, 5000, None),
+    ("match.scoreboard.10", scoreboard(10), 500, None),
+    ("match.scoreboard.64", scoreboard(64), 200, None),
+    ("match.scoreboard.128", scoreboard(128), 100, None),
+    ("players.add_as_player.10", add_as_player(10), 200, None),
+    ("players.add_as_player.64", add_as_player(64), 100, None),
+    ("demo.save", demo_save, 10, DEMO_SIZE),
+    ("demo.put_chunk", demo_put_chunk, 10, DEMO_SIZE),
+    ("demo.download", demo_download, 20, DEMO_SIZE),
+    ("http.get_match", http("GET", "/match/http"), 2000, None),
+    ("http.get_matches", http("GET", "/matches"), 1000, None),
+    ("http.get_profile", http(
+        "GET", f"/profile/{_steam_ids(900, 1)[0]}"
+    ), 1000, None),
+    ("http.post_round", http("POST", "/match/http/round", True, {
+        "players": [
+            {"steam_id": steam_id, "team": 0, "kills": 1, "deaths": 1}
+            for steam_id in _steam_ids(900, 10)
+        ]
+    }), 500, None)
+]
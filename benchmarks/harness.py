@@ -0,0 +1,150 @@
+import os
+import tempfile
+
+from math import ceil
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from aiohttp import ClientSession, web
+from sqlalchemy import create_engine
+
+from SQLMatches.resources import Session
+from SQLMatches.tables import metadata
+from SQLMatches.helpers.database import InstrumentedDatabase
+
+from . import STEAM_STUB_PORT
+
+
+Operation = Callable[[], Awaitable[Any]]
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted latencies.
+
+    Parameters
+    ----------
+    latencies : List[float]
+    percent : float
+
+    Returns
+    -------
+    float
+    """
+
+    index = max(ceil(percent / 100 * len(latencies)) - 1, 0)
+    return latencies[min(index, len(latencies) - 1)]
+
+
+async def measure(operation: Operation, iterations: int,
+                  warmup: int = 0,
+                  bytes_per_op: Optional[int] = None) -> Dict[str, float]:
+    """Time a operation ran one at a time.
+
+    Parameters
+    ----------
+    operation : Operation
+    iterations : int
+    warmup : int, optional
+        Untimed runs first, by default 0
+    bytes_per_op : int, optional
+        If given throughput is included, by default None
+
+    Returns
+    -------
+    Dict[str, float]
+        iterations, p50_ms, p99_ms, mean_ms, ops_per_sec &
+        mb_per_sec if bytes_per_op is given.
+    """
+
+    for _ in range(warmup):
+        await operation()
+
+    latencies = []
+    start = perf_counter()
+    for _ in range(iterations):
+        op_start = perf_counter()
+        await operation()
+        latencies.append(perf_counter() - op_start)
+    total = perf_counter() - start
+
+    latencies.sort()
+
+    result = {
+        "iterations": iterations,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": sum(latencies) / iterations * 1000,
+        "ops_per_sec": iterations / total
+    }
+
+    if bytes_per_op is not None:
+        result["mb_per_sec"] = bytes_per_op * iterations / total / 1e6
+
+    return result
+
+
+class SteamStub:
+    def __init__(self) -> None:
+        """Local GetPlayerSummaries, every SteamID is known.
+        """
+
+        self.calls = 0
+        self.__runner: Optional[web.AppRunner] = None
+
+    async def __summaries(self, request: web.Request) -> web.Response:
+        self.calls += 1
+
+        return web.json_response({"response": {"players": [
+            {
+                "steamid": steam_id,
+                "personaname": f"Player {steam_id}",
+                "avatarfull": "https://steamcdn-a.akamaihd.net/"
+                              f"steamcommunity/public/images/{steam_id}.jpg"
+            }
+            for steam_id in request.query["steamids"].split(",")
+        ]}})
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get(
+            "/ISteamUser/GetPlayerSummaries/v2/", self.__summaries
+        )
+
+        self.__runner = web.AppRunner(app)
+        await self.__runner.setup()
+        await web.TCPSite(
+            self.__runner, "127.0.0.1", STEAM_STUB_PORT
+        ).start()
+
+    async def stop(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+
+class Environment:
+    def __init__(self) -> None:
+        """Fresh SQLite database & Steam stub the benchmarks use
+        in place of the real ones.
+        """
+
+        self.steam = SteamStub()
+        self.__directory = tempfile.TemporaryDirectory(prefix="benchmark")
+
+    async def __aenter__(self) -> "Environment":
+        path = os.path.join(self.__directory.name, "benchmark.db")
+        metadata.create_all(create_engine(f"sqlite:///{path}"))
+
+        Session.db = InstrumentedDatabase(f"sqlite:///{path}")
+        Session.replica = Session.db
+        await Session.db.connect()
+
+        Session.requests = ClientSession()
+        await self.steam.start()
+
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.steam.stop()
+        await Session.requests.close()
+        await Session.db.disconnect()
+        self.__directory.cleanup()
@@ -0,0 +1,107 @@
+"""Allocations & time of rendering a scoreboard from database rows.
+
+Run from the root of the repository:
+    python -m benchmarks.models
+"""
+
+import timeit
+import tracemalloc
+
+from datetime import datetime
+from typing import List, Tuple
+
+from SQLMatches.models.match import ScoreboardModel, ScoreboardPlayerModel
+
+
+PLAYERS = 20
+RENDERS = 1000
+
+MATCH = {
+    "match_id": "benchmark",
+    "created": datetime(2021, 1, 1),
+    "status": 1,
+    "demo_status": 0,
+    "map_": "de_dust2",
+    "team_1_name": "Team 1",
+    "team_2_name": "Team 2",
+    "team_1_score": 8,
+    "team_2_score": 7,
+    "team_1_side": 0,
+    "team_2_side": 1
+}
+
+ROWS = [
+    {
+        "steam_id": str(76561198000000000 + index),
+        "name": f"Player {index}",
+        "pfp": "ab/abcdef_full.jpg",
+        "team": index % 2,
+        "alive": True,
+        "ping": 30,
+        "kills": index * 3,
+        "headshots": index,
+        "assists": 2,
+        "deaths": index + 1,
+        "shots_fired": 200,
+        "shots_hit": 50 + index,
+        "mvps": 1,
+        "score": index * 5,
+        "disconnected": False
+    }
+    for index in range(PLAYERS)
+]
+
+
+def render() -> Tuple[ScoreboardModel, List[ScoreboardPlayerModel], dict]:
+    """Build the scoreboard like Match.scoreboard, read the ratios
+    of every player twice & build the API schema.
+
+    Everything created is returned, so it's counted as kept.
+    """
+
+    teams = ([], [])
+    for row in ROWS:
+        teams[row["team"]].append(ScoreboardPlayerModel(**row))
+
+    scoreboard = ScoreboardModel(teams[0], teams[1], MATCH)
+
+    players = []
+    for _ in range(2):
+        for team in (scoreboard.team_1(), scoreboard.team_2()):
+            for player in team:
+                players.append(player)
+                player.kdr, player.hs_percentage, player.hit_percentage
+
+    return scoreboard, players, scoreboard.api_schema
+
+
+def main() -> None:
+    render()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    rendered = [render() for _ in range(RENDERS)]
+    stats = tracemalloc.take_snapshot().compare_to(before, "filename")
+    del rendered
+
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timeit.repeat(render, number=RENDERS, repeat=5))
+
+    print(f"Scoreboard of {PLAYERS} players, per render:")
+    print("  blocks allocated: {:.1f}".format(
+        sum(stat.count_diff for stat in stats) / RENDERS
+    ))
+    print("  bytes allocated: {:.0f}".format(
+        sum(stat.size_diff for stat in stats) / RENDERS
+    ))
+    print(f"  peak bytes: {peak - start}")
+    print("  time: {:.1f} us".format(seconds / RENDERS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Checks of the shared backends against local stand-ins, see
+integration/__main__.py.
+
+Importing benchmarks gives the settings SQLMatches requires the same
+defaults, so nothing real is ever connected to.
+"""
+
+import benchmarks  # noqa: F401
@@ -0,0 +1,52 @@
+"""Run the checks of the shared backends against local stand-ins.
+
+Run from the root of the repository:
+    python -m integration
+    python -m integration --filter storage.
+"""
+
+import argparse
+import asyncio
+import sys
+import traceback
+
+from typing import List
+
+from . import api_key, cache, storage
+
+
+CHECKS = cache.CHECKS + storage.CHECKS + api_key.CHECKS
+
+
+async def run(filters: List[str]) -> int:
+    failures = 0
+
+    for name, check in CHECKS:
+        if filters and not any(filter_ in name for filter_ in filters):
+            continue
+
+        try:
+            await check()
+        except Exception:
+            failures += 1
+            print(f"FAIL {name}")
+            traceback.print_exc()
+        else:
+            print(f"ok   {name}")
+
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--filter", action="append", default=[],
+        help="Only run checks with names containing this."
+    )
+    args = parser.parse_args()
+
+    sys.exit(1 if asyncio.run(run(args.filter)) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import asyncio
+
+from datetime import datetime
+
+from SQLMatches.resources import Session
+from SQLMatches.tables import api_key_table, statistic_table
+from SQLMatches.helpers import api_key
+from SQLMatches.helpers.api_key import ApiKey, API_KEY_CACHE
+from SQLMatches.helpers.cache import RedisCacheBackend
+from SQLMatches.helpers.hashing import HASHING
+
+from benchmarks.harness import Environment
+
+from .stubs import RedisStub
+
+
+STEAM_ID = "76561197960265729"
+
+
+async def _create(scopes: str) -> None:
+    now = datetime.now()
+
+    await Session.db.execute(statistic_table.insert().values(
+        steam_id=STEAM_ID, name="Owner", created=now
+    ))
+    await Session.db.execute(api_key_table.insert().values(
+        api_key=(await HASHING.hashpw("key")).decode(),
+        steam_id=STEAM_ID,
+        timestamp=now,
+        scopes=scopes
+    ))
+
+
+async def revoked_by_other_worker() -> None:
+    redis = RedisStub()
+    api_key.API_KEY_GENERATIONS = RedisCacheBackend(
+        redis, prefix="sqlmatches:api_key:"
+    )
+    try:
+        async with Environment():
+            await _create("match.update")
+            assert await ApiKey(STEAM_ID).validate("key") == "match.update"
+            assert API_KEY_CACHE.get((STEAM_ID, api_key._digest("key")),
+                                     count=False) is not None
+
+            # Other worker only shares redis & the database.
+            await Session.db.execute(api_key_table.delete())
+            await RedisCacheBackend(
+                redis, prefix="sqlmatches:api_key:"
+            ).set(STEAM_ID, "other", 60)
+
+            assert await ApiKey(STEAM_ID).validate("key") is None
+    finally:
+        api_key.API_KEY_GENERATIONS = None
+        API_KEY_CACHE.pop_where(lambda key: True)
+
+
+async def revoked_while_validating() -> None:
+    try:
+        async with Environment():
+            await _create("match.update")
+
+            # Revoked after the key was read, before it was verified.
+            validating = asyncio.create_task(
+                ApiKey(STEAM_ID).validate("key")
+            )
+            await asyncio.sleep(0.001)
+            await ApiKey(STEAM_ID).revoke()
+            await validating
+
+            assert API_KEY_CACHE.get((STEAM_ID, api_key._digest("key")),
+                                     count=False) is None
+            assert await ApiKey(STEAM_ID).validate("key") is None
+    finally:
+        API_KEY_CACHE.pop_where(lambda key: True)
+
+
+CHECKS = [
+    ("api_key.revoked_by_other_worker", revoked_by_other_worker),
+    ("api_key.revoked_while_validating", revoked_while_validating)
+]
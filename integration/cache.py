@@ -0,0 +1,140 @@
+import asyncio
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Tuple
+
+from SQLMatches.helpers.cache import CacheBackend, RedisCacheBackend
+from SQLMatches.helpers.match.cache import ScoreboardCache
+from SQLMatches.helpers.match.demo import DemoStatCache
+from SQLMatches.helpers.storage import DemoStat
+
+from .stubs import RedisStub
+
+
+def _loader(value: bytes, delay: float = 0
+            ) -> Tuple[Callable[[], Awaitable[bytes]], list]:
+    calls = []
+
+    async def loader() -> bytes:
+        calls.append(None)
+        await asyncio.sleep(delay)
+        return value
+
+    return loader, calls
+
+
+def _workers(ttl: float = 60) -> Tuple[ScoreboardCache, ScoreboardCache]:
+    redis = RedisStub()
+    return (
+        ScoreboardCache(RedisCacheBackend(redis, raw=True), ttl),
+        ScoreboardCache(RedisCacheBackend(redis, raw=True), ttl)
+    )
+
+
+async def shared() -> None:
+    worker_a, worker_b = _workers()
+    loader, calls = _loader(b"{}")
+
+    assert await worker_a.get("match", loader) == b"{}"
+    assert await worker_b.get("match", loader) == b"{}"
+    assert len(calls) == 1 and worker_b.hits == 1
+
+
+async def invalidate() -> None:
+    worker_a, worker_b = _workers()
+    loader, calls = _loader(b"{}")
+
+    await worker_a.get("match", loader)
+    await worker_b.invalidate("match")
+    await worker_a.get("match", loader)
+    assert len(calls) == 2
+
+
+async def coalesce() -> None:
+    worker_a, _ = _workers()
+    loader, calls = _loader(b"{}", 0.01)
+
+    assert await asyncio.gather(*[
+        worker_a.get("match", loader) for _ in range(10)
+    ]) == [b"{}"] * 10
+    assert len(calls) == 1
+
+
+async def invalidate_while_loading() -> None:
+    worker_a, _ = _workers()
+    loader, calls = _loader(b"{}", 0.01)
+
+    task = asyncio.create_task(worker_a.get("match", loader))
+    await asyncio.sleep(0)
+    await worker_a.invalidate("match")
+    await task
+
+    # The load may be older then the write, so it wasn't cached.
+    await worker_a.get("match", loader)
+    assert len(calls) == 2
+
+
+async def expire() -> None:
+    worker_a, _ = _workers(0.01)
+    loader, calls = _loader(b"{}")
+
+    await worker_a.get("match", loader)
+    await asyncio.sleep(0.02)
+    await worker_a.get("match", loader)
+    assert len(calls) == 2
+
+
+async def demo_stat() -> None:
+    redis = RedisStub()
+    worker_a = DemoStatCache(RedisCacheBackend(redis), 60)
+    worker_b = DemoStatCache(RedisCacheBackend(redis), 60)
+
+    stats = [
+        DemoStat(size, f"\"{size}\"", datetime.now(timezone.utc))
+        for size in (100, 200)
+    ]
+
+    async def loader() -> DemoStat:
+        return stats.pop(0)
+
+    assert (await worker_a.get("match", loader)).size == 100
+    cached = await worker_b.get("match", loader)
+    assert cached.size == 100 and cached.etag == "\"100\""
+
+    # Demo replaced by worker B.
+    await worker_b.invalidate("match")
+    assert (await worker_a.get("match", loader)).size == 200
+
+
+async def encoded() -> None:
+    backend = RedisCacheBackend(RedisStub())
+
+    await backend.set("key", {"players": [1, 2]}, 60)
+    assert await backend.get("key") == {"players": [1, 2]}
+    await backend.delete("key")
+    assert await backend.get("key") is None
+
+
+async def incomplete_backend() -> None:
+    class Backend(CacheBackend):
+        async def get(self, key: str) -> Any:
+            return None
+
+    try:
+        Backend()
+    except TypeError:
+        return
+
+    raise AssertionError("Backend missing methods was constructed")
+
+
+CHECKS = [
+    ("cache.shared", shared),
+    ("cache.invalidate", invalidate),
+    ("cache.coalesce", coalesce),
+    ("cache.invalidate_while_loading", invalidate_while_loading),
+    ("cache.expire", expire),
+    ("cache.demo_stat", demo_stat),
+    ("cache.encoded", encoded),
+    ("cache.incomplete_backend", incomplete_backend)
+]
@@ -0,0 +1,152 @@
+import os
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+from aiohttp import ClientSession
+
+from SQLMatches.resources import Session
+from SQLMatches.helpers.storage import DemoStorage, DemoStat, S3Storage
+
+from .stubs import S3Stub
+
+
+DEMO = os.urandom(64 * 1024)
+PART_SIZE = 16 * 1024
+
+
+@asynccontextmanager
+async def _s3() -> AsyncIterator[S3Stub]:
+    stub = S3Stub()
+    await stub.start()
+
+    Session.requests = ClientSession()
+    try:
+        yield stub
+    finally:
+        await Session.requests.close()
+        await stub.stop()
+
+
+def _storage(stub: S3Stub, access_key: Optional[str] = "access"
+             ) -> S3Storage:
+    return S3Storage(
+        stub.endpoint, "demos", "us-east-1", access_key,
+        "secret" if access_key else None, PART_SIZE, 4096
+    )
+
+
+async def _stream(data: bytes, chunk_size: int = 4096,
+                  fail: bool = False) -> AsyncIterator[bytes]:
+    for index in range(0, len(data), chunk_size):
+        yield data[index:index + chunk_size]
+
+    if fail:
+        raise IOError("Client disconnected.")
+
+
+async def _read(storage: S3Storage, key: str, start: int,
+                length: int) -> bytes:
+    chunks: List[bytes] = []
+    async for chunk in storage.read(key, start, length):
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+async def save() -> None:
+    async with _s3() as stub:
+        storage = _storage(stub)
+
+        assert await storage.save("small.dem", _stream(DEMO[:100])) == 100
+        assert stub.objects[("demos", "small.dem")][0] == DEMO[:100]
+
+        stat = await storage.stat("small.dem")
+        assert stat.size == 100 and stat.etag.startswith("\"")
+
+
+async def multipart() -> None:
+    async with _s3() as stub:
+        storage = _storage(stub)
+
+        assert await storage.save("large.dem", _stream(DEMO)) == len(DEMO)
+        body, etag, _ = stub.objects[("demos", "large.dem")]
+        assert body == DEMO and etag.endswith("-4\"")
+        assert not stub.uploads
+
+
+async def multipart_aborted() -> None:
+    async with _s3() as stub:
+        storage = _storage(stub)
+
+        try:
+            await storage.save("large.dem", _stream(DEMO, fail=True))
+        except IOError:
+            pass
+        else:
+            raise AssertionError("Failed stream was saved")
+
+        assert not stub.objects and not stub.uploads
+
+
+async def read() -> None:
+    async with _s3() as stub:
+        storage = _storage(stub)
+        await storage.save("demo.dem", _stream(DEMO))
+
+        assert await _read(storage, "demo.dem", 0, len(DEMO)) == DEMO
+        assert await _read(storage, "demo.dem", 1000, 5000) == \
+            DEMO[1000:6000]
+        # S3 ignores invalid ranges & sends everything.
+        assert await _read(storage, "demo.dem", 0, 0) == b""
+
+
+async def delete() -> None:
+    async with _s3() as stub:
+        storage = _storage(stub)
+        await storage.save("demo.dem", _stream(DEMO[:100]))
+
+        assert await storage.delete("demo.dem")
+        assert await storage.stat("demo.dem") is None
+        assert not await storage.delete("demo.dem")
+
+
+async def signed() -> None:
+    async with _s3() as stub:
+        await _storage(stub).save("demo.dem", _stream(DEMO))
+        assert all(
+            request.headers["Authorization"].startswith(
+                "AWS4-HMAC-SHA256 Credential=access/"
+            )
+            for request in stub.requests
+        )
+
+        stub.requests.clear()
+        await _storage(stub, None).save("demo.dem", _stream(DEMO[:100]))
+        assert all(
+            "Authorization" not in request.headers
+            for request in stub.requests
+        )
+
+
+async def incomplete_storage() -> None:
+    class Storage(DemoStorage):
+        async def stat(self, key: str) -> Optional[DemoStat]:
+            return None
+
+    try:
+        Storage()
+    except TypeError:
+        return
+
+    raise AssertionError("Storage missing methods was constructed")
+
+
+CHECKS = [
+    ("storage.s3.save", save),
+    ("storage.s3.multipart", multipart),
+    ("storage.s3.multipart_aborted", multipart_aborted),
+    ("storage.s3.read", read),
+    ("storage.s3.delete", delete),
+    ("storage.s3.signed", signed),
+    ("storage.incomplete_storage", incomplete_storage)
+]
@@ -0,0 +1,209 @@
+import re
+
+from email.utils import formatdate
+from hashlib import md5, sha256
+from itertools import count
+from time import monotonic, time
+from typing import Dict, List, Optional, Tuple, Union
+from aiohttp import web
+
+
+class RedisStub:
+    def __init__(self) -> None:
+        """In-memory stand-in of the redis.asyncio.Redis commands
+        RedisCacheBackend uses, share one between backends to act
+        as workers sharing a redis server.
+        """
+
+        self.__values: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value, expires = self.__values.get(key, (None, None))
+        if expires is not None and monotonic() >= expires:
+            del self.__values[key]
+            return None
+
+        return value
+
+    async def set(self, key: str, value: Union[bytes, str],
+                  px: Optional[int] = None) -> bool:
+        # Redis stores strings as bytes.
+        if isinstance(value, str):
+            value = value.encode()
+
+        self.__values[key] = (
+            value, monotonic() + px / 1000 if px else None
+        )
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(
+            self.__values.pop(key, None) is not None for key in keys
+        )
+
+
+class S3Stub:
+    def __init__(self) -> None:
+        """Local S3 compatible server, path-style objects, ranged
+        reads & multipart uploads. Payload hashes are checked & like
+        S3 a Range header which can't be parsed is ignored.
+        """
+
+        # Keyed by bucket & key.
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, str, float]] = {}
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self.requests: List[web.Request] = []
+
+        self.__upload_ids = count(1)
+        self.__runner: Optional[web.AppRunner] = None
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.__runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    def __object(self, request: web.Request) -> Tuple[str, str]:
+        return request.match_info["bucket"], request.match_info["key"]
+
+    @staticmethod
+    def __error(status: int, code: str) -> web.Response:
+        return web.Response(
+            status=status,
+            body=f"<Error><Code>{code}</Code></Error>".encode(),
+            content_type="application/xml"
+        )
+
+    @web.middleware
+    async def __payload(self, request: web.Request,
+                        handler) -> web.StreamResponse:
+        self.requests.append(request)
+
+        body = await request.read()
+        if request.headers.get("x-amz-content-sha256") != \
+                sha256(body).hexdigest():
+            return self.__error(400, "XAmzContentSHA256Mismatch")
+
+        return await handler(request)
+
+    async def __put(self, request: web.Request) -> web.Response:
+        body = await request.read()
+
+        upload_id = request.query.get("uploadId")
+        if upload_id is not None:
+            if upload_id not in self.uploads:
+                return self.__error(404, "NoSuchUpload")
+
+            self.uploads[upload_id][int(request.query["partNumber"])] = body
+            return web.Response(headers={
+                "ETag": f"\"{md5(body).hexdigest()}\""
+            })
+
+        etag = f"\"{md5(body).hexdigest()}\""
+        self.objects[self.__object(request)] = (body, etag, time())
+        return web.Response(headers={"ETag": etag})
+
+    async def __post(self, request: web.Request) -> web.Response:
+        if "uploads" in request.query:
+            upload_id = str(next(self.__upload_ids))
+            self.uploads[upload_id] = {}
+            return web.Response(
+                body=(
+                    "<InitiateMultipartUploadResult>"
+                    f"<UploadId>{upload_id}</UploadId>"
+                    "</InitiateMultipartUploadResult>"
+                ).encode(),
+                content_type="application/xml"
+            )
+
+        parts = self.uploads.pop(request.query["uploadId"], None)
+        if parts is None:
+            return self.__error(404, "NoSuchUpload")
+
+        numbers = [
+            int(number) for number in re.findall(
+                r"<PartNumber>(\d+)</PartNumber>",
+                (await request.read()).decode()
+            )
+        ]
+        if numbers != sorted(parts):
+            return self.__error(400, "InvalidPart")
+
+        body = b"".join(parts[number] for number in numbers)
+        self.objects[self.__object(request)] = (
+            body, f"\"{md5(body).hexdigest()}-{len(numbers)}\"", time()
+        )
+        return web.Response(
+            body=b"<CompleteMultipartUploadResult/>",
+            content_type="application/xml"
+        )
+
+    async def __get(self, request: web.Request) -> web.Response:
+        stored = self.objects.get(self.__object(request))
+        if stored is None:
+            return self.__error(404, "NoSuchKey")
+
+        body, etag, modified = stored
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(modified, usegmt=True)
+        }
+
+        match = re.fullmatch(
+            r"bytes=(\d+)-(\d+)", request.headers.get("Range", "")
+        )
+        if match is None:
+            return web.Response(body=body, headers=headers)
+
+        start, end = int(match[1]), int(match[2])
+        if start >= len(body):
+            return self.__error(416, "InvalidRange")
+
+        return web.Response(
+            status=206,
+            body=body[start:end + 1],
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-"
+                                 f"{min(end, len(body) - 1)}/{len(body)}"
+            }
+        )
+
+    async def __head(self, request: web.Request) -> web.Response:
+        stored = self.objects.get(self.__object(request))
+        if stored is None:
+            return web.Response(status=404)
+
+        body, etag, modified = stored
+        return web.Response(headers={
+            "Content-Length": str(len(body)),
+            "ETag": etag,
+            "Last-Modified": formatdate(modified, usegmt=True)
+        })
+
+    async def __delete(self, request: web.Request) -> web.Response:
+        upload_id = request.query.get("uploadId")
+        if upload_id is not None:
+            self.uploads.pop(upload_id, None)
+        else:
+            self.objects.pop(self.__object(request), None)
+
+        return web.Response(status=204)
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self.__payload])
+
+        path = "/{bucket}/{key:.+}"
+        app.router.add_put(path, self.__put)
+        app.router.add_post(path, self.__post)
+        app.router.add_get(path, self.__get, allow_head=False)
+        app.router.add_head(path, self.__head)
+        app.router.add_delete(path, self.__delete)
+
+        self.__runner = web.AppRunner(app)
+        await self.__runner.setup()
+        await web.TCPSite(self.__runner, "127.0.0.1", 0).start()
+
+    async def stop(self) -> None:
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None